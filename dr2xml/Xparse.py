@@ -12,10 +12,18 @@ Main useful functions :
 
 from __future__ import print_function, division, absolute_import, unicode_literals
 
+import os
+import sys
 from collections import OrderedDict
 
+import xml_writer
+
 # Interface to xml tools
-from .xml_interface import get_root_of_xml_file, is_xml_element_to_parse, find_rank_xml_subelement
+from .xml_interface import get_root_of_xml_file, is_xml_element_to_parse, find_rank_xml_subelement, \
+    get_xml_files_read
+
+# Utilities
+from .utils import get_cache_directory, hash_content, read_pickle_content, write_pickle_content
 
 # Logger
 from logger import get_logger
@@ -150,40 +158,98 @@ def make_index(elt, index=None, level=0):
     return index
 
 
-def attrib_by_ref(elt, attrib, index, level):
+def get_references(elt, index):
+    """
+    Get the references of ELT, i.e. the value of its attributes whose name contains '_ref', together with the
+    corresponding element of INDEX (None if the reference is not in the index).
+    """
+    return [(elt.attrib[att], index.get(elt.attrib[att])) for att in elt.attrib if "_ref" in att]
+
+
+def attrib_by_ref(elt, attrib, index, level=0, resolved=None):
     """
         Provide ATTRIB value for ELT' id using its references
         and objects's dict INDEX
+
+        The references' graph is explored depth-first with an explicit stack. The value found (or the error met) for
+        each element is stored in RESOLVED, so that, when it is shared between several calls, each reference is
+        followed only once. An invalid reference, or a cycle in the references, raises an XparseError which gives the
+        chain of references followed, except if one of those references begins with 'dummy_'.
     """
     logger = get_logger()
-    for a in [att for att in elt.attrib if "_ref" in att]:
-        refid = elt.attrib[a]
-        logger.debug("\n" + (level + 1) * "\t" + a + " -> " + refid,)
-        try:
-            ref = index[refid]
-            if attrib in ref.attrib:
-                rep = ref.attrib[attrib]
+    if resolved is None:
+        resolved = dict()
+    # Each item of the stack is [element, references of the element, rank of the reference to follow]
+    stack = [[elt, get_references(elt, index), 0], ]
+    on_stack = set([id(elt), ])
+    while len(stack) > 0:
+        frame = stack[-1]
+        current_elt, references, rank = frame
+        result = None
+        ref_to_solve = None
+        while result is None and ref_to_solve is None and rank < len(references):
+            refid, ref = references[rank]
+            logger.debug((level + len(stack)) * "\t" + frame[0].tag + " " + attrib + " -> " + refid)
+            if ref is None:
+                rep = ("invalid", [refid, ])
+            elif attrib in ref.attrib:
+                rep = ("value", ref.attrib[attrib])
+            elif id(ref) in resolved:
+                rep = resolved[id(ref)]
+                if rep[0] != "value":
+                    rep = (rep[0], [refid, ] + rep[1])
+            elif id(ref) in on_stack:
+                rep = ("cycle", [refid, ])
             else:
-                rep = attrib_by_ref(ref, attrib, index, level + 1)
-            logger.debug(" ---> !! GOT : %s !!!" % rep)
-            if rep:
-                return rep
-        except:
-            if not refid.startswith("dummy_"):
-                raise XparseError("Error : reference '%s' is invalid" % refid)
+                ref_to_solve = ref
+                rep = None
+            if rep is not None:
+                if rep[0] != "value" and refid.startswith("dummy_"):
+                    rank += 1
+                elif rep[0] != "value" or rep[1]:
+                    result = rep
+                else:
+                    rank += 1
+        frame[2] = rank
+        if ref_to_solve is not None:
+            stack.append([ref_to_solve, get_references(ref_to_solve, index), 0])
+            on_stack.add(id(ref_to_solve))
+        else:
+            if result is None:
+                result = ("value", None)
+            resolved[id(current_elt)] = result
+            stack.pop()
+            on_stack.remove(id(current_elt))
+    rep = resolved[id(elt)]
+    if rep[0] == "invalid":
+        raise XparseError("Error : reference '%s' is invalid (references followed: %s)" %
+                          (rep[1][-1], " -> ".join(rep[1])))
+    elif rep[0] == "cycle":
+        raise XparseError("Error : cycle in references (references followed: %s)" % " -> ".join(rep[1]))
+    else:
+        logger.debug(level * "\t" + " ---> !! GOT : %s !!!" % rep[1])
+        return rep[1]
 
 
-def solve_by_ref(attribs, index, elt, level=0):
+def solve_by_ref(attribs, index, elt, level=0, resolved=None):
+    """
+    Set the attributes ATTRIBS of the children of ELT which have not been defined using their references.
+    The resolution of each attribute for each element of the references' graph is done once and kept in RESOLVED,
+    so that a single pass on ELT is needed whatever the length of the references' chains.
+    :return: the number of attributes set
+    """
+    if resolved is None:
+        resolved = OrderedDict([(attrib, dict()) for attrib in attribs])
     got_one = 0
     for i in find_rank_xml_subelement(elt, not_tag=[None, "variable"]):
         child = elt[i]
         for attrib in attribs:
             if child.tag in attributes and attrib in attributes[child.tag] and attrib not in child.attrib:
-                by_ref = attrib_by_ref(elt[i], attrib, index, level)
+                by_ref = attrib_by_ref(elt[i], attrib, index, level, resolved=resolved[attrib])
                 if by_ref:
                     elt[i].attrib[attrib] = by_ref
                     got_one += 1
-        got_one += solve_by_ref(attribs, index, elt[i], level + 1)
+        got_one += solve_by_ref(attribs, index, elt[i], level + 1, resolved=resolved)
     return got_one
 
 
@@ -201,6 +267,59 @@ def select_context(rootel, context_id):
         return None
 
 
+def get_context_index_cache_filename(context_id, xmldef):
+    """
+    Get the name of the file containing the persistent cache of the index of a context.
+    :param context_id: id of the context of the index
+    :param xmldef: the xml iodef from which the index is built
+    :return: the name of the cache file or None if persistent cache is disabled
+    """
+    cache_directory = get_cache_directory("context_index")
+    if cache_directory is not None:
+        key = hash_content([__file__, xml_writer.beacon.__file__, xml_writer.element.__file__],
+                           os.path.abspath(xmldef), context_id, sys.version_info[0:2])
+        return os.path.join(cache_directory, "{}_{}.pkl".format(context_id, key))
+
+
+def read_context_index_cache(cache_filename):
+    """
+    Read the index of a context from its persistent cache.
+    The cache is only valid if none of the xml files read to build the index has changed since.
+    :param cache_filename: name of the cache file
+    :return: the index of the context or None if there is no valid cache
+    """
+    content = read_pickle_content(cache_filename)
+    if content is not None:
+        files_read, files_hash, index = content
+        try:
+            if hash_content(files_read) == files_hash:
+                return index
+        except (OSError, IOError):
+            pass
+    return None
+
+
+def write_context_index_cache(cache_filename, xmldef, path_parse, dont_read, index):
+    """
+    Write the index of a context in its persistent cache together with the hash of the xml files read to build it.
+    :param cache_filename: name of the cache file
+    :param xmldef: the xml iodef from which the index is built
+    :param path_parse: directory of the xml iodef
+    :param dont_read: prefixes of the xml files not read
+    :param index: the index of the context
+    :return: a boolean indicating whether the cache has been written
+    """
+    files_read = get_xml_files_read(xmldef, follow_src=True, path_parse=path_parse, dont_read=dont_read)
+    if files_read is not None:
+        try:
+            files_hash = hash_content(files_read)
+        except (OSError, IOError):
+            return False
+        return write_pickle_content(cache_filename, (files_read, files_hash, index))
+    else:
+        return False
+
+
 def init_context(context_id, path_parse="./"):
     """
     Create the index for xml elements
@@ -211,8 +330,15 @@ def init_context(context_id, path_parse="./"):
     """
     logger = get_logger()
     xmldef = path_parse + "iodef.xml"
+    dont_read = ["dr2xml_", ]
+    cache_filename = get_context_index_cache_filename(context_id, xmldef)
+    if cache_filename is not None:
+        index = read_context_index_cache(cache_filename)
+        if index is not None:
+            logger.debug("Index of context %s loaded from %s" % (context_id, cache_filename))
+            return index
     logger.debug("Parsing %s ..." % xmldef,)
-    rootel = read_src(xmldef, path_parse, dont_read=["dr2xml_", ])
+    rootel = read_src(xmldef, path_parse, dont_read=dont_read)
     logger.debug("sourcing files  ...",)
     rootel = merge_sons(rootel)
     rootel = select_context(rootel, context_id)
@@ -220,11 +346,11 @@ def init_context(context_id, path_parse="./"):
         refs = ["grid_ref", "domain_ref", "axis_ref", "field_ref"]
         rootel = solve_downward(refs, rootel)
         index = make_index(rootel, None)
-        while True:
-            n = solve_by_ref(refs, index, rootel)
-            logger.debug("%d refs solved" % n)
-            if n == 0:
-                break
+        n = solve_by_ref(refs, index, rootel)
+        logger.debug("%d refs solved" % n)
+        if cache_filename is not None and \
+                write_context_index_cache(cache_filename, xmldef, path_parse, dont_read, index):
+            logger.debug("Index of context %s written in %s" % (context_id, cache_filename))
         return index
     else:
         logger.warning("Xparse::init_context : context %s not found in %s" % (context_id, xmldef))
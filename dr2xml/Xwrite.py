@@ -7,6 +7,8 @@ XIOS writing files tools.
 
 from __future__ import print_function, division, absolute_import, unicode_literals
 
+import time
+
 # To have ordered dictionaries
 from collections import OrderedDict, defaultdict, namedtuple
 
@@ -44,7 +46,7 @@ from .grids import change_domain_in_grid, change_axes_in_grid, get_grid_def_with
 
 # Variables tools
 from .vars_interface.cmor import ping_alias, get_simplevar
-from .vars_interface.generic_data_request import endyear_for_CMORvar
+from .vars_interface.generic_data_request import endyear_for_CMORvar, endyear_for_CMORvars
 
 # Post-processing tools
 from .postprocessing import process_vertical_interpolation, process_zonal_mean, process_diurnal_cycle, \
@@ -53,6 +55,9 @@ from .postprocessing import process_vertical_interpolation, process_zonal_mean,
 # XIOS tools
 from .Xparse import id2gridid, id_has_expr_with_at
 
+# File_def changes report tools
+from .file_def_changes import get_files_keys, hash_file_inputs, write_file_def_with_changes_report
+
 warnings_for_optimisation = []
 
 
@@ -410,9 +415,11 @@ def is_singleton(sdim):
 
 
 def write_xios_file_def(filename, svars_per_table, year, dummies, skipped_vars_per_table, actually_written_vars,
-                        context, enddate=None, attributes=[]):
+                        context, enddate=None, attributes=[], report_changes=False):
     """
     Write XIOS file_def.
+    If report_changes is True, a summary of the changes of its files since the last run is written and the file_def is
+    not rewritten if its content did not change (see dr2xml.file_def_changes).
     """
     logger = get_logger()
     internal_dict = get_settings_values("internal")
@@ -464,11 +471,18 @@ def write_xios_file_def(filename, svars_per_table, year, dummies, skipped_vars_p
     xml_file_definition = DR2XMLElement(tag="file_definition")
     _, hgrid, _, _, _ = internal_dict['grids'][get_settings_values("internal_values", "grid_choice")][context]
     files_list = determine_files_list(svars_per_table, enddate, year, debug)
+    inputs_per_file = dict()
     for file_dict in files_list:
+        nb_files = len(xml_file_definition)
         write_xios_file_def_for_svars_list(hgrid=hgrid, xml_file_definition=xml_file_definition, dummies=dummies,
                                            skipped_vars_per_table=skipped_vars_per_table,
                                            actually_written_vars=actually_written_vars,
                                            attributes=attributes, **file_dict)
+        if report_changes and len(xml_file_definition) > nb_files:
+            inputs_per_file[id(xml_file_definition[-1])] = hash_file_inputs(file_dict, attributes)
+    # The files are identified in the same way as in the fingerprints of the changes report
+    files_inputs = dict([(key, inputs_per_file[id(xml_file)]) for (key, xml_file) in
+                         get_files_keys(xml_file_definition) if id(xml_file) in inputs_per_file])
     grid_defs = get_config_variable("grid_defs")
     # Add cfsites if needed
     if cfsites_grid_id in grid_defs:
@@ -535,7 +549,10 @@ def write_xios_file_def(filename, svars_per_table, year, dummies, skipped_vars_p
         xml_scalar_definition.append(scalar_defs[xml_scalar])
     xml_context.append(xml_scalar_definition)
     # Write the xml element to the dedicated file
-    create_pretty_xml_doc(xml_element=xml_context, filename=filename)
+    if report_changes:
+        write_file_def_with_changes_report(xml_context, filename, context, files_inputs)
+    else:
+        create_pretty_xml_doc(xml_element=xml_context, filename=filename)
 
 
 def write_xios_file_def_for_svars_list(vars_list, hgrid, xml_file_definition, freq, split_freq, split_freq_format,
@@ -566,7 +583,7 @@ def write_xios_file_def_for_svars_list(vars_list, hgrid, xml_file_definition, fr
     found_AH = False
     found_begin_A = False
     freq_ps = vars_list[0].frequency
-    for svar in sorted(vars_list):
+    for svar in sorted(vars_list, key=lambda x: x.label):
         rep = find_alias(svar, skipped_vars_per_table, debug)
         if rep is not None:
             alias, alias_ping = rep
@@ -638,7 +655,8 @@ def determine_files_list(svars_per_table, enddate, year, debug):
                                            "split_last_date", "split_start_offset", "split_end_offset",
                                            "grid_description", "grid_resolution", "target_hgrid_id", "zgrid_id",
                                            "source_grid"])
-    # Loop on values to fill the xml element
+    # Select the variables to be written
+    svars_list = list()
     for table in sorted(list(svars_per_table)):
         count = OrderedDict()
         for svar in sorted(svars_per_table[table], key=lambda x: (x.label + "_" + table)):
@@ -648,35 +666,56 @@ def determine_files_list(svars_per_table, enddate, year, debug):
                            "you must set 'use_cmorvar_label_in_filename' to True in lab settings"
                     raise Dr2xmlError(form % (svar.label, count[svar.mipVarLabel].label, table))
                 count[svar.mipVarLabel] = svar
-                freq = longest_possible_period(cmip6_freq_to_xios_freq(svar.frequency, table), too_long_periods)
-                split_freq_format, split_last_date, split_start_offset, split_end_offset, split_freq = \
-                    get_split_info(svar, table, enddate, year, debug)
-                for grid in svar.grids:
-                    grid_label, grid_description, grid_resolution, target_hgrid_id, zgrid_id, source_grid = \
-                        get_grid_info(svar, grid, table)
-                    files_dict[svar_tuple(freq=freq, split_freq_format=split_freq_format,
-                                          split_last_date=split_last_date, split_start_offset=split_start_offset,
-                                          split_end_offset=split_end_offset, grid_label=grid_label,
-                                          grid_description=grid_description, zgrid_id=zgrid_id,
-                                          grid_resolution=grid_resolution, target_hgrid_id=target_hgrid_id,
-                                          source_grid=source_grid, split_freq=split_freq, table=table)].append(svar)
+                svars_list.append((table, svar))
             else:
                 logger.warning("Duplicate variable %s,%s in table %s is skipped, preferred is %s" %
                                (svar.label, svar.mipVarLabel, table, count[svar.mipVarLabel].label))
+    # Get the end year given by the DR for all the variables at once
+    lastyears = endyear_for_CMORvars([svar.cmvar for (_, svar) in svars_list
+                                      if "fx" not in svar.frequency and svar.cmvar is not None],
+                                     internal_dict["experiment_id"], year)
+    # Loop on values to fill the xml element
+    for (table, svar) in svars_list:
+        freq = longest_possible_period(cmip6_freq_to_xios_freq(svar.frequency, table), too_long_periods)
+        split_freq_format, split_last_date, split_start_offset, split_end_offset, split_freq = \
+            get_split_info(svar, table, enddate, year, debug, lastyears)
+        for grid in svar.grids:
+            grid_label, grid_description, grid_resolution, target_hgrid_id, zgrid_id, source_grid = \
+                get_grid_info(svar, grid, table)
+            files_dict[svar_tuple(freq=freq, split_freq_format=split_freq_format,
+                                  split_last_date=split_last_date, split_start_offset=split_start_offset,
+                                  split_end_offset=split_end_offset, grid_label=grid_label,
+                                  grid_description=grid_description, zgrid_id=zgrid_id,
+                                  grid_resolution=grid_resolution, target_hgrid_id=target_hgrid_id,
+                                  source_grid=source_grid, split_freq=split_freq, table=table)].append(svar)
+    # Group the variables of each key in files
+    start_time = time.time()
+    group_per_label = dict()
+    for (i, list_elts) in enumerate(grouped_vars_per_file):
+        for label in list_elts:
+            # Take into account the first group only
+            group_per_label.setdefault(label, i)
     files_list = list()
     for elts in sorted(list(files_dict), key=lambda x: str(x)):
         vars_list = files_dict[elts]
         elts = elts._asdict()
         grouped_vars = defaultdict(list)
         for var in vars_list:
-            found = [var in list_elts for list_elts in grouped_vars_per_file]
-            if True in found:
-                # Take into account the first one only
-                grouped_vars[found.index(True)].append(var)
+            if var.label in group_per_label:
+                grouped_vars[(0, group_per_label[var.label])].append(var)
             else:
-                grouped_vars[var.label + "_" + elts["table"]].append(var)
+                grouped_vars[(1, var.label + "_" + elts["table"])].append(var)
         for i in sorted(list(grouped_vars)):
             files_list.append(dict(vars_list=grouped_vars[i], **elts))
+    if len(files_list) > 0:
+        nb_vars_per_file = [len(file_dict["vars_list"]) for file_dict in files_list]
+        logger.debug("Grouping of %d variables in %d files done in %.3fs: %d to %d variables per file (%.2f on average)"
+                     % (sum(nb_vars_per_file), len(files_list), time.time() - start_time, min(nb_vars_per_file),
+                        max(nb_vars_per_file), sum(nb_vars_per_file) / len(files_list)))
+        for file_dict in [file_dict for file_dict in files_list if len(file_dict["vars_list"]) > 1]:
+            logger.debug("File for table %s and frequency %s groups variables %s" %
+                         (file_dict["table"], file_dict["freq"],
+                          " ".join([var.label for var in file_dict["vars_list"]])))
     return files_list
 
 
@@ -714,7 +753,7 @@ def find_alias(sv, skipped_vars_per_table, debug=list()):
         return alias, alias_ping
 
 
-def get_split_info(sv, table, enddate, year, debug):
+def get_split_info(sv, table, enddate, year, debug, lastyears=None):
     logger = get_logger()
     internal_dict = get_settings_values("internal")
     experiment_id = internal_dict["experiment_id"]
@@ -739,7 +778,10 @@ def get_split_info(sv, table, enddate, year, debug):
         # Try to get enddate for the CMOR variable from the DR
         if sv.cmvar is not None:
             # print "calling endyear_for... for %s, with year="%(sv.label), year
-            lastyear = endyear_for_CMORvar(sv.cmvar, experiment_id, year)
+            if lastyears is not None and sv.cmvar.id in lastyears:
+                lastyear = lastyears[sv.cmvar.id]
+            else:
+                lastyear = endyear_for_CMORvar(sv.cmvar, experiment_id, year)
             # print "lastyear=",lastyear," enddate=",enddate
         if lastyear is None or (enddate is not None and lastyear >= int(enddate[0:4])):
             # DR doesn't specify an end date for that var, or a very late one
@@ -51,20 +51,23 @@ Rather look at git log for identifying further changes and contributors....
 
 from __future__ import print_function, division, absolute_import, unicode_literals
 
+import io
+import multiprocessing
 import os
 import sys
+import time
 
 from collections import OrderedDict
 
 # Utilities
-from .settings_interface import initialize_settings
+from .settings_interface import initialize_settings, set_internal_value
 from .utils import print_struct
 
 # Logger
 from logger import initialize_logger, get_logger, change_log_level
 
 # Global variables and configuration tools
-from .config import get_config_variable, set_config_variable, initialize_config_variables
+from .config import get_config_variable, set_config_variable, initialize_config_variables, GenerationContext
 
 
 """ An example/template  of settings for a lab and a model"""
@@ -571,11 +574,18 @@ def configuration_init(func):
                              If False (default), save time by not reading once again Data Request but can cause filter
                              issues if some things should be different (not the case for most usages).
                              Else, the run is a little longer but all changes are taken into account.
+    :param GenerationContext generation_context: if not None, the generation context in which the function is run
+                                                 (see dr2xml.config.GenerationContext). Else, the state of the process
+                                                 is used.
 
     :return: The initial function with initialized environment to use dr2xml.
     """
     def make_configuration(lset, sset, cvs_path=None, printout=False, prefix="", debug=False, force_reset=False,
-                           **kwargs):
+                           generation_context=None, **kwargs):
+        if generation_context is not None:
+            with generation_context:
+                return make_configuration(lset, sset, cvs_path=cvs_path, printout=printout, prefix=prefix,
+                                          debug=debug, force_reset=force_reset, **kwargs)
         year = kwargs.get("year", 0)
         context = kwargs.get("context")
         dirname = kwargs.get("dirname")
@@ -595,7 +605,7 @@ def configuration_init(func):
 
 @configuration_init
 def generate_file_defs(year, enddate, context, pingfiles=None, dummies='include', dirname="./", attributes=list(),
-                       select="on_expt_and_year"):
+                       select="on_expt_and_year", report_changes=False):
     """
     Using the DR module, a dict of lab settings ``lset``, and a dict
     of simulation settings ``sset``, generate an XIOS file_defs 'file' for a
@@ -628,6 +638,10 @@ on
         - "on_expt": select output variables according to the experiment done only
         - "no": no selection of output variables
 
+    :param bool report_changes: if True, the fingerprints of the files of the file_def are written in
+                                dirname/dr2xml_context_fingerprints.json and the summary of their changes since the
+                                last run in dirname/dr2xml_context_changes.json. The file_def is still generated in
+                                full, but it is not rewritten if its content did not change.
     :return: An output file named dirname/filedefs_context.xml. It has a CMIP6 compliant name, with prepended prefix.
 
     """
@@ -685,7 +699,8 @@ on
     default_log_level = logger.level
     if internal_settings["debug_parsing"]:
         change_log_level("debug")
-    set_config_variable("context_index", init_context(context, internal_settings["path_to_parse"]))
+    set_config_variable("context_index", init_context(context, internal_settings["path_to_parse"]),
+                        copy_value=False)
     if internal_settings["debug_parsing"]:
         change_log_level(default_log_level)
     if get_config_variable("context_index") is None:
@@ -723,7 +738,7 @@ on
     os.chdir(dirname)
     filename = dirname + "dr2xml_%s.xml" % context
     write_xios_file_def(filename, svars_per_table, year, dummies, skipped_vars_per_table, actually_written_vars,
-                        context, enddate, attributes)
+                        context, enddate, attributes, report_changes)
     logger.info("\nfile_def written as %s" % filename)
 
     #
@@ -771,3 +786,181 @@ def create_ping_files(context, path_special, dummy="field_atm", dummy_with_shape
                                   dummy=dummy, dummy_with_shape=dummy_with_shape, exact=exact, comments=comments,
                                   filename=filename, debug=debug)
 
+
+@configuration_init
+def initialize_generation(context, year=None, dirname="./", select="on_expt_and_year"):
+    """
+    Load the settings, the Data Request and its scope and select the Data Request variables, so that they are ready for
+    the following generations.
+    :param six.string_types context: XIOS context used to initialize the settings
+    :param six.string_types year: year used to initialize the settings and select the variables
+    :param six.string_types dirname: directory in which outputs will be created
+    :param six.string_types select: selection criteria of the variables (see generate_file_defs)
+    """
+    from . import dr_interface
+    from .settings_interface import get_settings_values
+    from .vars_interface.selection import gather_data_request_vars
+    dr_interface.get_data_request()
+    dr_interface.get_scope(get_settings_values("internal", "tierMax"))
+    gather_data_request_vars(year, select)
+
+
+# Arguments of the jobs run by generate_file_defs_for_contexts, shared with the forked workers
+generation_jobs = list()
+
+
+def run_generation_job(rank):
+    """
+    Run one of the generation_jobs, capturing its printouts.
+    :param int rank: rank of the job in generation_jobs
+    :return: a dictionary containing the context, the year, the output directory and file, the time spent and the
+             printouts of the job
+    """
+    context, year, enddate, dirname, kwargs = generation_jobs[rank]
+    # The workers are reused for several jobs: the axes are numbered in the same way as for a job run on its own
+    if kwargs["generation_context"] is None:
+        set_internal_value("axis_count", 0)
+    else:
+        with kwargs["generation_context"]:
+            set_internal_value("axis_count", 0)
+    old_stdout = sys.stdout
+    output = io.StringIO()
+    try:
+        sys.stdout = output
+        start_time = time.time()
+        generate_file_defs(year=year, enddate=enddate, context=context, dirname=dirname, **kwargs)
+        end_time = time.time()
+    finally:
+        sys.stdout = old_stdout
+    return OrderedDict(context=context, year=year, dirname=dirname, filename=dirname + "dr2xml_%s.xml" % context,
+                       time=end_time - start_time, output=output.getvalue())
+
+
+def generate_file_defs_for_contexts(lset, sset, contexts, year, enddate, years=None, enddates=None, dirname="./",
+                                    nb_processes=None, cvs_path=None, printout=False, prefix="", debug=False,
+                                    force_reset=False, generation_context=None, **kwargs):
+    """
+    Generate the file_defs of several contexts (and possibly several years) using a pool of processes.
+
+    The settings, the Data Request and its scope are loaded once in the current process, then the workers are forked
+    so that they share them. Each worker runs generate_file_defs for a (context, year) couple. The printouts of the
+    jobs are printed by the current process in the order of the jobs.
+
+    :param dict lset: dictionary containing lab and model related settings
+    :param dict sset: dictionary containing simulation related settings
+    :param list of six.string_types contexts: XIOS contexts to be processed
+    :param six.string_types year: year associated with the launch of dr2xml (used if years is None)
+    :param six.string_types enddate: enddate of the current launch of dr2xml (used if years is None)
+    :param list years: if not None, years to be processed; the outputs of each year are written in a subdirectory
+                       of dirname named after the year
+    :param list enddates: if not None, enddates associated with years
+    :param six.string_types dirname: directory in which outputs will be created
+    :param int nb_processes: number of worker processes (default: number of cpus, at most the number of jobs); if 1
+                             or if processes can not be forked, the jobs are run in the current process
+    :param six.string_types cvs_path: path where controled vocabulary can be found
+    :param bool printout: print infos
+    :param six.string_types prefix: prefix used for each file definition
+    :param bool debug: Turn on debug mode to have more information during the run.
+    :param bool force_reset: Should the internal values be emptied before loading the settings?
+    :param GenerationContext generation_context: if not None, the generation context in which the settings are loaded
+                                                 and the jobs are run (each worker then works on its own copy of it).
+                                                 Else, the state of the process is used.
+    :param kwargs: other arguments of generate_file_defs (pingfiles, dummies, attributes, select...)
+    :return: a list containing, for each job, a dictionary with the context, the year, the output directory and file,
+             the time spent and the printouts of the job
+    """
+    global generation_jobs
+    if years is None:
+        years_and_enddates = [(year, enddate, dirname), ]
+    else:
+        if enddates is None:
+            enddates = [None for _ in years]
+        elif len(enddates) != len(years):
+            raise ValueError("The number of enddates (%d) must be the same as the number of years (%d)"
+                             % (len(enddates), len(years)))
+        years_and_enddates = list()
+        for (a_year, an_enddate) in zip(years, enddates):
+            year_dirname = os.path.join(dirname, str(a_year), "")
+            if not os.path.isdir(year_dirname):
+                os.makedirs(year_dirname)
+            years_and_enddates.append((a_year, an_enddate, year_dirname))
+    kwargs.update(dict(lset=lset, sset=sset, cvs_path=cvs_path, printout=printout, prefix=prefix, debug=debug,
+                       force_reset=False, generation_context=generation_context))
+    generation_jobs = [(context, a_year, an_enddate, os.path.join(os.path.abspath(a_dirname), ""), kwargs)
+                       for (a_year, an_enddate, a_dirname) in years_and_enddates for context in contexts]
+    initialize_generation(lset=lset, sset=sset, cvs_path=cvs_path, printout=printout, prefix=prefix, debug=debug,
+                          force_reset=force_reset, generation_context=generation_context, context=contexts[0],
+                          year=years_and_enddates[0][0], dirname=years_and_enddates[0][2],
+                          select=kwargs.get("select", "on_expt_and_year"))
+    if nb_processes is None:
+        nb_processes = multiprocessing.cpu_count()
+    nb_processes = min(nb_processes, len(generation_jobs))
+    current_dir = os.getcwd()
+    try:
+        if nb_processes > 1 and "fork" in multiprocessing.get_all_start_methods():
+            with multiprocessing.get_context("fork").Pool(nb_processes) as pool:
+                rep = pool.map(run_generation_job, range(len(generation_jobs)), chunksize=1)
+        else:
+            rep = [run_generation_job(rank) for rank in range(len(generation_jobs))]
+    finally:
+        os.chdir(current_dir)
+        generation_jobs = list()
+    for job in rep:
+        print(job["output"], end="")
+    return rep
+
+
+def generate_file_defs_for_years(lset, sset, years, context, enddates=None, dirname="./", generation_context=None,
+                                 force_reset=False, **kwargs):
+    """
+    Generate the file_defs of a context for several years, the outputs of each year being written in a subdirectory
+    of dirname named after the year.
+
+    The years are processed in turn in the same generation context, so that the work which does not depend on the
+    year is only done for the first one: loading of the settings, of the Data Request and of its scope, index of the
+    requestItems time slices of the experiment, selection of the Data Request variables (if it does not depend on the
+    year), reading of the home variables and of the xml files of the context. For the other years, only the
+    year-dependent parts (selection on the requestItems time slices, end years and split dates of the files) and the
+    writing of the file_defs are done.
+
+    :param dict lset: dictionary containing lab and model related settings
+    :param dict sset: dictionary containing simulation related settings
+    :param list years: years to be processed
+    :param six.string_types context: XIOS context to be processed
+    :param list enddates: if not None, enddates associated with years
+    :param six.string_types dirname: directory in which the outputs directories will be created
+    :param GenerationContext generation_context: generation context in which the years are processed (default: a new
+                                                 one)
+    :param bool force_reset: Should the internal values be emptied before processing the first year?
+    :param kwargs: other arguments of generate_file_defs (cvs_path, pingfiles, dummies, attributes, select...)
+    :return: a list containing, for each year, a dictionary with the context, the year, the output directory and file
+             and the time spent
+    """
+    if enddates is None:
+        enddates = [None for _ in years]
+    elif len(enddates) != len(years):
+        raise ValueError("The number of enddates (%d) must be the same as the number of years (%d)"
+                         % (len(enddates), len(years)))
+    if generation_context is None:
+        generation_context = GenerationContext()
+    rep = list()
+    current_dir = os.getcwd()
+    try:
+        for (rank, (year, enddate)) in enumerate(zip(years, enddates)):
+            year_dirname = os.path.join(os.path.abspath(dirname), str(year), "")
+            if not os.path.isdir(year_dirname):
+                os.makedirs(year_dirname)
+            if rank > 0:
+                # The axes are numbered in the same way for all years
+                with generation_context:
+                    set_internal_value("axis_count", 0)
+            start_time = time.time()
+            generate_file_defs(lset=lset, sset=sset, year=year, enddate=enddate, context=context,
+                               dirname=year_dirname, generation_context=generation_context,
+                               force_reset=force_reset and rank == 0, **kwargs)
+            rep.append(OrderedDict(context=context, year=year, dirname=year_dirname,
+                                   filename=year_dirname + "dr2xml_%s.xml" % context,
+                                   time=time.time() - start_time))
+    finally:
+        os.chdir(current_dir)
+    return rep
@@ -8,6 +8,7 @@ Configuration variables and associated tools.
 from __future__ import print_function, division, absolute_import, unicode_literals
 
 import sys
+import threading
 
 # Utilities
 from collections import OrderedDict
@@ -16,6 +17,87 @@ from .utils import Dr2xmlError
 import copy
 
 
+class PingVariables(list):
+    """
+    List of the variables defined in the ping files. It keeps the insertion order like a list, but membership tests
+    are done in constant time thanks to a count of the occurrences of each variable.
+    """
+
+    def __init__(self, iterable=()):
+        super(PingVariables, self).__init__()
+        self._counts = dict()
+        self.extend(iterable)
+
+    def __reduce__(self):
+        return type(self), (list(self), )
+
+    def _add_counts(self, values):
+        for value in values:
+            self._counts[value] = self._counts.get(value, 0) + 1
+
+    def _remove_counts(self, values):
+        for value in values:
+            self._counts[value] -= 1
+            if self._counts[value] == 0:
+                del self._counts[value]
+
+    def _reset_counts(self):
+        self._counts = dict()
+        self._add_counts(self)
+
+    def __contains__(self, value):
+        try:
+            return value in self._counts
+        except TypeError:
+            return super(PingVariables, self).__contains__(value)
+
+    def count(self, value):
+        return self._counts.get(value, 0)
+
+    def append(self, value):
+        super(PingVariables, self).append(value)
+        self._add_counts([value, ])
+
+    def extend(self, values):
+        values = list(values)
+        super(PingVariables, self).extend(values)
+        self._add_counts(values)
+
+    def __iadd__(self, values):
+        self.extend(values)
+        return self
+
+    def insert(self, index, value):
+        super(PingVariables, self).insert(index, value)
+        self._add_counts([value, ])
+
+    def remove(self, value):
+        super(PingVariables, self).remove(value)
+        self._remove_counts([value, ])
+
+    def pop(self, index=-1):
+        value = super(PingVariables, self).pop(index)
+        self._remove_counts([value, ])
+        return value
+
+    def clear(self):
+        super(PingVariables, self).clear()
+        self._counts = dict()
+
+    def __setitem__(self, index, value):
+        super(PingVariables, self).__setitem__(index, value)
+        self._reset_counts()
+
+    def __delitem__(self, index):
+        super(PingVariables, self).__delitem__(index)
+        self._reset_counts()
+
+    def __imul__(self, value):
+        super(PingVariables, self).__imul__(value)
+        self._reset_counts()
+        return self
+
+
 # Python version
 python_version = "python" + sys.version[0]
 
@@ -62,7 +144,7 @@ scalar_defs = OrderedDict()
 domain_defs = OrderedDict()
 
 # Ping variables list
-pingvars = list()
+pingvars = PingVariables()
 
 # Ping variables references
 ping_refs = OrderedDict()
@@ -81,18 +163,21 @@ def initialize_config_variables():
     set_config_variable("file_defs", OrderedDict())
     set_config_variable("scalar_defs", OrderedDict())
     set_config_variable("domain_defs", OrderedDict())
-    set_config_variable("pingvars", list())
+    set_config_variable("pingvars", PingVariables())
     set_config_variable("ping_refs", OrderedDict())
 
 
-def set_config_variable(variable, value):
+def set_config_variable(variable, value, copy_value=True):
     """
     Set the value of the indicated global variable
+    If copy_value is False, the value is stored as is: the caller hands it over and must not modify it afterwards.
     """
     if variable in ["python_version", "version", "conventions", "CMIP6_conventions_version", "context_index",
                     "cell_method_warnings", "compression_factor", "splitfreqs", "homevars_list", "field_defs",
                     "axis_defs", "grid_defs", "file_defs", "scalar_defs", "domain_defs", "pingvars", "ping_refs"]:
-        globals()[variable] = copy.deepcopy(value)
+        if copy_value:
+            value = copy.deepcopy(value)
+        globals()[variable] = value
     else:
         raise Dr2xmlError("Can not set configuration variable %s." % variable)
 
@@ -131,3 +216,172 @@ def add_value_in_dict_config_variable(variable, key, value):
         globals()[variable][key] = value
     else:
         raise Dr2xmlError("Could not add a value to configuration variable %s." % variable)
+
+
+# Module-level variables which hold the state of a generation, with their initial value.
+# Any new module-level variable modified during a generation must be added here (tests/test_generation_context.py
+# checks that no module-level mutable variable is forgotten).
+generation_state_variables = [
+    ("dr2xml.config", "context_index", None),
+    ("dr2xml.config", "cell_method_warnings", list()),
+    ("dr2xml.config", "compression_factor", None),
+    ("dr2xml.config", "splitfreqs", None),
+    ("dr2xml.config", "homevars_list", None),
+    ("dr2xml.config", "field_defs", OrderedDict()),
+    ("dr2xml.config", "axis_defs", OrderedDict()),
+    ("dr2xml.config", "grid_defs", OrderedDict()),
+    ("dr2xml.config", "file_defs", OrderedDict()),
+    ("dr2xml.config", "scalar_defs", OrderedDict()),
+    ("dr2xml.config", "domain_defs", OrderedDict()),
+    ("dr2xml.config", "pingvars", PingVariables()),
+    ("dr2xml.config", "ping_refs", OrderedDict()),
+    ("dr2xml.settings_interface", "internal_settings", None),
+    ("dr2xml.settings_interface", "common_settings", None),
+    ("dr2xml.settings_interface", "project_settings", None),
+    ("dr2xml.settings_interface", "internal_values", None),
+    ("dr2xml.settings_interface.py_settings_interface", "lset", None),
+    ("dr2xml.settings_interface.py_settings_interface", "sset", None),
+    ("dr2xml.dr_interface", "scope", None),
+    ("dr2xml.dr_interface.CMIP6", "scope", None),
+    ("dr2xml.dr_interface.C3S", "scope", None),
+    ("dr2xml.dr_interface.no", "scope", None),
+    ("dr2xml.laboratories", "laboratory_source", None),
+    ("dr2xml.vars_interface.extra", "dims2shape", None),
+    ("dr2xml.vars_interface.extra", "dim2dimid", None),
+    ("dr2xml.vars_interface.extra", "dr_single_levels", None),
+    ("dr2xml.vars_interface.generic", "ambiguous_mipvarnames", None),
+    ("dr2xml.vars_interface.generic", "sn_issues_home", OrderedDict()),
+    ("dr2xml.vars_interface.home_data_request", "homevars_cache", OrderedDict()),
+    ("dr2xml.Xwrite", "warnings_for_optimisation", list())
+]
+
+# Module-level variables which are bound at each initialization of the settings (and so have no initial value)
+generation_bound_variables = [
+    ("dr2xml.dr_interface", "DataRequest"),
+    ("dr2xml.dr_interface", "initialize_data_request"),
+    ("dr2xml.dr_interface", "get_data_request"),
+    ("dr2xml.dr_interface", "initialize_scope"),
+    ("dr2xml.dr_interface", "get_scope"),
+    ("dr2xml.dr_interface", "set_scope"),
+    ("dr2xml.dr_interface", "normalize_grid"),
+    ("dr2xml.dr_interface", "SimpleObject"),
+    ("dr2xml.dr_interface", "SimpleCMORVar"),
+    ("dr2xml.dr_interface", "SimpleDim")
+]
+
+# Lock held by the thread in which a generation context is active
+generation_lock = threading.RLock()
+
+# Stack of the active generation contexts
+active_generation_contexts = list()
+
+
+class GenerationContext(object):
+    """
+    Swappable copy of the global state of dr2xml generations: configuration variables, settings, data request scope
+    and the other module-level variables which are modified while generating file_defs or ping files (see
+    generation_state_variables).
+
+    dr2xml functions work on module-level variables. Activating a GenerationContext saves the current values of those
+    variables and replaces them by the ones of the context; deactivating it does the reverse. Several sets of settings
+    (e.g. several simulations) can thus be processed in turn in one process, each one keeping the settings, selections
+    and indexes it has already computed. The loaded Data Request and the caches of parsed files are shared between
+    all generation contexts.
+
+    A generation context is activated with a ``with`` statement (it can be nested and re-entered) or by giving it to
+    generate_file_defs or create_ping_files through the generation_context argument. When no generation context is
+    active, the state is the one of the process (which is the historical behaviour).
+
+    This is not a way to run generations concurrently: the state is still process-wide, so a lock is held while a
+    generation context is active and the generations of other threads wait for it. Use processes (see
+    generate_file_defs_for_contexts) to run several generations at the same time.
+    """
+
+    def __init__(self):
+        self.state = dict()
+        self.saved_state = None
+
+    def _save_state(self):
+        state = dict()
+        for (module_name, variable, _) in generation_state_variables:
+            module = sys.modules.get(module_name)
+            if module is not None:
+                state[(module_name, variable)] = getattr(module, variable)
+        for (module_name, variable) in generation_bound_variables:
+            module = sys.modules.get(module_name)
+            if module is not None:
+                state[(module_name, variable)] = getattr(module, variable)
+        return state
+
+    @staticmethod
+    def _load_state(state):
+        for (module_name, variable, initial_value) in generation_state_variables:
+            module = sys.modules.get(module_name)
+            if module is not None:
+                if (module_name, variable) in state:
+                    setattr(module, variable, state[(module_name, variable)])
+                else:
+                    setattr(module, variable, copy.deepcopy(initial_value))
+        for (module_name, variable) in generation_bound_variables:
+            module = sys.modules.get(module_name)
+            if module is not None and (module_name, variable) in state:
+                setattr(module, variable, state[(module_name, variable)])
+
+    def activate(self):
+        """
+        Make this generation context the active one.
+        """
+        generation_lock.acquire()
+        try:
+            if len(active_generation_contexts) > 0:
+                previous = active_generation_contexts[-1]
+                previous.state = previous._save_state()
+                previous_state = previous.state
+            else:
+                self.saved_state = self._save_state()
+                previous_state = self.saved_state
+            try:
+                self._load_state(self.state)
+            except BaseException:
+                # Give back the state which was active before
+                self._load_state(previous_state)
+                if len(active_generation_contexts) == 0:
+                    self.saved_state = None
+                raise
+        except BaseException:
+            generation_lock.release()
+            raise
+        active_generation_contexts.append(self)
+
+    def deactivate(self):
+        """
+        Save the state of this generation context and restore the one which was active before.
+        """
+        if len(active_generation_contexts) == 0 or active_generation_contexts[-1] is not self:
+            raise Dr2xmlError("Can not deactivate a generation context which is not the active one.")
+        self.state = self._save_state()
+        active_generation_contexts.pop()
+        if len(active_generation_contexts) > 0:
+            self._load_state(active_generation_contexts[-1].state)
+        else:
+            self._load_state(self.saved_state)
+            self.saved_state = None
+        generation_lock.release()
+
+    def __enter__(self):
+        self.activate()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.deactivate()
+
+
+def get_active_generation_context():
+    """
+    Get the active generation context.
+    :return: the active GenerationContext or None if the state of the process is used
+    """
+    if len(active_generation_contexts) > 0:
+        return active_generation_contexts[-1]
+    else:
+        return None
@@ -0,0 +1,282 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Daemon mode of dr2xml.
+A long-running server listens on a Unix socket and runs generate_file_defs, create_ping_files or initialize_generation
+jobs. The Data Request, the project settings, the parsed xml and json files and, for each set
+of lab and simulation settings, the generation context (see dr2xml.config.GenerationContext) are kept in memory
+between the jobs, so that a job only pays for the selection of the variables and the writing of its outputs.
+
+The jobs are run with the rights of the owner of the daemon and can read project settings files, which are python
+files, and write in any directory: the socket is thus created so that only its owner can connect to it.
+
+The requests and responses are json documents, one per line. A request contains the name of the job, the working
+directory of the client and the arguments of the job. Sets, tuples and dictionaries with non-string keys are encoded
+so that the arguments are received as they were sent.
+"""
+
+from __future__ import print_function, division, absolute_import, unicode_literals
+
+import errno
+import io
+import json
+import os
+import socket
+import socketserver
+import stat
+import sys
+import time
+import traceback
+from collections import OrderedDict
+
+# Global variables and configuration tools
+from .config import GenerationContext
+from .utils import Dr2xmlError
+
+#: Maximum number of generation contexts kept in memory
+max_generation_contexts = 8
+
+#: Generation contexts of the server, by settings
+generation_contexts = OrderedDict()
+
+#: Jobs which can be run by the server
+daemon_jobs = ["generate_file_defs", "create_ping_files", "initialize_generation"]
+
+
+def encode_value(value):
+    """
+    Encode a value so that it can be written as json without losing its type.
+    :param value: value to encode
+    :return: the encoded value
+    """
+    if isinstance(value, dict):
+        if all(isinstance(key, str) and not key.startswith("__") for key in value):
+            return OrderedDict([(key, encode_value(val)) for (key, val) in value.items()])
+        else:
+            return {"__dict__": [[encode_value(key), encode_value(val)] for (key, val) in value.items()]}
+    elif isinstance(value, (set, frozenset)):
+        return {"__set__": [encode_value(val) for val in value]}
+    elif isinstance(value, tuple):
+        return {"__tuple__": [encode_value(val) for val in value]}
+    elif isinstance(value, list):
+        return [encode_value(val) for val in value]
+    else:
+        return value
+
+
+def decode_value(value):
+    """
+    Decode a value encoded by encode_value.
+    :param value: value to decode
+    :return: the decoded value
+    """
+    if isinstance(value, dict):
+        if "__dict__" in value:
+            return dict([(decode_value(key), decode_value(val)) for (key, val) in value["__dict__"]])
+        elif "__set__" in value:
+            return set([decode_value(val) for val in value["__set__"]])
+        elif "__tuple__" in value:
+            return tuple([decode_value(val) for val in value["__tuple__"]])
+        else:
+            return dict([(key, decode_value(val)) for (key, val) in value.items()])
+    elif isinstance(value, list):
+        return [decode_value(val) for val in value]
+    else:
+        return value
+
+
+def get_generation_context(lset, sset, cvs_path=None, prefix=""):
+    """
+    Get the generation context associated with a set of settings, creating it if needed. The least recently used
+    generation contexts are forgotten when there are more than max_generation_contexts.
+    :param dict lset: dictionary containing lab and model related settings
+    :param dict sset: dictionary containing simulation related settings
+    :param six.string_types cvs_path: path where controled vocabulary can be found
+    :param six.string_types prefix: prefix used for each file definition
+    :return: the generation context
+    """
+    key = json.dumps(encode_value([lset, sset, cvs_path, prefix]), sort_keys=True, default=str)
+    if key in generation_contexts:
+        generation_contexts[key] = generation_contexts.pop(key)
+    else:
+        generation_contexts[key] = GenerationContext()
+        while len(generation_contexts) > max_generation_contexts:
+            generation_contexts.popitem(last=False)
+    return generation_contexts[key]
+
+
+def run_job(job, cwd=None, kwargs=dict()):
+    """
+    Run a job in the generation context associated with its settings, capturing its printouts.
+    :param six.string_types job: name of the job, among daemon_jobs
+    :param six.string_types cwd: directory in which the job is run (default: the current directory)
+    :param dict kwargs: arguments of the job (lset and sset must be provided)
+    :return: a dictionary containing the status of the job, the time spent, the printouts and the output file
+    """
+    import dr2xml
+    from .settings_interface import set_internal_value
+    if job not in daemon_jobs:
+        raise Dr2xmlError("Unknown job %s, should be one of %s" % (job, daemon_jobs))
+    kwargs = dict(kwargs)
+    for key in ["lset", "sset"]:
+        if key not in kwargs:
+            raise Dr2xmlError("Job %s needs argument %s" % (job, key))
+    kwargs.pop("force_reset", None)
+    if cwd is not None and "dirname" in kwargs:
+        kwargs["dirname"] = os.path.join(cwd, kwargs["dirname"], "")
+    kwargs["generation_context"] = get_generation_context(kwargs["lset"], kwargs["sset"], kwargs.get("cvs_path"),
+                                                          kwargs.get("prefix", ""))
+    # The axes are numbered in the same way as for a job run in its own process
+    with kwargs["generation_context"]:
+        set_internal_value("axis_count", 0)
+    current_dir = os.getcwd()
+    old_stdout = sys.stdout
+    output = io.StringIO()
+    start_time = time.time()
+    try:
+        if cwd is not None:
+            os.chdir(cwd)
+        sys.stdout = output
+        getattr(dr2xml, job)(**kwargs)
+    finally:
+        sys.stdout = old_stdout
+        os.chdir(current_dir)
+    rep = OrderedDict([("status", "ok"), ("job", job), ("time", time.time() - start_time),
+                       ("output", output.getvalue())])
+    if job in ["generate_file_defs", ]:
+        rep["filename"] = kwargs.get("dirname", "./") + "dr2xml_%s.xml" % kwargs["context"]
+    elif job in ["create_ping_files", ]:
+        rep["filename"] = kwargs.get("filename")
+    return rep
+
+
+class DaemonRequestHandler(socketserver.StreamRequestHandler):
+    """
+    Handler of the connections to the server: each line received is a request, which is answered by a line.
+    """
+
+    def handle(self):
+        for line in self.rfile:
+            line = line.strip()
+            if len(line) == 0:
+                continue
+            try:
+                request = decode_value(json.loads(line.decode("utf-8")))
+                job = request.get("job")
+                if job in ["status", ]:
+                    response = OrderedDict([("status", "ok"), ("job", job), ("pid", os.getpid()),
+                                            ("generation_contexts", len(generation_contexts))])
+                elif job in ["shutdown", ]:
+                    self.server.stop = True
+                    response = OrderedDict([("status", "ok"), ("job", job)])
+                else:
+                    response = run_job(job, cwd=request.get("cwd"), kwargs=request.get("kwargs", dict()))
+            except (Exception, SystemExit) as e:
+                response = OrderedDict([("status", "error"), ("error", "%s: %s" % (type(e).__name__, str(e))),
+                                        ("traceback", traceback.format_exc())])
+            print("Job %s: %s" % (response.get("job", "unknown"), response["status"]))
+            sys.stdout.flush()
+            self.wfile.write((json.dumps(response) + "\n").encode("utf-8"))
+            self.wfile.flush()
+            if getattr(self.server, "stop", False):
+                break
+
+
+class UnixDaemonServer(socketserver.UnixStreamServer):
+    """
+    Server listening on a Unix socket, which can only be used by the user who started it.
+    """
+
+    def server_bind(self):
+        self.socket_bound = False
+        if os.path.lexists(self.server_address):
+            remove_stale_socket(self.server_address)
+        old_umask = os.umask(0o077)
+        try:
+            socketserver.UnixStreamServer.server_bind(self)
+        finally:
+            os.umask(old_umask)
+        self.socket_bound = True
+
+    def server_close(self):
+        socketserver.UnixStreamServer.server_close(self)
+        # Only remove the socket created by this server (not the one of another daemon or another file)
+        if getattr(self, "socket_bound", False) and os.path.exists(self.server_address):
+            os.remove(self.server_address)
+        self.socket_bound = False
+
+
+def remove_stale_socket(address):
+    """
+    Remove the socket left by a daemon which is not running anymore.
+    :param six.string_types address: path of the Unix socket
+    """
+    if not stat.S_ISSOCK(os.lstat(address).st_mode):
+        raise Dr2xmlError("Can not use %s as the socket of the dr2xml daemon: the file exists and is not a socket"
+                          % address)
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(address)
+    except OSError as e:
+        if e.errno != errno.ECONNREFUSED:
+            raise Dr2xmlError("Can not use %s as the socket of the dr2xml daemon: %s" % (address, str(e)))
+    else:
+        raise Dr2xmlError("Can not use %s as the socket of the dr2xml daemon: another daemon is listening on it"
+                          % address)
+    finally:
+        sock.close()
+    os.remove(address)
+
+
+def create_server(address):
+    """
+    Create the server.
+    :param six.string_types address: path of the Unix socket on which the server listens
+    :return: the server
+    """
+    server = UnixDaemonServer(address, DaemonRequestHandler)
+    server.stop = False
+    return server
+
+
+def serve(address):
+    """
+    Run the server until a shutdown request is received.
+    :param six.string_types address: path of the Unix socket on which the server listens
+    """
+    server = create_server(address)
+    print("dr2xml daemon listening on %s" % str(server.server_address))
+    sys.stdout.flush()
+    try:
+        while not server.stop:
+            server.handle_request()
+    finally:
+        server.server_close()
+
+
+def submit_job(address, job, cwd=None, timeout=None, **kwargs):
+    """
+    Submit a job to a dr2xml daemon and wait for its response.
+    :param six.string_types address: path of the Unix socket on which the server listens
+    :param six.string_types job: name of the job, among daemon_jobs, "status" and "shutdown"
+    :param six.string_types cwd: directory in which the job is run (default: the current directory)
+    :param float timeout: timeout of the connection in seconds
+    :param kwargs: arguments of the job (lset, sset, context, year...)
+    :return: the response of the server
+    """
+    if cwd is None:
+        cwd = os.getcwd()
+    request = encode_value(OrderedDict([("job", job), ("cwd", cwd), ("kwargs", kwargs)]))
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(timeout)
+    sock.connect(address)
+    try:
+        sock.sendall((json.dumps(request) + "\n").encode("utf-8"))
+        with sock.makefile("rb") as response_file:
+            response = response_file.readline()
+    finally:
+        sock.close()
+    if len(response) == 0:
+        raise Dr2xmlError("No response from dr2xml daemon at %s" % str(address))
+    return json.loads(response.decode("utf-8"), object_pairs_hook=OrderedDict)
@@ -8,10 +8,14 @@ Interface between the CMIP6 Data Request and dr2xml.
 
 from __future__ import print_function, division, absolute_import, unicode_literals
 
+import bisect
 import copy
+import os
+import pickle
 import re
 import sys
-from collections import OrderedDict, defaultdict
+import types
+from collections import OrderedDict, defaultdict, namedtuple
 
 import six
 
@@ -21,7 +25,8 @@ from .definition import DataRequest as DataRequestBasic
 from .definition import SimpleObject
 from .definition import SimpleDim as SimpleDimBasic
 from .definition import SimpleCMORVar as SimpleCMORVarBasic
-from ..utils import Dr2xmlError, print_struct, is_elt_applicable, convert_string_to_year
+from ..utils import Dr2xmlError, print_struct, is_elt_applicable, convert_string_to_year, get_cache_directory, \
+    hash_content, read_pickle_content, write_pickle_content
 from dr2xml.settings_interface import get_settings_values
 
 data_request_path = get_settings_values("internal", "data_request_path")
@@ -72,15 +77,119 @@ class Scope(ScopeBasic):
         return self.scope.varsByRql(request_link, pmax)
 
 
+class RequestItemsYearsIndex(object):
+    """
+    Index of the requestItems which apply to an experiment.
+    For each requestItem, the years covered are stored as a list of intervals (first_year, last_year, endyear).
+    Those intervals are merged into a list of elementary years segments, each one associated to the requestItems
+    which are relevant for all of its years and their endyear, so that a year can be checked by a binary search.
+    """
+    def __init__(self):
+        self.intervals = OrderedDict()
+        self.errors = OrderedDict()
+        self.experiment_errors = OrderedDict()
+        self.bounds = list()
+        self.segments = list()
+
+    def add_requestitem(self, ri_id, intervals):
+        self.intervals[ri_id] = intervals
+
+    def add_error(self, ri_id, error):
+        self.errors[ri_id] = error
+
+    def add_experiment_error(self, ri_id, error):
+        self.experiment_errors[ri_id] = error
+
+    def build(self):
+        bounds = set()
+        for intervals in self.intervals.values():
+            for (first_year, last_year, _) in intervals:
+                if first_year is not None:
+                    bounds.add(first_year)
+                if last_year is not None:
+                    bounds.add(last_year + 1)
+        self.bounds = sorted(list(bounds))
+        # Segment i starts at bound i-1 (first segment has no lower bound) and ends before bound i
+        self.segments = list()
+        for segment_start in [None, ] + self.bounds:
+            segment = dict()
+            for (ri_id, intervals) in self.intervals.items():
+                for (first_year, last_year, endyear) in intervals:
+                    if segment_start is None:
+                        is_in_interval = first_year is None
+                    else:
+                        is_in_interval = (first_year is None or first_year <= segment_start) and \
+                                         (last_year is None or segment_start <= last_year)
+                    if is_in_interval:
+                        if ri_id not in segment:
+                            segment[ri_id] = endyear
+                        elif endyear is not None and segment[ri_id] is not None:
+                            segment[ri_id] = max(segment[ri_id], endyear)
+            self.segments.append(segment)
+
+    def applies(self, ri_id):
+        """
+        Returns True if requestItem applies to the experiment
+        """
+        if ri_id in self.experiment_errors:
+            raise self.experiment_errors[ri_id]
+        return ri_id in self.intervals or ri_id in self.errors
+
+    def get_relevant_requestitems(self, year):
+        """
+        Returns a dictionary of the requestItems relevant for year with their endyear
+        """
+        return self.segments[bisect.bisect_right(self.bounds, year)]
+
+    def check(self, ri_id, year):
+        """
+        Returns a couple : relevant, endyear.
+        """
+        if ri_id in self.experiment_errors:
+            raise self.experiment_errors[ri_id]
+        elif ri_id in self.errors:
+            raise self.errors[ri_id]
+        relevant_requestitems = self.get_relevant_requestitems(year)
+        if ri_id in relevant_requestitems:
+            return True, relevant_requestitems[ri_id]
+        else:
+            return False, None
+
+    @staticmethod
+    def check_year_in_intervals(intervals, year):
+        """
+        Returns a couple : relevant, endyear for a year and a list of intervals.
+        """
+        relevant = False
+        endyear = None
+        for (first_year, last_year, interval_endyear) in intervals:
+            if (first_year is None or first_year <= year) and (last_year is None or year <= last_year):
+                if not relevant or endyear is None or interval_endyear is None:
+                    endyear = interval_endyear
+                else:
+                    endyear = max(endyear, interval_endyear)
+                relevant = True
+        return relevant, endyear
+
+
 class DataRequest(DataRequestBasic):
 
+    def __init__(self, data_request=None, print_DR_errors=False, print_DR_stdname_errors=False):
+        super(DataRequest, self).__init__(data_request=data_request, print_DR_errors=print_DR_errors,
+                                          print_DR_stdname_errors=print_DR_stdname_errors)
+        self.cmor_vars_index = None
+        self.cmor_vars_cache = dict()
+        self.cmor_vars_cache_hits = 0
+        self.cmor_vars_cache_misses = 0
+        self.requestitems_years_indexes = dict()
+
     def get_version(self):
         return self.data_request.version
 
     def get_list_by_id(self, collection, elt_type=None, **kwargs):
         rep = self.data_request.coll[collection]
         if elt_type in ["variable", ]:
-            rep = [SimpleCMORVar.get_from_dr(elt, id=elt.uid) for elt in rep.items]
+            rep = [self.get_simple_cmor_var(elt, id=elt.uid) for elt in rep.items]
         return rep
 
     def get_sectors_list(self):
@@ -122,6 +231,39 @@ class DataRequest(DataRequestBasic):
                 rep.append(rl)
         return rep
 
+    def get_requestitems_years_index(self, experiment, filter_on_realization=False, realization_index=1,
+                                     branching=dict(), branch_year_in_child=None):
+        """
+        Get the index of the requestItems which apply to an experiment, giving for any year the requestItems
+        relevant that year and their end year.
+        The index is built once per Data Request load and set of parameters.
+        """
+        logger = get_logger()
+        key = (experiment, filter_on_realization, realization_index, repr(branching), branch_year_in_child)
+        if key not in self.requestitems_years_indexes:
+            logger.debug("Build requestItems years index for experiment %s" % experiment)
+            index = RequestItemsYearsIndex()
+            for ri in self.get_list_by_id("requestItem").items:
+                try:
+                    ri_applies = self.is_requestitem_for_experiment(ri, experiment, filter_on_realization,
+                                                                    realization_index)
+                except Exception as error:
+                    # Only raised if the requestItem is actually checked, whatever the year
+                    index.add_experiment_error(ri.uid, error)
+                    continue
+                if ri_applies:
+                    try:
+                        intervals = self.get_requestitem_years_intervals(ri, experiment, branching,
+                                                                         branch_year_in_child)
+                    except (Dr2xmlError, AttributeError, KeyError, TypeError, ValueError) as error:
+                        # Only raised if the requestItem is actually checked for a year
+                        index.add_error(ri.uid, error)
+                    else:
+                        index.add_requestitem(ri.uid, intervals)
+            index.build()
+            self.requestitems_years_indexes[key] = index
+        return self.requestitems_years_indexes[key]
+
     def check_requestitem_for_exp_and_year(self, ri, experiment, year, filter_on_realization=False, endyear=False,
                                            realization_index=1, branching=dict(), branch_year_in_child=None):
         """
@@ -134,11 +276,18 @@ class DataRequest(DataRequestBasic):
         # ENDYEAR is meaningful if RELEVANT is True, and is the
         #   last year in the timeslice (or None if timeslice ==
         #   the whole experiment duration)
+        index = self.get_requestitems_years_index(experiment, filter_on_realization, realization_index, branching,
+                                                  branch_year_in_child)
+        if year is None:
+            return index.applies(ri.uid), None
+        else:
+            return index.check(ri.uid, int(year))
 
+    def is_requestitem_for_experiment(self, ri, experiment, filter_on_realization=False, realization_index=1):
+        """
+        Returns True if requestItem 'ri' in data request applies to 'experiment' (and, if asked, to the realization)
+        """
         # Acces experiment or experiment group for the RequestItem
-        # if (ri.label=='C4mipC4mipLandt2') : debug=True
-        # if ri.title=='AerChemMIP, AERmon-3d, piControl' : debug=True
-        # if ri.title=='CFMIP, CFMIP.CFsubhr, amip' : debug=True
         logger = get_logger()
         logger.debug("In RIapplies.. Checking % 15s" % ri.title)
         item_exp = self.get_element_uid(ri.esid)
@@ -166,31 +315,10 @@ class DataRequest(DataRequestBasic):
                     ri_applies_to_experiment = True
         else:
             logger.debug("Error on esid link for ri: %s uid=%s %s" % (ri.title, ri.uid, item_exp._h.label))
-        # print "ri=%s"%ri.title,
-        # if year is not None :
-        #    print "Filtering for year %d"%year
         if filter_on_realization:
             if ri.nenmax != -1 and (realization_index > ri.nenmax):
                 ri_applies_to_experiment = False
-
-        if ri_applies_to_experiment:
-            logger.debug("Year considered: %s %s" % (year, type(year)))
-            if year is None:
-                rep = True
-                endyear = None
-                logger.debug(" ..applies because arg year is None")
-            else:
-                year = int(year)
-                rep, endyear = self.is_year_in_requestitem(ri, experiment, year, branching, branch_year_in_child,
-                                                           endyear)
-                logger.debug(" ..year in ri returns: %s %s" % (rep, endyear))
-                # if (ri.label=="AerchemmipAermonthly3d") :
-                #    print "reqItem=%s,experiment=%s,year=%d,rep=%s,"%(ri.label,experiment,year,rep)
-            # print " rep=",rep
-            return rep, endyear
-        else:
-            # print
-            return False, None
+        return ri_applies_to_experiment
 
     def is_year_in_requestitem(self, ri, exp, year, branching=dict(), branch_year_in_child=None, endyear=False):
         """
@@ -199,31 +327,39 @@ class DataRequest(DataRequestBasic):
         :param year: year to treat
         :return: a tuple which contains a boolean indicated whether the year has to be treated and the last year to treat
         """
+        intervals = self.get_requestitem_years_intervals(ri, exp, branching, branch_year_in_child)
+        return RequestItemsYearsIndex.check_year_in_intervals(intervals, year)
+
+    def get_requestitem_years_intervals(self, ri, exp, branching=dict(), branch_year_in_child=None):
+        """
+        :param ri: request item
+        :param exp: experiment
+        :return: the list of the years intervals (first_year, last_year, endyear) covered by the request item,
+                 first_year (resp. last_year) being None if the interval has no lower (resp. upper) bound
+        """
         logger = get_logger()
         exp_label, exp_startyear, exp_endyear = self.get_experiment_label_start_end_years(exp)
         if ri.label in ["CfmipCf3hrSimNew", ]:
-            return (year == 2008), 2008
+            return [(2008, 2008, 2008), ]
         if "HighResMIP, HighResMIP-6hrPlevExtr, amip" in ri.title:
-            return True, 2018
+            return [(None, None, 2018), ]
         if 'tslice' in ri.__dict__:
             logger.debug("calling year_in_ri_tslice")
-            rep, endyear = self.is_year_in_requestitem_tslice(ri, exp_label, exp_startyear, year, branching,
-                                                              branch_year_in_child)
-            return rep, endyear
+            return self.get_requestitem_tslice_years_intervals(ri, exp_label, exp_startyear, branching,
+                                                               branch_year_in_child)
         try:
             ny = int(ri.nymax)
         except:
-            logger.warning("Cannot tell if reqItem %s applies to year %d  (ny=%s) -> assumes yes" % (ri.title, year,
-                                                                                                     repr(ny)))
-            return True, None
+            logger.warning("Cannot tell if reqItem %s applies to years (ny=%s) -> assumes yes" %
+                           (ri.title, repr(ri.nymax)))
+            return [(None, None, None), ]
         #
         # From now, this the case of a RequestItem which starts from experiment's start
         actual_first_year = self.find_exp_start_year(exp_label, exp_startyear, branch_year_in_child)  # The start year, possibly fixed by the user
-        actual_end_year = self.find_exp_end_year(exp_endyear, endyear)  # = the end year requested by the user if any
         DR_first_year = convert_string_to_year(exp_startyear)
         DR_end_year = convert_string_to_year(exp_endyear)
-        logger.debug("year_in_ri: start DR: %s actual: %s | end DR: %s actual: %s | ny=%d" %
-                     (DR_first_year, actual_first_year, DR_end_year, actual_end_year, ny))
+        logger.debug("year_in_ri: start DR: %s actual: %s | end DR: %s | ny=%d" %
+                     (DR_first_year, actual_first_year, DR_end_year, ny))
         #
         ri_is_for_all_experiment = False
         if ny <= 0:
@@ -234,7 +370,7 @@ class DataRequest(DataRequestBasic):
                 ri_is_for_all_experiment = True
                 logger.debug("year_in_ri: RI applies because ny=end-start")
         if ri_is_for_all_experiment:
-            return True, None
+            return [(None, None, None), ]
         #
         # From now, we know that requestItem duration is less than experiment duration, or that
         # experiment duration is not known
@@ -245,9 +381,8 @@ class DataRequest(DataRequestBasic):
             logger.debug("year_in_ri: compensating ny for diff in first year")
         RI_end_year = actual_first_year + ny - 1
         # For these kind of requestItem of limited duration, no need to extend it, whatever the actual end date
-        applies = (year <= RI_end_year)
-        logger.debug("year_in_ri: returning %s %s" % (applies, RI_end_year))
-        return applies, RI_end_year
+        logger.debug("year_in_ri: returning %s" % RI_end_year)
+        return [(None, RI_end_year, RI_end_year), ]
 
     def is_year_in_requestitem_tslice(self, ri, exp_label, exp_startyear, year, branching=dict(),
                                       branch_year_in_child=None):
@@ -259,124 +394,135 @@ class DataRequest(DataRequestBasic):
           last year in the timeslice (or None if timeslice ==
           the whole experiment duration)
         """
+        intervals = self.get_requestitem_tslice_years_intervals(ri, exp_label, exp_startyear, branching,
+                                                                branch_year_in_child)
+        return RequestItemsYearsIndex.check_year_in_intervals(intervals, year)
+
+    def get_requestitem_tslice_years_intervals(self, ri, exp_label, exp_startyear, branching=dict(),
+                                               branch_year_in_child=None):
+        """
+        Returns the list of the years intervals (first_year, last_year, endyear) covered by the timeslice of
+        requestItem RI. ENDYEAR is the last year in the timeslice (or None if timeslice == the whole experiment
+        duration)
+        """
         logger = get_logger()
         if 'tslice' not in ri.__dict__:
             logger.debug("No tslice for reqItem %s -> OK for any year" % ri.title)
-            return True, None
+            return [(None, None, None), ]
         if ri.tslice in ['__unset__', ]:
             logger.debug("tslice is unset for reqItem %s " % ri.title)
-            return True, None
+            return [(None, None, None), ]
         #
-        relevant = False
-        endyear = None
+        rep = list()
         tslice = self.get_element_uid(ri.tslice)
         logger.debug("tslice label/type is %s/%s for reqItem %s " % (tslice.label, tslice.type, ri.title))
         if tslice.type in ["relativeRange", ]:  # e.g. _slice_abrupt30
             first_year = self.find_exp_start_year(exp_label, exp_startyear, branch_year_in_child=branch_year_in_child)
             # first_year = sset["branch_year_in_child"]
-            relevant = (year >= tslice.start + first_year - 1 and year <= tslice.end + first_year - 1)
-            endyear = first_year + tslice.end - 1
+            rep.append((tslice.start + first_year - 1, tslice.end + first_year - 1, first_year + tslice.end - 1))
         elif tslice.type in ["simpleRange", ]:  # e.g. _slice_DAMIP20
-            relevant = (year >= tslice.start and year <= tslice.end)
-            endyear = tslice.end
+            rep.append((tslice.start, tslice.end, tslice.end))
         elif tslice.type in ["sliceList", ]:  # e.g. _slice_DAMIP40
             for start in range(tslice.start, int(tslice.end - tslice.sliceLen + 2), int(tslice.step)):
-                if year >= start and year < start + tslice.sliceLen:
-                    relevant = True
-                    endyear = start + tslice.sliceLen - 1
+                rep.append((start, start + tslice.sliceLen - 1, start + tslice.sliceLen - 1))
         elif tslice.type in ["dayList", ]:  # e.g. _slice_RFMIP2
             # e.g. startList[i]: [1980, 1, 1, 1980, 4, 1, 1980, 7, 1, 1980, 10, 1, 1992, 1, 1, 1992, 4, 1]
-            years = [tslice.startList[3 * i] for i in range(len(tslice.startList) / 3)]
-            if year in years:
-                relevant = True
-                endyear = year
+            years = sorted(list(set([tslice.startList[3 * i] for i in range(len(tslice.startList) // 3)])))
+            for year in years:
+                rep.append((year, year, year))
         elif tslice.type in ["startRange", ]:  # e.g. _slice_VolMIP3
             # used only for VolMIP : _slice_VolMIP3
             start_year = self.find_exp_start_year(exp_label, exp_startyear, branch_year_in_child=branch_year_in_child)
-            relevant = (year >= start_year and year < start_year + nyear)
-            endyear = start_year + nyear - 1
+            nyear = int(tslice.nyears)
+            rep.append((start_year, start_year + nyear - 1, start_year + nyear - 1))
         elif tslice.type in ["monthlyClimatology", ]:  # e.g. _slice_clim20
-            relevant = (year >= tslice.start and year <= tslice.end)
-            endyear = tslice.end
+            rep.append((tslice.start, tslice.end, tslice.end))
         elif tslice.type in ["branchedYears", ]:  # e.g. _slice_piControl020
             if len(branching) == 0:
                 pass
             elif tslice.child in branching:
-                endyear = False
                 (refyear, starts) = branching[tslice.child]
                 for start in starts:
-                    if ((year - start >= tslice.start - refyear) and
-                            (year - start < tslice.start - refyear + tslice.nyears)):
-                        relevant = True
-                        lastyear = start + tslice.start - refyear + tslice.nyears - 1
-                        if endyear is False:
-                            endyear = lastyear
-                        else:
-                            endyear = max(endyear, lastyear)
-                        logger.debug(
-                            "slice OK: year=%d, start=%d tslice.start=%d refyear=%d tslice.nyears=%d lastyear=%d" %
-                            (year, start, tslice.start, refyear, tslice.nyears, lastyear))
+                    first_year = start + tslice.start - refyear
+                    lastyear = first_year + tslice.nyears - 1
+                    rep.append((first_year, lastyear, lastyear))
+                    logger.debug("slice: start=%d tslice.start=%d refyear=%d tslice.nyears=%d lastyear=%d" %
+                                 (start, tslice.start, refyear, tslice.nyears, lastyear))
             else:
                 raise Dr2xmlError("For tslice %s, child %s start year is not documented" % (tslice.title, tslice.child))
         else:
             raise Dr2xmlError("type %s for time slice %s is not handled" % (tslice.type, tslice.title))
-        logger.debug("for year %d and experiment %s, relevant is %s for tslice %s of type %s, endyear=%s" %
-                     (year, exp_label, repr(relevant), ri.title, tslice.type, repr(endyear)))
-        return relevant, endyear
+        logger.debug("for experiment %s, years intervals are %s for tslice %s of type %s" %
+                     (exp_label, repr(rep), ri.title, tslice.type))
+        return rep
 
     def get_requestitems_for_cmorvar(self, cmorvar_id, pmax, global_rls):
-        logger = get_logger()
+        return self.get_requestitems_for_cmorvars([cmorvar_id, ], pmax, global_rls)[cmorvar_id]
 
-        rVarsUid = self.get_request_by_id_by_sect(cmorvar_id, 'requestVar')
-        rVars = [self.get_element_uid(uid) for uid in rVarsUid
-                 if self.get_element_uid(uid).priority <= pmax]
-        logger.debug("les requestVars: %s" % " ".join([rVar.title for rVar in rVars]))
-        VarGroups = [self.get_element_uid(rv.vgid) for rv in rVars]
-        logger.debug("les requestVars groups: %s" % " ".join([rVg.label for rVg in VarGroups]))
-        RequestLinksId = list()
-        for vg in VarGroups:
-            RequestLinksId.extend(self.get_request_by_id_by_sect(vg.uid, 'requestLink'))
-        FilteredRequestLinks = list()
-        for rlid in RequestLinksId:
-            rl = self.get_element_uid(rlid)
-            if rl in global_rls:
-                FilteredRequestLinks.append(rl)
-        logger.debug("les requestlinks: %s" % " ".join([self.get_element_uid(rlid).label
-                                                        for rlid in RequestLinksId]))
-        logger.debug("les FilteredRequestlinks: %s" % " ".join([rl.label for rl in FilteredRequestLinks]))
-        RequestItems = list()
-        for rl in FilteredRequestLinks:
-            RequestItems.extend(self.get_request_by_id_by_sect(rl.uid, 'requestItem'))
-        logger.debug(
-            "les requestItems: %s" % " ".join([self.get_element_uid(riid).label for riid in RequestItems]))
-        return RequestItems
+    def get_requestitems_for_cmorvars(self, cmorvars_ids, pmax, global_rls):
+        """
+        Get the requestItems which apply to each CMORvar of a list through the request links of global_rls.
+        The request links and requestItems of a variables group are looked for only once.
+        :return: a dictionary CMORvar id -> list of requestItems ids
+        """
+        logger = get_logger()
+        global_rls_ids = set([rl.uid for rl in global_rls])
+        vargroups_requestitems = dict()
+        rep = OrderedDict()
+        for cmorvar_id in cmorvars_ids:
+            rVarsUid = self.get_request_by_id_by_sect(cmorvar_id, 'requestVar')
+            rVars = [self.get_element_uid(uid) for uid in rVarsUid
+                     if self.get_element_uid(uid).priority <= pmax]
+            logger.debug("les requestVars: %s" % " ".join([rVar.title for rVar in rVars]))
+            RequestItems = list()
+            for rv in rVars:
+                if rv.vgid not in vargroups_requestitems:
+                    RequestLinksId = self.get_request_by_id_by_sect(rv.vgid, 'requestLink')
+                    logger.debug("les requestlinks: %s" % " ".join([self.get_element_uid(rlid).label
+                                                                    for rlid in RequestLinksId]))
+                    vargroup_requestitems = list()
+                    for rlid in [rlid for rlid in RequestLinksId if rlid in global_rls_ids]:
+                        vargroup_requestitems.extend(self.get_request_by_id_by_sect(rlid, 'requestItem'))
+                    vargroups_requestitems[rv.vgid] = vargroup_requestitems
+                RequestItems.extend(vargroups_requestitems[rv.vgid])
+            logger.debug(
+                "les requestItems: %s" % " ".join([self.get_element_uid(riid).label for riid in RequestItems]))
+            rep[cmorvar_id] = RequestItems
+        return rep
 
     def get_endyear_for_cmorvar(self, cmorvar, experiment, year, internal_dict, global_rls):
+        return self.get_endyear_for_cmorvars([cmorvar, ], experiment, year, internal_dict, global_rls)[cmorvar.id]
+
+    def get_endyear_for_cmorvars(self, cmorvars, experiment, year, internal_dict, global_rls):
         logger = get_logger()
-        logger.debug("In end_year for %s %s" % (cmorvar.label, cmorvar.mipTable))
-        # 1- Get the RequestItems which apply to CmorVar
-        request_items = self.get_requestitems_for_cmorvar(cmorvar.id, internal_dict["max_priority"], global_rls)
+        # 1- Get the RequestItems which apply to each CmorVar
+        cmorvars_ids = list(OrderedDict([(cmorvar.id, None) for cmorvar in cmorvars]))
+        request_items = self.get_requestitems_for_cmorvars(cmorvars_ids, internal_dict["max_priority"], global_rls)
 
         # 2- Select those request links which include expt and year
-        larger = None
-        for riid in request_items:
-            ri = self.get_element_uid(riid)
-            applies, endyear = self.check_requestitem_for_exp_and_year(ri, experiment, year,
-                                                                       internal_dict["filter_on_realization"],
-                                                                       internal_dict["end_year"],
-                                                                       internal_dict["realization_index"],
-                                                                       internal_dict["branching"],
-                                                                       internal_dict["branch_year_in_child"])
-            logger.debug("For var and freq selected for debug and year %s, for ri %s, applies=%s, endyear=%s" %
-                         (str(year), ri.title, str(applies), str(endyear)))
-            if applies:
-                if endyear is None:
-                    return None  # One of the timeslices cover the whole expt
-                if larger is None:
-                    larger = endyear
-                else:
-                    larger = max(larger, endyear)
-        return larger
+        rep = OrderedDict()
+        for cmorvar_id in cmorvars_ids:
+            larger = None
+            for riid in request_items[cmorvar_id]:
+                ri = self.get_element_uid(riid)
+                applies, endyear = self.check_requestitem_for_exp_and_year(ri, experiment, year,
+                                                                           internal_dict["filter_on_realization"],
+                                                                           internal_dict["end_year"],
+                                                                           internal_dict["realization_index"],
+                                                                           internal_dict["branching"],
+                                                                           internal_dict["branch_year_in_child"])
+                logger.debug("For var %s and year %s, for ri %s, applies=%s, endyear=%s" %
+                             (cmorvar_id, str(year), ri.title, str(applies), str(endyear)))
+                if applies:
+                    if endyear is None:
+                        larger = None  # One of the timeslices cover the whole expt
+                        break
+                    if larger is None:
+                        larger = endyear
+                    else:
+                        larger = max(larger, endyear)
+            rep[cmorvar_id] = larger
+        return rep
 
     def get_element_uid(self, id=None, error_msg=None, raise_on_error=False, check_print_DR_errors=True,
                         check_print_stdnames_error=False, elt_type=None, **kwargs):
@@ -397,17 +543,98 @@ class DataRequest(DataRequestBasic):
             rep = None
         if rep is not None:
             if elt_type in ["variable", ]:
-                rep = SimpleCMORVar.get_from_dr(rep, id=id, **kwargs)
+                rep = self.get_simple_cmor_var(rep, id=id, **kwargs)
             elif elt_type in ["dim", ]:
                 rep = SimpleDim.get_from_dr(rep, id=id)
         return rep
 
+    def get_simple_cmor_var(self, input_var, id=None, sn_issues=None, allow_pseudo=False, mip_list=list(), **kwargs):
+        """
+        Convert a CMORvar of the Data Request into a SimpleCMORVar.
+        Conversions are cached for the whole life of the Data Request: the cached object is never given to the caller,
+        which receives its own copy and can thus modify it freely.
+        """
+        if id in self.cmor_vars_cache:
+            self.cmor_vars_cache_hits += 1
+            cmvar, cmvar_sn_issues = self.cmor_vars_cache[id]
+        else:
+            self.cmor_vars_cache_misses += 1
+            cmvar_sn_issues = dict()
+            cmvar = SimpleCMORVar.get_from_dr(input_var, id=id, sn_issues=cmvar_sn_issues, allow_pseudo=True,
+                                              **kwargs)
+            self.cmor_vars_cache[id] = (cmvar, cmvar_sn_issues)
+        rep = copy.copy(cmvar)
+        rep.sdims = copy.deepcopy(cmvar.sdims)
+        # Standard name issues are only found for pseudo standard names
+        if len(cmvar_sn_issues) > 0 and not allow_pseudo:
+            rep.set_attributes(stdname="")
+        if sn_issues is not None:
+            for (label, tables) in cmvar_sn_issues.items():
+                if rep.stdname not in sn_issues:
+                    sn_issues[label] = set(tables)
+        if len(mip_list) > 0:
+            rep.Priority = self.get_cmor_var_priority(input_var, mip_list)
+        return rep
+
+    def get_cmor_var_priority(self, input_var, mip_list=list()):
+        """
+        Get the priority of a CMORvar of the Data Request: the highest priority (i.e. the lowest value) among the
+        requestVars of the mips of mip_list which refer to it, and the default priority of the CMORvar otherwise.
+        """
+        priority = input_var.defaultPriority
+        if len(mip_list) > 0:
+            rv_ids = self.get_request_by_id_by_sect(input_var.uid, 'requestVar')
+            for rv_id in rv_ids:
+                rv = self.get_element_uid(rv_id)
+                vg = self.get_element_uid(rv.vgid)
+                if vg.mip in mip_list:
+                    if rv.priority < priority:
+                        priority = rv.priority
+        return priority
+
+    def get_cmor_vars_cache_stats(self):
+        """
+        Get the statistics of the CMOR variables conversion cache.
+        :return: number of hits, number of misses and hit rate of the cache
+        """
+        nb_calls = self.cmor_vars_cache_hits + self.cmor_vars_cache_misses
+        if nb_calls > 0:
+            hit_rate = self.cmor_vars_cache_hits / nb_calls
+        else:
+            hit_rate = 0.
+        return self.cmor_vars_cache_hits, self.cmor_vars_cache_misses, hit_rate
+
     def get_request_by_id_by_sect(self, id, request):
         return self.data_request.inx.iref_by_sect[id].a[request]
 
     def get_cmor_var_id_by_label(self, label):
         return self.data_request.inx.CMORvar.label[label]
 
+    def get_cmor_vars_index(self):
+        """
+        Get the inverse index (label, mipTable) -> uid of the CMOR variables of the Data Request.
+        The index is built once per Data Request load; if several CMOR variables share the same label and table,
+        the first one is kept.
+        """
+        if self.cmor_vars_index is None:
+            self.cmor_vars_index = dict()
+            for cmvar in self.data_request.coll["CMORvar"].items:
+                table = self.get_element_uid(cmvar.mtid, check_print_DR_errors=False)
+                if table is not None:
+                    table = table.label
+                else:
+                    table = cmvar.mipTable
+                if (cmvar.label, table) not in self.cmor_vars_index:
+                    self.cmor_vars_index[(cmvar.label, table)] = cmvar.uid
+        return self.cmor_vars_index
+
+    def get_cmor_var_by_label_and_table(self, label, table):
+        cmvar_id = self.get_cmor_vars_index().get((label, table), None)
+        if cmvar_id is None:
+            return None
+        else:
+            return self.get_element_uid(cmvar_id, elt_type="variable")
+
     def get_dimensions_dict(self):
         rep = OrderedDict()
         for sshp in self.get_list_by_id('spatialShape').items:
@@ -491,10 +718,89 @@ scope = None
 data_request = None
 
 
+def _rebuild_dreq_class(name, bases):
+    return type(name, bases, dict())
+
+
+def _set_dreq_class_state(cls, state):
+    for (key, value) in state.items():
+        setattr(cls, key, value)
+    return cls
+
+
+def _dropped_dreq_function():
+    return None
+
+
+class DreqPickler(pickle.Pickler):
+    """
+    Pickler able to serialize the loaded Data Request.
+    dreqPy builds one class per section at load time (and namedtuples for the section definitions), which can not be
+    found back by name by the standard pickler: they are serialized through their name, bases and attributes.
+    Local functions (only used by dreqPy for html rendering) are dropped.
+    """
+    def reducer_override(self, obj):
+        if isinstance(obj, types.FunctionType) and "<locals>" in obj.__qualname__:
+            return _dropped_dreq_function, tuple()
+        elif isinstance(obj, (staticmethod, classmethod)):
+            return type(obj), (obj.__func__,)
+        elif isinstance(obj, type) and obj.__module__ == dreq.__name__ and getattr(dreq, obj.__name__, None) is not obj:
+            if issubclass(obj, tuple) and hasattr(obj, "_fields"):
+                return namedtuple, (obj.__name__, obj._fields)
+            else:
+                state = dict([(key, value) for (key, value) in obj.__dict__.items()
+                              if key not in ["__dict__", "__weakref__", "__module__", "__qualname__", "__doc__"]])
+                return _rebuild_dreq_class, (obj.__name__, obj.__bases__), state, None, None, _set_dreq_class_state
+        return NotImplemented
+
+
+def get_data_request_snapshot_filename():
+    """
+    Get the name of the file containing the snapshot of the loaded Data Request.
+    The name depends on dreqPy version and location and on the content of the Data Request files, so that any change
+    of those invalidates the snapshot.
+    :return: the name of the snapshot file or None if persistent cache is disabled
+    """
+    cache_directory = get_cache_directory("data_request")
+    if cache_directory is not None:
+        dr_directory = os.path.dirname(dreq.defaultManifestPath)
+        dr_files = sorted([os.path.join(dr_directory, f) for f in os.listdir(dr_directory)
+                           if os.path.splitext(f)[1] in [".xml", ".txt", ".csv"]])
+        key = hash_content(dr_files, dreq.version, os.path.abspath(dreq.__file__), sys.version_info[0:2])
+        return os.path.join(cache_directory, "CMIP6_{}_{}.pkl".format(dreq.version, key))
+
+
+def load_data_request():
+    """
+    Load the CMIP6 Data Request, using the snapshot of a previous load if it exists.
+    :return: the dreqPy loaded Data Request
+    """
+    logger = get_logger()
+    try:
+        snapshot_filename = get_data_request_snapshot_filename()
+    except (OSError, IOError) as e:
+        logger.warning("Could not determine Data Request snapshot file: %s" % str(e))
+        snapshot_filename = None
+    rep = None
+    if snapshot_filename is not None:
+        rep = read_pickle_content(snapshot_filename)
+    if rep is not None:
+        logger.debug("Data Request loaded from snapshot %s" % snapshot_filename)
+        # Class attributes set by dreqPy while loading
+        dreq.dreqItemBase._inx = rep.inx
+        dreq.dreqItemBase._indexInitialised = True
+    else:
+        rep = dreq.loadDreq()
+        if snapshot_filename is not None and write_pickle_content(snapshot_filename, rep, pickler=DreqPickler):
+            logger.debug("Data Request snapshot written in %s" % snapshot_filename)
+    return rep
+
+
 def initialize_data_request():
     global data_request
     if data_request is None:
-        data_request = DataRequest(data_request=dreq.loadDreq(), print_DR_errors=True, print_DR_stdname_errors=False)
+        data_request = DataRequest(data_request=load_data_request(), print_DR_errors=True,
+                                   print_DR_stdname_errors=False)
     return data_request
 
 
@@ -700,15 +1006,7 @@ class SimpleCMORVar(SimpleCMORVarBasic):
         input_var_dict["sdims"] = copy.deepcopy(sdims_dict)
         if product_of_other_dims >1:
             input_var_dict["other_dims_size"] = product_of_other_dims
-        priority = input_var.defaultPriority
-        if len(mip_list) > 0:
-            rv_ids = data_request.get_request_by_id_by_sect(input_var.uid, 'requestVar')
-            for rv_id in rv_ids:
-                rv = data_request.get_element_uid(rv_id)
-                vg = data_request.get_element_uid(rv.vgid)
-                if vg.mip in mip_list:
-                    if rv.priority < priority:
-                        priority = rv.priority
+        priority = data_request.get_cmor_var_priority(input_var, mip_list)
         input_var_dict["units"] = mipvar.units
         input_var_dict["stdname"] = stdname
         input_var_dict["spatial_shp"] = spatial_shp
@@ -84,12 +84,29 @@ class DataRequest(object):
         """
         raise NotImplementedError()
 
+    def get_cmor_var_by_label_and_table(self, label, table):
+        """
+        Get the CMOR var corresponding to label in table, None if there is none.
+        """
+        rep = [cmvar for cmvar in self.get_list_by_id("CMORvar", elt_type="variable")
+               if cmvar.mipTable == table and cmvar.label == label]
+        if len(rep) > 0:
+            return rep[0]
+        else:
+            return None
+
     def get_element_uid(self, id=None, **kwargs):
         """
         Get the uid of an element if precised, else the list of all elements.
         """
         raise NotImplementedError()
 
+    def get_cmor_vars_cache_stats(self):
+        """
+        Get the number of hits, the number of misses and the hit rate of the CMOR variables conversion cache.
+        """
+        return 0, 0, 0.
+
     def get_request_by_id_by_sect(self, id, request):
         """
         Get the attribute request of the element id.
@@ -129,6 +146,9 @@ class DataRequest(object):
     def get_endyear_for_cmorvar(self, **kwargs):
         return None
 
+    def get_endyear_for_cmorvars(self, cmorvars, **kwargs):
+        return dict([(cmorvar.id, None) for cmorvar in cmorvars])
+
     @staticmethod
     def find_exp_start_year(exp_label, exp_startyear, branch_year_in_child=None):
         """
@@ -0,0 +1,266 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Tools to report the changes of the file_def of a context between two runs.
+A fingerprint is recorded for each file element of the file_def, which covers its content and the content of the
+definitions (fields, grids, domains, axis, scalars) it refers to, together with a hash of the inputs it was written
+from. On the next run, the fingerprints are compared to find which files changed and a summary of the changes is
+written in a json file. The file_def itself is always generated in full: it is only kept as is on disk (and its
+modification time is preserved) if its new content is identical to the previous one.
+"""
+
+from __future__ import print_function, division, absolute_import, unicode_literals
+
+import filecmp
+import hashlib
+import os
+import re
+from collections import OrderedDict
+
+# Logger
+from logger import get_logger
+
+# Utilities
+from .utils import read_json_content, write_json_content, hash_content, decode_if_needed
+
+# Global variables and configuration tools
+from .config import get_config_variable
+
+# XML tools
+from .xml_interface import create_pretty_xml_doc, is_xml_element_to_parse
+
+
+#: Attributes which refer to a definition and the kind of the definition referred to
+references_attributes = OrderedDict([("field_ref", "field"), ("grid_ref", "grid"), ("domain_ref", "domain"),
+                                     ("axis_ref", "axis"), ("scalar_ref", "scalar")])
+
+#: Pattern of the references to fields in the expressions
+expr_reference_pattern = re.compile(r"@(\w+)")
+
+
+def get_fingerprints_filename(filename):
+    """
+    Get the name of the file which contains the fingerprints of the files of a file_def.
+    :param filename: name of the file_def
+    :return: name of the fingerprints file
+    """
+    return os.path.splitext(filename)[0] + "_fingerprints.json"
+
+
+def get_changes_filename(filename):
+    """
+    Get the name of the file which contains the summary of the changes of a file_def.
+    :param filename: name of the file_def
+    :return: name of the changes summary file
+    """
+    return os.path.splitext(filename)[0] + "_changes.json"
+
+
+def hash_file_inputs(file_dict, attributes=list()):
+    """
+    Compute a hash of the inputs used to write a file element: the variables it contains and the parameters of the
+    file.
+    :param file_dict: dictionary of the arguments of write_xios_file_def_for_svars_list
+    :param attributes: additional file-level attributes
+    :return: the hexadecimal digest of the inputs
+    """
+    args = list()
+    for key in sorted(list(file_dict)):
+        if key in ["vars_list", ]:
+            args.append(sorted([(svar.label, svar.mipTable, svar.frequency, svar.spatial_shp, svar.cell_methods)
+                                for svar in file_dict[key]]))
+        else:
+            args.append((key, file_dict[key]))
+    args.append(sorted(list(attributes)))
+    return hash_content(list(), *args)
+
+
+def get_file_key(xml_file, rank):
+    """
+    Get the key used to identify a file element between two runs.
+    :param xml_file: file element
+    :param rank: rank of the file element in the file_definition
+    :return: the id of the file, else its name, else its rank
+    """
+    if "id" in xml_file.attrib:
+        return xml_file.attrib["id"]
+    elif "name" in xml_file.attrib:
+        return xml_file.attrib["name"]
+    else:
+        return "file_%d" % rank
+
+
+def get_files_keys(xml_file_definition):
+    """
+    Get the keys of the file elements of a file_definition.
+    :param xml_file_definition: file_definition element
+    :return: list of the couples (key, file element), the rank used in the keys being the one among the file elements
+    """
+    return [(get_file_key(xml_file, rank), xml_file) for (rank, xml_file) in
+            enumerate([elt for elt in xml_file_definition if is_xml_element_to_parse(elt) and elt.tag in ["file", ]])]
+
+
+def index_definitions(xml_element, index=None):
+    """
+    Index the definitions of an element and of its children by kind and id.
+    :param xml_element: element to index
+    :param index: dictionary to fill
+    :return: dictionary of the definitions: (kind, id) -> element
+    """
+    if index is None:
+        index = dict()
+    for child in xml_element:
+        if is_xml_element_to_parse(child):
+            if "id" in child.attrib:
+                index[(child.tag, child.attrib["id"])] = child
+            index_definitions(child, index)
+    return index
+
+
+def find_references(xml_element):
+    """
+    Find the definitions referred to by an element and its children.
+    :param xml_element: element to analyse
+    :return: list of (kind, id) of the definitions referred to
+    """
+    rep = list()
+    for (attribute, kind) in references_attributes.items():
+        if attribute in xml_element.attrib:
+            rep.append((kind, xml_element.attrib[attribute]))
+    if xml_element.tag in ["field", ] and xml_element.text is not None:
+        rep.extend([("field", ref) for ref in expr_reference_pattern.findall(xml_element.text)])
+    for child in xml_element:
+        if is_xml_element_to_parse(child):
+            rep.extend(find_references(child))
+    return rep
+
+
+def compute_file_fingerprint(xml_file, definitions_index):
+    """
+    Compute the fingerprint of a file element, which depends on its content and on the content of the definitions it
+    refers to, directly or not.
+    :param xml_file: file element
+    :param definitions_index: index of the definitions of the file_def
+    :return: the hexadecimal digest of the fingerprint
+    """
+    rep = hashlib.sha1()
+    rep.update(decode_if_needed(xml_file.dump()).encode("utf-8"))
+    to_visit = find_references(xml_file)
+    visited = set()
+    while len(to_visit) > 0:
+        ref = to_visit.pop(0)
+        if ref not in visited and ref in definitions_index:
+            visited.add(ref)
+            definition = definitions_index[ref]
+            rep.update(decode_if_needed(definition.dump()).encode("utf-8"))
+            to_visit.extend(find_references(definition))
+    return rep.hexdigest()
+
+
+def compute_files_fingerprints(xml_context, files_inputs=dict()):
+    """
+    Compute the fingerprints of all the files of a file_def.
+    :param xml_context: context element of the file_def
+    :param files_inputs: dictionary of the hash of the inputs of each file
+    :return: ordered dictionary: file key -> dictionary with the fingerprint and the inputs of the file
+    """
+    definitions_index = index_definitions(xml_context)
+    rep = OrderedDict()
+    for xml_file_definition in [elt for elt in xml_context if is_xml_element_to_parse(elt) and
+                                elt.tag in ["file_definition", ]]:
+        for (key, xml_file) in get_files_keys(xml_file_definition):
+            rep[key] = OrderedDict([("fingerprint", compute_file_fingerprint(xml_file, definitions_index)),
+                                    ("inputs", files_inputs.get(key))])
+    return rep
+
+
+def read_fingerprints(filename):
+    """
+    Read the fingerprints recorded when the file_def was last written. They are ignored if the file_def has been
+    modified since.
+    :param filename: name of the file_def
+    :return: the fingerprints read or None
+    """
+    logger = get_logger()
+    fingerprints_filename = get_fingerprints_filename(filename)
+    if os.path.isfile(filename) and os.path.isfile(fingerprints_filename):
+        try:
+            fingerprints = read_json_content(fingerprints_filename)
+        except ValueError:
+            logger.warning("Could not read fingerprints file %s, it is ignored" % fingerprints_filename)
+            return None
+        if fingerprints.get("version") == get_config_variable("version") and \
+                fingerprints.get("file_def_hash") == hash_content([filename, ]):
+            return fingerprints
+        else:
+            logger.info("Fingerprints file %s does not correspond to file_def %s, it is ignored" %
+                        (fingerprints_filename, filename))
+    return None
+
+
+def compare_fingerprints(old_files, new_files):
+    """
+    Compare the fingerprints of two versions of a file_def.
+    :param old_files: fingerprints of the files of the previous version
+    :param new_files: fingerprints of the files of the new version
+    :return: ordered dictionary with the list of the unchanged, changed, added and removed files and of the files
+             whose inputs changed
+    """
+    rep = OrderedDict([("unchanged", list()), ("changed", list()), ("added", list()), ("removed", list()),
+                       ("inputs_changed", list())])
+    for (key, new_file) in new_files.items():
+        if key not in old_files:
+            rep["added"].append(key)
+        else:
+            old_file = old_files[key]
+            inputs_changed = old_file["inputs"] != new_file["inputs"]
+            if inputs_changed:
+                rep["inputs_changed"].append(key)
+            if inputs_changed or old_file["fingerprint"] != new_file["fingerprint"]:
+                rep["changed"].append(key)
+            else:
+                rep["unchanged"].append(key)
+    rep["removed"] = [key for key in old_files if key not in new_files]
+    return rep
+
+
+def write_file_def_with_changes_report(xml_context, filename, context, files_inputs=dict()):
+    """
+    Write a file_def, unless its content is identical to the one written by the last run, and write the fingerprints
+    of its files and the summary of the changes.
+    :param xml_context: context element of the file_def
+    :param filename: name of the file_def
+    :param context: name of the context
+    :param files_inputs: dictionary of the hash of the inputs of each file
+    :return: the summary of the changes
+    """
+    logger = get_logger()
+    old_fingerprints = read_fingerprints(filename)
+    if old_fingerprints is None:
+        old_files = OrderedDict()
+    else:
+        old_files = old_fingerprints["files"]
+    new_files = compute_files_fingerprints(xml_context, files_inputs)
+    changes = compare_fingerprints(old_files, new_files)
+    # Write the file_def in a temporary file, which replaces the previous one only if the content changed
+    tmp_filename = filename + ".tmp"
+    try:
+        create_pretty_xml_doc(xml_element=xml_context, filename=tmp_filename)
+        rewritten = not os.path.isfile(filename) or not filecmp.cmp(tmp_filename, filename, shallow=False)
+        if rewritten:
+            os.replace(tmp_filename, filename)
+    finally:
+        if os.path.isfile(tmp_filename):
+            os.remove(tmp_filename)
+    summary = OrderedDict([("context", context), ("file_def", filename), ("rewritten", rewritten),
+                           ("previous_fingerprints_found", old_fingerprints is not None)])
+    summary.update(changes)
+    write_json_content(get_fingerprints_filename(filename),
+                       OrderedDict([("version", get_config_variable("version")),
+                                    ("file_def_hash", hash_content([filename, ])), ("files", new_files)]))
+    write_json_content(get_changes_filename(filename), summary)
+    logger.info("Changes of file_def %s: %d unchanged, %d changed, %d added and %d removed files, %s" %
+                (filename, len(changes["unchanged"]), len(changes["changed"]), len(changes["added"]),
+                 len(changes["removed"]), "rewritten" if rewritten else "previous file_def kept"))
+    return summary
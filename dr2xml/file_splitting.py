@@ -43,10 +43,10 @@ def read_splitfreqs():
                 # Keep smallest factor for each variable label
                 if table not in splitfreqs[varlabel]:
                     splitfreqs[varlabel][table] = freq
-            set_config_variable("splitfreqs", splitfreqs)
+            set_config_variable("splitfreqs", splitfreqs, copy_value=False)
         except:
             splitfreqs = False
-            set_config_variable("splitfreqs", splitfreqs)
+            set_config_variable("splitfreqs", splitfreqs, copy_value=False)
 
 
 def read_compression_factors():
@@ -73,10 +73,10 @@ def read_compression_factors():
                 if table not in compression_factor[varlabel] or \
                         compression_factor[varlabel][table] > factor:
                     compression_factor[varlabel][table] = factor
-            set_config_variable("compression_factor", compression_factor)
+            set_config_variable("compression_factor", compression_factor, copy_value=False)
         except:
             compression_factor = False
-            set_config_variable("compression_factor", compression_factor)
+            set_config_variable("compression_factor", compression_factor, copy_value=False)
             return
 
 
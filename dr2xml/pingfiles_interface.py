@@ -22,7 +22,7 @@ from logger import get_logger
 
 # Global variables and configuration tools
 from .config import get_config_variable, add_value_in_dict_config_variable, set_config_variable, \
-    add_value_in_list_config_variable
+    add_value_in_list_config_variable, PingVariables
 
 # Interface to xml tools
 from .xml_interface import get_root_of_xml_file, DR2XMLElement, DR2XMLComment, parse_xml_file, create_pretty_xml_doc
@@ -33,10 +33,10 @@ def read_pingfiles_variables(pingfiles, dummies):
     Read variables defined in the ping files.
     """
     logger = get_logger()
-    pingvars = list()
+    pingvars = PingVariables()
     all_ping_refs = OrderedDict()
     if pingfiles is not None:
-        all_pingvars = list()
+        all_pingvars = PingVariables()
         # print "pingfiles=",pingfiles
         for pingfile in pingfiles.split():
             ping_refs = read_xml_elmt_or_attrib(pingfile, tag='field', attrib='field_ref')
@@ -48,7 +48,7 @@ def read_pingfiles_variables(pingfiles, dummies):
             if dummies == "include":
                 pingvars = list(ping_refs)
             else:
-                pingvars = [v for v in ping_refs if 'dummy' not in ping_refs[v]]
+                pingvars = PingVariables([v for v in ping_refs if 'dummy' not in ping_refs[v]])
                 if dummies == "forbid":
                     if len(pingvars) != len(ping_refs):
                         for v in ping_refs:
@@ -65,8 +65,8 @@ def read_pingfiles_variables(pingfiles, dummies):
                     sys.exit(1)
             all_pingvars.extend(pingvars)
         pingvars = all_pingvars
-    set_config_variable("pingvars", pingvars)
-    set_config_variable("ping_refs", all_ping_refs)
+    set_config_variable("pingvars", pingvars, copy_value=False)
+    set_config_variable("ping_refs", all_ping_refs, copy_value=False)
 
 
 def read_xml_elmt_or_attrib(filename, tag='field', attrib=None):
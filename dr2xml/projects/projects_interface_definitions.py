@@ -15,7 +15,7 @@ import six
 from dr2xml.config import get_config_variable
 from dr2xml.settings_interface.py_settings_interface import format_dict_for_printing, is_key_in_lset, \
     get_variable_from_lset_without_default, is_key_in_sset, get_variable_from_sset_without_default
-from dr2xml.utils import Dr2xmlError, read_json_content
+from dr2xml.utils import Dr2xmlError, read_json_content, get_json_content_value
 from logger import get_logger
 
 
@@ -123,6 +123,8 @@ def determine_value(key_type=None, keys=list(), func=None, fmt=None, src=None, c
             if found:
                 if not isinstance(src, six.string_types):
                     raise TypeError("src must be a string or a ValueSettings")
+                elif all(isinstance(key, (six.string_types, int)) for key in keys):
+                    i_keys, found, value = get_json_content_value(src, keys)
                 else:
                     value = read_json_content(src)
             else:
@@ -194,6 +196,85 @@ def determine_value(key_type=None, keys=list(), func=None, fmt=None, src=None, c
     return found, value
 
 
+def is_constant_value(value):
+    """
+    Check whether a value of the settings does not depend on the element it is evaluated for, i.e. whether it can be
+    determined only from the common and internal settings, the laboratory and simulation settings and json files,
+    which do not change during a run.
+    :param value: the value to check
+    :return: a boolean
+    """
+    if isinstance(value, Settings):
+        return value.is_constant()
+    elif isinstance(value, (list, tuple, set)):
+        return all(is_constant_value(elt) for elt in value)
+    elif isinstance(value, (dict, OrderedDict)):
+        return all(is_constant_value(key) and is_constant_value(value[key]) for key in value)
+    else:
+        return True
+
+
+def get_value_dependencies(value, key_type):
+    """
+    Find the keys of the settings of kind key_type (e.g. internal or common) needed to evaluate a value.
+    :param value: the value to check
+    :param key_type: the kind of the settings
+    :return: a set of keys
+    """
+    rep = set()
+    if isinstance(value, Settings):
+        rep = value.get_dependencies(key_type)
+    elif isinstance(value, (list, tuple, set)):
+        for elt in value:
+            rep |= get_value_dependencies(elt, key_type)
+    elif isinstance(value, (dict, OrderedDict)):
+        for key in value:
+            rep |= get_value_dependencies(key, key_type)
+            rep |= get_value_dependencies(value[key], key_type)
+    return rep
+
+
+#: Regular expressions already compiled, by pattern
+compiled_regexps = dict()
+
+
+def compile_regexp(pattern):
+    """
+    Compile a regular expression, only once for each pattern.
+    :param pattern: the pattern of the regular expression
+    :return: the compiled regular expression
+    """
+    if pattern not in compiled_regexps:
+        compiled_regexps[pattern] = re.compile(pattern)
+    return compiled_regexps[pattern]
+
+
+def check_eq(check_value, reference_values):
+    return check_value in reference_values
+
+
+def check_neq(check_value, reference_values):
+    return check_value not in reference_values
+
+
+def check_match(check_value, reference_values):
+    check_value = str(check_value)
+    return all(compile_regexp(val).match(check_value) is not None for val in reference_values)
+
+
+def check_nmatch(check_value, reference_values):
+    check_value = str(check_value)
+    return not any(compile_regexp(val).match(check_value) is not None for val in reference_values)
+
+
+def check_unknown(check_value, reference_values):
+    return False
+
+
+#: Functions used to check conditions, by operator
+check_functions = dict(eq=check_eq, neq=check_neq, match=check_match, nmatch=check_nmatch)
+
+
 class Settings(object):
 
     def __init__(self, *args, **kwargs):
@@ -216,7 +297,7 @@ class Settings(object):
 
     def __str__(self):
         return "%s(%s)" % (type(self).__name__, {key: value for (key, value) in self.__dict__.items()
-                                                 if key not in ["updated", ]}.__repr__())
+                                                 if key not in ["updated", ] and not key.startswith("_")}.__repr__())
 
     def __repr__(self):
         return self.__str__()
@@ -224,6 +305,12 @@ class Settings(object):
     def dump_doc(self, force_void=False):
         raise NotImplementedError("Dump documentation is not implemented for class %s" % type(self))
 
+    def is_constant(self):
+        return False
+
+    def get_dependencies(self, key_type):
+        return set()
+
     def dump_doc_inner(self, value, force_void=False, format_struct=True, remove_new_lines=False):
         if isinstance(value, Settings):
             rep = value.dump_doc(force_void=force_void)
@@ -293,6 +380,18 @@ class ValueSettings(Settings):
         if "keys" in self.updated and not isinstance(self.keys, list):
             self.keys = [self.keys, ]
 
+    def is_constant(self):
+        return self.key_type in [None, "common", "internal", "laboratory", "simulation", "json", "combine"] and \
+            self.func is None and is_constant_value(self.keys) and is_constant_value(self.src) and \
+            is_constant_value(self.fmt)
+
+    def get_dependencies(self, key_type):
+        rep = get_value_dependencies(self.keys, key_type) | get_value_dependencies(self.src, key_type) | \
+            get_value_dependencies(self.fmt, key_type) | get_value_dependencies(self.func, key_type)
+        if self.key_type == key_type and len(self.keys) > 0 and isinstance(self.keys[0], six.string_types):
+            rep.add(self.keys[0])
+        return rep
+
     def dump_doc(self, force_void=False):
         rep = list()
         tmp_rep = ""
@@ -387,6 +486,16 @@ class ParameterSettings(Settings):
             self.updated.add("is_default")
         if isinstance(self.authorized_types, list) and len(self.authorized_types) == 1:
             self.authorized_types = self.authorized_types[0]
+        self._forbidden_regexps = [compile_regexp(pattern) for pattern in self.forbidden_patterns]
+
+    def is_constant(self):
+        return all(is_constant_value(self.__getattribute__(elt))
+                   for elt in ["skip_values", "forbidden_patterns", "conditions", "default_values", "cases",
+                               "authorized_values", "corrections"])
+
+    def get_dependencies(self, key_type):
+        return get_value_dependencies([self.skip_values, self.conditions, self.default_values, self.cases,
+                                       self.authorized_values, self.corrections], key_type)
 
     def update(self, other):
         super(ParameterSettings, self).update(other)
@@ -396,6 +505,8 @@ class ParameterSettings(Settings):
             else:
                 self.__setattr__(elt, other.__getattribute__(elt))
             self.updated.add(elt)
+        if "forbidden_patterns" in other.updated:
+            self._forbidden_regexps = [compile_regexp(pattern) for pattern in self.forbidden_patterns]
 
     def check_value(self, value, internal_dict=dict(), common_dict=dict(), additional_dict=dict(),
                     allow_additional_keytypes=True):
@@ -440,8 +551,9 @@ class ParameterSettings(Settings):
                 authorized_values = None
             if authorized_values is not None:
                 test = relevant and value in authorized_values
-        if test:
-            test = not (any([re.compile(pattern).match(str(value)) for pattern in self.forbidden_patterns]))
+        if test and len(self._forbidden_regexps) > 0:
+            value_string = str(value)
+            test = not any(regexp.match(value_string) for regexp in self._forbidden_regexps)
         return relevant, test
 
     def correct_value(self, value, internal_values=dict(), common_values=dict(), additional_dict=dict(),
@@ -578,6 +690,9 @@ class FunctionSettings(Settings):
         self.func = func
         self.options = options
 
+    def get_dependencies(self, key_type):
+        return get_value_dependencies(self.options, key_type)
+
     def dump_doc(self, force_void=False):
         rep = list()
         tmp_rep = self.func.__name__ + "(%s)"
@@ -590,18 +705,17 @@ class FunctionSettings(Settings):
                  allow_additional_keytypes=True):
         logger = get_logger()
         test = True
+        options = dict()
         for key in sorted(list(self.options)):
             key_test, val = return_value(self.options[key], common_dict=common_dict, internal_dict=internal_dict,
                                          additional_dict=additional_dict,
                                          allow_additional_keytypes=allow_additional_keytypes)
             if key_test:
-                self.options[key] = val
-            else:
-                del self.options[key]
+                options[key] = val
         try:
-            value = self.func(*args, **self.options)
+            value = self.func(*args, **options)
         except BaseException as e:
-            logger.debug("Issue calling %s with arguments %s and options %s" % (str(self.func), str(args), str(self.options)))
+            logger.debug("Issue calling %s with arguments %s and options %s" % (str(self.func), str(args), str(options)))
             value = None
             test = False
         return test, value
@@ -615,6 +729,17 @@ class ConditionSettings(Settings):
         if not isinstance(reference_values, list):
             reference_values = [reference_values, ]
         self.reference_values = reference_values
+        self._check_function = check_functions.get(check_to_do, check_unknown)
+        if check_to_do in ["match", "nmatch"]:
+            for reference_value in [val for val in reference_values if isinstance(val, six.string_types)]:
+                compile_regexp(reference_value)
+
+    def is_constant(self):
+        return is_constant_value(self.check_value) and is_constant_value(self.reference_values)
+
+    def get_dependencies(self, key_type):
+        return get_value_dependencies(self.check_value, key_type) | get_value_dependencies(self.reference_values,
+                                                                                            key_type)
 
     def dump_doc(self, force_void=False):
         rep = list()
@@ -656,16 +781,7 @@ class ConditionSettings(Settings):
             relevant = all([elt[0] for elt in reference_values])
             if relevant:
                 reference_values = [elt[1] for elt in reference_values]
-                if self.check_to_do in ["eq", ]:
-                    test = check_value in reference_values
-                elif self.check_to_do in ["neq", ]:
-                    test = check_value not in reference_values
-                elif self.check_to_do in ["match", ]:
-                    test = all([re.compile(val).match(str(check_value)) is not None for val in reference_values])
-                elif self.check_to_do in ["nmatch", ]:
-                    test = not(any([re.compile(val).match(str(check_value)) is not None for val in reference_values]))
-                else:
-                    ValueError("Conditions can have 'eq' or 'neq' as operator, found: %s" % self.check_to_do)
+                test = self._check_function(check_value, reference_values)
         elif len(self.reference_values) == 0 and self.check_to_do in ["eq", ]:
             test = True
             relevant = True
@@ -680,6 +796,12 @@ class CaseSettings(Settings):
         self.conditions = conditions
         self.value = value
 
+    def is_constant(self):
+        return is_constant_value(self.conditions) and is_constant_value(self.value)
+
+    def get_dependencies(self, key_type):
+        return get_value_dependencies(self.conditions, key_type) | get_value_dependencies(self.value, key_type)
+
     def dump_doc(self, force_void=False):
         rep = list()
         rep.append("   Case:")
@@ -30,6 +30,8 @@ def initialize_settings(lset=None, sset=None, force_reset=False, **kwargs):
         internal_settings = None
         common_settings = None
         project_settings = None
+        from dr2xml.vars_interface.home_data_request import homevars_cache
+        homevars_cache.clear()
     # Initialize python settings dictionaries
     from .py_settings_interface import initialize_dict
     initialize_dict(new_lset=lset, new_sset=sset)
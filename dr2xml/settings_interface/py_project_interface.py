@@ -7,11 +7,13 @@ Interface to project settings from dr2xml
 from __future__ import print_function, division, absolute_import, unicode_literals
 
 import os
+from collections import OrderedDict
 from importlib.machinery import SourceFileLoader
 
 from .py_settings_interface import get_variable_from_lset_with_default_in_lset, get_variable_from_lset_with_default, \
     get_variable_from_lset_without_default
 from dr2xml.projects.projects_interface_definitions import ParameterSettings
+from logger import get_logger
 
 
 def initialize_project_settings(dirname, doc_writer=False):
@@ -124,6 +126,7 @@ def read_project_settings(filename):
 
 def solve_values(values, internal_dict=dict(), common_dict=dict(), additional_dict=dict(),
                  allow_additional_keytypes=True):
+    logger = get_logger()
     if values in ["internal", ]:
         args_dict = dict(common_dict=common_dict, additional_dict=additional_dict, raise_on_error=False,
                          allow_additional_keytypes=allow_additional_keytypes)
@@ -136,32 +139,104 @@ def solve_values(values, internal_dict=dict(), common_dict=dict(), additional_di
         current_dict = common_dict
     else:
         raise ValueError("Could not solve values for setting %s" % values)
+    for item in sorted(list(current_dict)):
+        if not isinstance(current_dict[item], ParameterSettings):
+            raise TypeError("Can only treat ParameterSettings type objects, not %s." % type(current_dict[item]))
+    # Build the dependency graph between the values and evaluate each of them once, after its dependencies
+    dependencies = OrderedDict([(item, sorted(list(current_dict[item].get_dependencies(values))))
+                                for item in sorted(list(current_dict))])
+    sorted_items, cyclic_items = sort_dependencies(values, dependencies)
+    # The values which are in a cycle of dependencies or depend on such values are evaluated after the other ones
+    in_cycles = set()
+    for item in sorted_items:
+        if item in cyclic_items or any([dep in in_cycles for dep in dependencies[item]]):
+            in_cycles.add(item)
     rep = dict()
-    items_to_treat = sorted(list(current_dict))
+    for item in [item for item in sorted_items if item not in in_cycles]:
+        found, value = current_dict[item].find_value(**{dict_name: rep}, **args_dict)
+        if found:
+            rep[item] = value
+            del current_dict[item]
+    # The cycles may only go through cases or conditions which are not used: the values concerned are evaluated
+    # iteratively until no more value can be evaluated
+    items_to_treat = sorted([item for item in current_dict if item in in_cycles])
     test = True
     while len(items_to_treat) > 0 and test:
         for item in items_to_treat:
-            val = current_dict[item]
-            if isinstance(val, ParameterSettings):
-                found, value = val.find_value(**{dict_name: rep}, **args_dict)
-                if found:
-                    rep[item] = value
-                    del current_dict[item]
-            else:
-                raise TypeError("Can only treat ParameterSettings type objects, not %s." % type(val))
-        test = len(current_dict) < len(items_to_treat)
-        items_to_treat = sorted(list(current_dict))
-    if not test:
-        for item in items_to_treat:
-            if not current_dict[item].fatal:
+            found, value = current_dict[item].find_value(**{dict_name: rep}, **args_dict)
+            if found:
+                rep[item] = value
                 del current_dict[item]
-        items_to_treat = sorted(list(current_dict))
-        test = len(items_to_treat) == 0
-    if not test:
-        raise ValueError("Could not evaluate all %s values: the following are missing %s" % (values, items_to_treat))
+        remaining_items = [item for item in items_to_treat if item in current_dict]
+        test = len(remaining_items) < len(items_to_treat)
+        items_to_treat = remaining_items
+    for item in [item for item in sorted(list(current_dict)) if not current_dict[item].fatal]:
+        logger.debug("Could not evaluate %s value %s (dependencies: %s)" %
+                     (values, item, " -> ".join(find_missing_dependencies_chain(item, dependencies, rep))))
+        del current_dict[item]
+    items_to_treat = sorted(list(current_dict))
+    if len(items_to_treat) > 0:
+        chains = [" -> ".join(find_missing_dependencies_chain(item, dependencies, rep)) for item in items_to_treat]
+        raise ValueError("Could not evaluate all %s values: the following are missing %s (dependencies: %s)" %
+                         (values, items_to_treat, ", ".join(chains)))
     return rep
 
 
+def sort_dependencies(values, dependencies):
+    """
+    Sort the values topologically so that each value comes after the ones it depends on. The dependencies which close a
+    cycle are ignored for the sort, and the values of the cycles are returned separately.
+    :param values: kind of the values sorted (for log messages)
+    :param dependencies: dictionary containing for each value the list of the values it depends on
+    :return: the list of the values sorted and the set of the values which are in a cycle of dependencies
+    """
+    logger = get_logger()
+    rep = list()
+    cyclic = set()
+    done = set()
+    for item in dependencies:
+        if item not in done:
+            # Depth-first search with an explicit stack of (value, rank of the next dependency to visit)
+            stack = [[item, 0], ]
+            on_stack = set([item, ])
+            while len(stack) > 0:
+                frame = stack[-1]
+                current_item, rank = frame
+                if rank < len(dependencies[current_item]):
+                    frame[1] += 1
+                    dep = dependencies[current_item][rank]
+                    if dep in on_stack:
+                        chain = [elt[0] for elt in stack]
+                        chain = chain[chain.index(dep):] + [dep, ]
+                        logger.debug("Cycle in the dependencies of %s values: %s" % (values, " -> ".join(chain)))
+                        cyclic.update(chain)
+                    elif dep not in done and dep in dependencies:
+                        stack.append([dep, 0])
+                        on_stack.add(dep)
+                else:
+                    stack.pop()
+                    on_stack.remove(current_item)
+                    done.add(current_item)
+                    rep.append(current_item)
+    return rep, cyclic
+
+
+def find_missing_dependencies_chain(item, dependencies, solved):
+    """
+    Find the chain of dependencies which explains why a value could not be evaluated.
+    :param item: the value not evaluated
+    :param dependencies: dictionary containing for each value the list of the values it depends on
+    :param solved: the values evaluated
+    :return: the list of the values of the chain, beginning with item
+    """
+    chain = [item, ]
+    missing = [dep for dep in dependencies.get(item, list()) if dep not in solved]
+    while len(missing) > 0 and missing[0] not in chain:
+        chain.append(missing[0])
+        missing = [dep for dep in dependencies.get(missing[0], list()) if dep not in solved]
+    return chain
+
+
 def solve_settings(settings):
     for tag in settings:
         settings[tag].complete_and_clean()
@@ -8,9 +8,13 @@ Several tools used in dr2xml.
 from __future__ import print_function, division, absolute_import, unicode_literals
 
 import copy
+import glob
+import hashlib
 import json
 import os
+import pickle
 import sys
+import tempfile
 from collections import OrderedDict
 from functools import reduce
 
@@ -133,17 +137,97 @@ def reduce_and_strip(elt):
     return elt
 
 
+#: Parsed json files, indexed by absolute path, associated with the stat of the file when it was read
+_json_files_cache = dict()
+#: Values found in the parsed json files, indexed by the stat of the file and the keys followed
+_json_values_cache = dict()
+
+
+def _get_json_file_stat(filename):
+    """
+    Get the elements used to determine whether a json file changed since it was read.
+    :param filename: name of the json file
+    :return: a tuple (absolute path, modification time, size) or None if the file does not exist
+    """
+    filename = os.path.abspath(filename)
+    try:
+        file_stat = os.stat(filename)
+    except OSError:
+        return None
+    return filename, file_stat.st_mtime_ns, file_stat.st_size
+
+
+def clear_json_files_cache():
+    """
+    Clear the cache of the parsed json files and of the values found in them.
+    """
+    _json_files_cache.clear()
+    _json_values_cache.clear()
+
+
 def read_json_content(filename):
+    """
+    Read the content of a json file. The parsed content is kept in cache as long as the file is not modified, so the
+    object returned is shared between the callers and must not be modified.
+    :param filename: name of the json file
+    :return: the content of the json file
+    """
     logger = get_logger()
-    if os.path.isfile(filename):
-        with open(filename) as fp:
-            content = json.load(fp)
-            return content
+    file_stat = _get_json_file_stat(filename)
+    if file_stat is not None and os.path.isfile(filename):
+        cached = _json_files_cache.get(file_stat[0])
+        if cached is None or cached[0] != file_stat:
+            with open(filename) as fp:
+                content = json.load(fp)
+            _json_files_cache[file_stat[0]] = (file_stat, content)
+        else:
+            content = cached[1]
+        return content
     else:
         logger.error("Could not find the json file at %s" % filename)
         raise OSError("Could not find the json file at %s" % filename)
 
 
+def get_json_content_value(filename, keys):
+    """
+    Follow some keys in the content of a json file. The values found are kept in cache as long as the file is not
+    modified.
+    Only the steps through dictionaries (key) and lists or strings (integer index) are followed: the browsing stops at
+    the first key which can not be followed this way.
+    :param filename: name of the json file
+    :param keys: list of the keys to follow
+    :return: a tuple (number of keys followed, found, value); found is False if a key is missing from a dictionary
+             or an index is out of range. The value is a copy which can be modified by the caller.
+    """
+    content = read_json_content(filename)
+    cache_key = (_json_files_cache[os.path.abspath(filename)][0], tuple(keys))
+    if cache_key not in _json_values_cache:
+        value = content
+        i_keys = 0
+        found = True
+        while found and i_keys < len(keys):
+            key = keys[i_keys]
+            if isinstance(value, (dict, OrderedDict)):
+                if key in value:
+                    value = value[key]
+                    i_keys += 1
+                else:
+                    found = False
+            elif isinstance(value, (tuple, list, six.string_types)):
+                if isinstance(key, int) and key < len(value):
+                    value = value[key]
+                    i_keys += 1
+                else:
+                    found = False
+            else:
+                break
+        _json_values_cache[cache_key] = (i_keys, found, value)
+    i_keys, found, value = _json_values_cache[cache_key]
+    if isinstance(value, (dict, list)):
+        value = copy.deepcopy(value)
+    return i_keys, found, value
+
+
 def format_json_before_writing(settings):
     if isinstance(settings, (dict, OrderedDict)):
         for key in list(settings):
@@ -161,6 +245,122 @@ def write_json_content(filename, settings):
         json.dump(format_json_before_writing(copy.deepcopy(settings)), fp)
 
 
+#: Maximum number of files kept in each persistent cache directory
+max_cache_files = 20
+
+
+def get_cache_directory(*subdirs):
+    """
+    Get the directory in which dr2xml stores its persistent caches, creating it if needed.
+    The root directory is taken from the environment variable DR2XML_CACHE_DIR (default ~/.cache/dr2xml).
+    Setting DR2XML_CACHE_DIR to an empty string or to "none" disables the persistent caches.
+    :param subdirs: sub-directories of the root cache directory
+    :return: the path of the cache directory or None if caching is disabled or impossible
+    """
+    root = os.environ.get("DR2XML_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "dr2xml"))
+    if root.strip().lower() in ["", "none"]:
+        return None
+    rep = os.path.join(root, *subdirs)
+    try:
+        if not os.path.isdir(rep):
+            os.makedirs(rep)
+    except OSError:
+        logger = get_logger()
+        logger.warning("Could not create cache directory %s, persistent cache is disabled" % rep)
+        rep = None
+    return rep
+
+
+def hash_content(filenames, *args):
+    """
+    Compute a hash of the content of a list of files and of some additional values.
+    :param filenames: list of the files to be hashed
+    :param args: additional values (converted to string) to be hashed
+    :return: the hexadecimal digest of the hash
+    """
+    rep = hashlib.sha1()
+    for filename in filenames:
+        rep.update(filename.encode("utf-8"))
+        with open(filename, "rb") as fp:
+            for block in iter(lambda: fp.read(1 << 20), b""):
+                rep.update(block)
+    for arg in args:
+        rep.update(str(arg).encode("utf-8"))
+    return rep.hexdigest()
+
+
+def read_pickle_content(filename):
+    """
+    Read the content of a pickle file.
+    :param filename: name of the pickle file
+    :return: the content of the file or None if it could not be read
+    """
+    logger = get_logger()
+    if os.path.isfile(filename):
+        try:
+            with open(filename, "rb") as fp:
+                rep = pickle.load(fp)
+        except Exception as e:
+            logger.warning("Could not read pickle file %s: %s" % (filename, str(e)))
+        else:
+            # Mark the file as recently used so that it is not pruned from its cache directory
+            try:
+                os.utime(filename, None)
+            except OSError:
+                pass
+            return rep
+    return None
+
+
+def write_pickle_content(filename, content, pickler=pickle.Pickler):
+    """
+    Write a pickle file. The file is first written in a temporary file which is then renamed, so that concurrent
+    readers never see a partial file.
+    :param filename: name of the pickle file
+    :param content: object to be written
+    :param pickler: pickler class to be used
+    :return: a boolean indicating whether the file has been written
+    """
+    logger = get_logger()
+    fd, tmp_filename = tempfile.mkstemp(dir=os.path.dirname(filename), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as fp:
+            pickler(fp, protocol=pickle.HIGHEST_PROTOCOL).dump(content)
+        os.replace(tmp_filename, filename)
+        prune_cache_directory(os.path.dirname(filename))
+        return True
+    except Exception as e:
+        logger.warning("Could not write pickle file %s: %s" % (filename, str(e)))
+        if os.path.isfile(tmp_filename):
+            os.remove(tmp_filename)
+        return False
+
+
+def prune_cache_directory(directory, max_files=None):
+    """
+    Remove the least recently used pickle files of a cache directory so that at most max_files of them are kept.
+    :param directory: the cache directory
+    :param max_files: the number of files kept (default: max_cache_files)
+    :return: the list of the files removed
+    """
+    if max_files is None:
+        max_files = max_cache_files
+    files_with_time = list()
+    for filename in glob.glob(os.path.join(directory, "*.pkl")):
+        try:
+            files_with_time.append((os.path.getmtime(filename), filename))
+        except OSError:
+            pass
+    rep = list()
+    for (_, filename) in sorted(files_with_time, reverse=True)[max_files:]:
+        try:
+            os.remove(filename)
+            rep.append(filename)
+        except OSError:
+            pass
+    return rep
+
+
 def is_elt_applicable(elt, attribute=None, included=None, excluded=None):
     if attribute is not None:
         if isinstance(elt, tuple):
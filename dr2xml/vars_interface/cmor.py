@@ -50,15 +50,9 @@ def check_cmor_variable(home_var, mip_vars_list, hv_info):
 def get_cmor_var(label, table):
     """
     Returns CMOR variable for a given label in a given table
-    (could be optimized using inverse index)
     """
     data_request = get_dr_object("get_data_request")
-    cmvar = [cmvar for cmvar in data_request.get_list_by_id("CMORvar", elt_type="variable")
-             if cmvar.mipTable == table and cmvar.label == label]
-    if len(cmvar) > 0:
-        return cmvar[0]
-    else:
-        return None
+    return data_request.get_cmor_var_by_label_and_table(label, table)
 
 
 def ping_alias(svar, error_on_fail=False):
@@ -44,7 +44,7 @@ def check_dev_variable(home_var, hv_info):
         if home_var.mipVarLabel is None:
             home_var.set_attributes(mipVarLabel=home_var.label)
         data_request = get_dr_object("get_data_request")
-        if any([cmvar.label == home_var.label for cmvar in data_request.get_list_by_id("CMORvar", elt_type="variable")]):
+        if len(data_request.get_cmor_var_id_by_label(home_var.label)) > 0:
             raise VarsError("Error: %s "
                             "HOMEVar is announced  as dev, is not a CMORVar, but has a cmor name. "
                             "=> Not taken into account." % hv_info)
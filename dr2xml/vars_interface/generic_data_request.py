@@ -154,6 +154,8 @@ def select_data_request_CMORvars_for_lab(sset=False, year=None):
         simplified_vars.append(svar)
     set_internal_value("sn_issues", sn_issues)
     logger.info('Number of simplified vars is: %d' % len(simplified_vars))
+    logger.debug("CMOR variables conversion cache: %d hits, %d misses (hit rate %.2f)" %
+                 data_request.get_cmor_vars_cache_stats())
     logger.info("Issues with standard names are: %s" % print_struct(sorted(list(sn_issues))))
 
     return simplified_vars
@@ -177,6 +179,18 @@ def endyear_for_CMORvar(cv, expt, year):
     return larger
 
 
+def endyear_for_CMORvars(cvs, expt, year):
+    """
+    Same as endyear_for_CMORvar for a list of CMORvars, in one pass which shares the lookups
+    of requestItems between the variables.
+    Returns a dictionary CMORvar id -> end year
+    """
+    internal_dict = get_settings_values("internal")
+    data_request = get_dr_object("get_data_request")
+    return data_request.get_endyear_for_cmorvars(cmorvars=cvs, experiment=expt, year=year, internal_dict=internal_dict,
+                                                 global_rls=get_settings_values("internal_values", "global_rls"))
+
+
 def decide_for_grids(cmvarid, grids):
     """
     Decide which set of grids a given variable should be produced on
@@ -7,10 +7,14 @@ Home data request tools
 
 from __future__ import print_function, division, absolute_import, unicode_literals
 
+import copy
+import logging
 import os
-from collections import defaultdict
+import sys
+from collections import defaultdict, OrderedDict
 
 from dr2xml.config import get_config_variable, set_config_variable
+from dr2xml.dr_interface import get_dr_object
 from logger import get_logger
 from dr2xml.settings_interface import get_settings_values
 from dr2xml.utils import VarsError
@@ -20,6 +24,80 @@ from .extra import read_home_var_extra, check_extra_variable
 from .perso import read_home_var_perso, check_perso_variable
 
 
+# Home variables already read (with the Data Request they were read with and the messages emitted while reading them),
+# indexed by the files they were read from, the filters, the settings applied and the log level
+homevars_cache = OrderedDict()
+
+
+class HomeVarsMessagesRecorder(logging.Handler):
+    """
+    Record the log records and the printouts emitted while reading home variables, so that they can be emitted again
+    when the home variables are taken from homevars_cache.
+    """
+
+    def __init__(self):
+        super(HomeVarsMessagesRecorder, self).__init__()
+        self.messages = list()
+        self.stdout = None
+
+    def emit(self, record):
+        self.messages.append(("log", record))
+
+    def write(self, text):
+        self.messages.append(("print", text))
+        return self.stdout.write(text)
+
+    def flush(self):
+        if self.stdout is not None:
+            self.stdout.flush()
+
+    def __enter__(self):
+        get_logger().addHandler(self)
+        self.stdout = sys.stdout
+        sys.stdout = self
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        sys.stdout = self.stdout
+        self.stdout = None
+        get_logger().removeHandler(self)
+
+
+def replay_home_vars_messages(messages):
+    """
+    Emit again the messages recorded by HomeVarsMessagesRecorder.
+    """
+    logger = get_logger()
+    for (kind, message) in messages:
+        if kind in ["log", ]:
+            logger.handle(message)
+        else:
+            sys.stdout.write(message)
+
+
+def get_homevars_cache_key(hmv_file, expid, mips, path_extra_tables=None):
+    """
+    Get the key of the home variables in homevars_cache. It contains the stat of the files from which they are read, so
+    that any change of those invalidates the cached home variables, the settings used while reading them and the
+    Data Request used.
+    """
+    files_list = [f for f in hmv_file.split(" ") if len(f) > 0]
+    if path_extra_tables is not None and os.path.isdir(path_extra_tables):
+        files_list.extend(sorted([os.path.join(path_extra_tables, f) for f in os.listdir(path_extra_tables)]))
+    files_stat = list()
+    for fil in files_list:
+        try:
+            file_stat = os.stat(fil)
+            files_stat.append((fil, file_stat.st_mtime_ns, file_stat.st_size))
+        except OSError:
+            files_stat.append((fil, None, None))
+    internal_dict = get_settings_values("internal")
+    settings = (str(internal_dict["perso_sdims_description"]), internal_dict["allow_pseudo_standard_names"])
+    data_request_version = (internal_dict["data_request_used"], get_dr_object("get_data_request").get_version())
+    return tuple(files_stat), expid, str(mips), path_extra_tables, settings, data_request_version, \
+        get_logger().getEffectiveLevel()
+
+
 def read_home_vars_list(hmv_file, expid, mips, path_extra_tables=None):
     """
     A function to get HOME variables that are not planned in the CMIP6 DataRequest but
@@ -35,7 +113,6 @@ def read_home_vars_list(hmv_file, expid, mips, path_extra_tables=None):
     Returns:
       A list of 'simplified CMOR variables'
     """
-    logger = get_logger()
     #
     homevars_list = get_config_variable("homevars_list")
     #
@@ -43,52 +120,70 @@ def read_home_vars_list(hmv_file, expid, mips, path_extra_tables=None):
         return list()
     elif homevars_list is not None:
         return homevars_list
+    cache_key = get_homevars_cache_key(hmv_file, expid, mips, path_extra_tables)
+    data_request = get_dr_object("get_data_request")
+    if cache_key in homevars_cache and homevars_cache[cache_key][0] is data_request:
+        replay_home_vars_messages(homevars_cache[cache_key][2])
+        homevars = copy.deepcopy(homevars_cache[cache_key][1])
+        set_config_variable("homevars_list", homevars, copy_value=False)
+        return homevars
     else:
-        data = list()
-        file_list = [f for f in hmv_file.split(" ") if len(f) > 0]
-        for fil in file_list:
-            if not os.path.exists(fil):
-                raise VarsError("Abort: file for home variables does not exist: %s" % fil)
-            else:
-                # Read file
-                with open(fil, "r") as fp:
-                    data.extend(fp.readlines())
-        data = [l.rstrip("\n\t ") for l in data if not l.startswith("#")]
-        data = [l for l in data if len(l) > 0]
-        # Build list of home variables
-        homevars = list()
-        extravars = list()
-        extra_vars_per_table = defaultdict(list)
-        for line in data:
-            line_split = line.split(";")
-            line_split = [elt.strip(" ").lstrip("\n\t").strip(" ") for elt in line_split]
-            line_split = [elt for elt in line_split if len(elt) > 0]
-            var_type = line_split[0]
-            if var_type in ["cmor", ]:
-                home_var = read_home_var_cmor(line_split, mips, expid)
-                if home_var is not None:
-                    homevars.append(home_var)
-            elif var_type in ["perso", ]:
-                home_var = read_home_var_perso(line_split, mips, expid)
-                if home_var is not None:
-                    homevars.append(home_var)
-            elif var_type in ["extra", ]:
-                home_var = read_home_var_extra(line_split, expid, mips, path_extra_tables=path_extra_tables,
-                                               extra_vars_per_table=extra_vars_per_table)
-                extravars.extend(home_var)
-            elif var_type in ["dev", ]:
-                home_var = read_home_var_dev(line_split, mips, expid)
-                if home_var is not None:
-                    homevars.append(home_var)
-            else:
-                raise ValueError("Unknown type for var: %s (%s)" % (var_type, line))
-        logger.info("Number of 'cmor', 'dev' and 'perso' among home variables: %d" % len(homevars))
-        logger.info("Number of 'extra' among home variables: %d" % len(extravars))
-        homevars.extend(extravars)
-        set_config_variable("homevars_list", homevars)
+        with HomeVarsMessagesRecorder() as recorder:
+            homevars = read_home_vars_file(hmv_file, expid, mips, path_extra_tables=path_extra_tables)
+        homevars_cache[cache_key] = (data_request, copy.deepcopy(homevars), recorder.messages)
+        set_config_variable("homevars_list", homevars, copy_value=False)
         return homevars
 
 
+def read_home_vars_file(hmv_file, expid, mips, path_extra_tables=None):
+    """
+    Read the HOME variables from the files of hmv_file.
+    """
+    logger = get_logger()
+    data = list()
+    file_list = [f for f in hmv_file.split(" ") if len(f) > 0]
+    for fil in file_list:
+        if not os.path.exists(fil):
+            raise VarsError("Abort: file for home variables does not exist: %s" % fil)
+        else:
+            # Read file
+            with open(fil, "r") as fp:
+                data.extend(fp.readlines())
+    data = [l.rstrip("\n\t ") for l in data if not l.startswith("#")]
+    data = [l for l in data if len(l) > 0]
+    # Build list of home variables
+    homevars = list()
+    extravars = list()
+    extra_vars_per_table = defaultdict(list)
+    for line in data:
+        line_split = line.split(";")
+        line_split = [elt.strip(" ").lstrip("\n\t").strip(" ") for elt in line_split]
+        line_split = [elt for elt in line_split if len(elt) > 0]
+        var_type = line_split[0]
+        if var_type in ["cmor", ]:
+            home_var = read_home_var_cmor(line_split, mips, expid)
+            if home_var is not None:
+                homevars.append(home_var)
+        elif var_type in ["perso", ]:
+            home_var = read_home_var_perso(line_split, mips, expid)
+            if home_var is not None:
+                homevars.append(home_var)
+        elif var_type in ["extra", ]:
+            home_var = read_home_var_extra(line_split, expid, mips, path_extra_tables=path_extra_tables,
+                                           extra_vars_per_table=extra_vars_per_table)
+            extravars.extend(home_var)
+        elif var_type in ["dev", ]:
+            home_var = read_home_var_dev(line_split, mips, expid)
+            if home_var is not None:
+                homevars.append(home_var)
+        else:
+            raise ValueError("Unknown type for var: %s (%s)" % (var_type, line))
+    logger.info("Number of 'cmor', 'dev' and 'perso' among home variables: %d" % len(homevars))
+    logger.info("Number of 'extra' among home variables: %d" % len(extravars))
+    homevars.extend(extravars)
+    return homevars
+
+
 def process_home_vars(mip_vars_list, mips, expid="False"):
     """
     Deal with home variables
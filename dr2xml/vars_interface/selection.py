@@ -16,9 +16,52 @@ from .generic_data_request import select_data_request_CMORvars_for_lab
 from .home_data_request import process_home_vars
 
 
+def get_variable_similarity_key(var):
+    """
+    Key of a variable such that two variables are similar (see test_variables_similar) if and only if they have the
+    same key.
+    """
+    return var.label, var.spatial_shp, var.frequency, var.cell_methods
+
+
+def get_variable_equality_key(var):
+    """
+    Key of a variable such that two variables are equal (see SimpleCMORVar.__eq__) if and only if they have the same
+    key.
+    """
+    return var.label, var.modeling_realm, var.frequency, var.mipTable, var.temporal_shp, var.spatial_shp
+
+
 def test_variables_similar(var_1, var_2):
-    return var_1.label == var_2.label and var_1.spatial_shp == var_2.spatial_shp and \
-           var_1.frequency == var_2.frequency and var_1.cell_methods == var_2.cell_methods
+    return get_variable_similarity_key(var_1) == get_variable_similarity_key(var_2)
+
+
+def group_variables_per_realm(mip_vars_list, allow_duplicates=False):
+    """
+    Group variables per realm, removing the duplicates and, unless allow_duplicates is True, the variables similar to
+    a variable already kept. The order of the variables is kept.
+    """
+    logger = get_logger()
+    svars_per_realm = defaultdict(list)
+    equality_keys_per_realm = defaultdict(set)
+    similarity_keys_per_realm = defaultdict(set)
+    for svar in mip_vars_list:
+        realm = svar.modeling_realm
+        equality_key = get_variable_equality_key(svar)
+        if equality_key not in equality_keys_per_realm[realm]:
+            similarity_key = get_variable_similarity_key(svar)
+            add = similarity_key not in similarity_keys_per_realm[realm]
+            # Settings may allow for duplicate var in two tables.
+            # In DR01.00.21, this actually applies to very few fields (ps-Aermon, tas-ImonAnt, areacellg)
+            if allow_duplicates or add:
+                svars_per_realm[realm].append(svar)
+                equality_keys_per_realm[realm].add(equality_key)
+                similarity_keys_per_realm[realm].add(similarity_key)
+            else:
+                logger.warning("Not adding duplicate %s (from %s) for realm %s" % (svar.label, svar.mipTable, realm))
+        else:
+            logger.warning("Duplicate svar %s %s" % (svar.label, svar.grids))
+    return svars_per_realm
 
 
 def check_exclusion(var, *exclusions):
@@ -50,19 +93,7 @@ def select_variables_to_be_processed(year, context, select):
     # --------------------------------------------------------------------
     mip_vars_list = gather_AllSimpleVars(year, select)
     # Group vars per realm
-    svars_per_realm = defaultdict(list)
-    for svar in mip_vars_list:
-        realm = svar.modeling_realm
-        if svar not in svars_per_realm[realm]:
-            add = not any([test_variables_similar(svar, ovar) for ovar in svars_per_realm[realm]])
-            # Settings may allow for duplicate var in two tables.
-            # In DR01.00.21, this actually applies to very few fields (ps-Aermon, tas-ImonAnt, areacellg)
-            if internal_dict['allow_duplicates'] or add:
-                svars_per_realm[realm].append(svar)
-            else:
-                logger.warning("Not adding duplicate %s (from %s) for realm %s" % (svar.label, svar.mipTable, realm))
-        else:
-            logger.warning("Duplicate svar %s %s" % (svar.label, svar.grid))
+    svars_per_realm = group_variables_per_realm(mip_vars_list, internal_dict['allow_duplicates'])
     logger.info("\nRealms for these CMORvars: %s" % " ".join(sorted(list(svars_per_realm))))
     #
     # --------------------------------------------------------------------
@@ -124,24 +155,35 @@ def select_variables_to_be_processed(year, context, select):
     return svars_per_table
 
 
-def gather_AllSimpleVars(year=False, select="on_expt_and_year"):
+def gather_data_request_vars(year=False, select="on_expt_and_year"):
     """
-    List of mip variables asked
+    List of mip variables asked by the Data Request
     :param year: year when the variables are created
     :param select: selection criteria
     :return: list of mip variables
     """
     logger = get_logger()
-    internal_dict = get_settings_values("internal")
     if select in ["on_expt_and_year", ""]:
-        mip_vars_list = select_data_request_CMORvars_for_lab(True, year)
+        return select_data_request_CMORvars_for_lab(True, year)
     elif select in ["on_expt", ]:
-        mip_vars_list = select_data_request_CMORvars_for_lab(True, None)
+        return select_data_request_CMORvars_for_lab(True, None)
     elif select in ["no", ]:
-        mip_vars_list = select_data_request_CMORvars_for_lab(False, None)
+        return select_data_request_CMORvars_for_lab(False, None)
     else:
         logger.error("Choice %s is not allowed for arg 'select'" % select)
         raise Dr2xmlError("Choice %s is not allowed for arg 'select'" % select)
+
+
+def gather_AllSimpleVars(year=False, select="on_expt_and_year"):
+    """
+    List of mip variables asked
+    :param year: year when the variables are created
+    :param select: selection criteria
+    :return: list of mip variables
+    """
+    logger = get_logger()
+    internal_dict = get_settings_values("internal")
+    mip_vars_list = gather_data_request_vars(year, select)
     #
     if internal_dict['listof_home_vars']:
         exp = internal_dict['experiment_for_requests']
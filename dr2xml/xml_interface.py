@@ -13,16 +13,84 @@ import six
 
 import xml_writer
 from .settings_interface import get_settings_values
-from .utils import reduce_and_strip, decode_if_needed
+from .utils import reduce_and_strip
 
 
 class DR2XMLComment(xml_writer.Comment):
+    __slots__ = ()
 
     def __init__(self, text):
         super(DR2XMLComment, self).__init__(comment=text)
 
 
+class DR2XMLElementTemplate(object):
+    """
+    Compiled version of the project settings of a tag, used to create DR2XMLElement without copying those settings.
+    The parameters that do not depend on the element created are evaluated only once.
+    """
+
+    def __init__(self, tag_settings, common_dict, internal_dict):
+        self.tag_settings = tag_settings
+        self.common_dict = common_dict
+        self.internal_dict = internal_dict
+        self.attrs = tuple((key, tag_settings.attrs_constraints[key], tag_settings.attrs_constraints[key].is_constant())
+                           for key in tag_settings.attrs_list)
+        self.comments = tuple((comment, tag_settings.comments_constraints[comment],
+                               tag_settings.comments_constraints[comment].is_constant())
+                              for comment in tag_settings.comments_list)
+        self.vars = tuple((var, tag_settings.vars_constraints[var], tag_settings.vars_constraints[var].is_constant())
+                          for var in tag_settings.vars_list)
+        self.constant_values = dict()
+
+    def is_valid(self, tag_settings, common_dict, internal_dict):
+        """
+        Check whether the template corresponds to the current settings.
+        """
+        return self.tag_settings is tag_settings and self.common_dict is common_dict and \
+            self.internal_dict is internal_dict
+
+    def find_value(self, kind, key, constraints, is_constant, kwargs):
+        """
+        Find the value of parameter key for an element created with arguments kwargs.
+        """
+        if is_constant and key not in kwargs:
+            cache_key = (kind, key)
+            if cache_key not in self.constant_values:
+                self.constant_values[cache_key] = constraints.find_value(is_value=False, value=None,
+                                                                         common_dict=self.common_dict,
+                                                                         internal_dict=self.internal_dict,
+                                                                         additional_dict=kwargs)
+            return self.constant_values[cache_key]
+        else:
+            return constraints.find_value(is_value=key in kwargs, value=kwargs.get(key), common_dict=self.common_dict,
+                                          internal_dict=self.internal_dict, additional_dict=kwargs)
+
+
+#: Templates used to create DR2XMLElement, by tag
+dr2xml_elements_templates = dict()
+
+#: Size of the buffer used to write xml files
+xml_write_buffer_size = 64 * 1024
+
+
+def get_dr2xml_element_template(tag):
+    """
+    Get the template used to create DR2XMLElement of a given tag, building it if needed.
+    :param tag: the tag of the element
+    :return: a DR2XMLElementTemplate
+    """
+    tag_settings = get_settings_values("project", tag)
+    common_dict = get_settings_values("common")
+    internal_dict = get_settings_values("internal")
+    template = dr2xml_elements_templates.get(tag)
+    if template is None or not template.is_valid(tag_settings, common_dict, internal_dict):
+        template = DR2XMLElementTemplate(tag_settings, common_dict, internal_dict)
+        dr2xml_elements_templates[tag] = template
+    return template
+
+
 class DR2XMLElement(xml_writer.Element):
+    __slots__ = ()
 
     def __init__(self, tag, **kwargs):
         default_tag = kwargs.get("default_tag", tag)
@@ -30,46 +98,28 @@ class DR2XMLElement(xml_writer.Element):
             text = kwargs.pop("text")
         else:
             text = None
-        tag_settings = get_settings_values("project", default_tag, must_copy=True)
-        attrs_list = tag_settings.attrs_list
-        attrs_constraints = tag_settings.attrs_constraints
+        template = get_dr2xml_element_template(default_tag)
         attrib = OrderedDict()
-        common_dict = get_settings_values("common")
-        internal_dict = get_settings_values("internal")
-        for key in attrs_list:
-            test, value = attrs_constraints[key].find_value(is_value=key in kwargs, value=kwargs.get(key),
-                                                            common_dict=common_dict, internal_dict=internal_dict,
-                                                            additional_dict=kwargs)
-            output_key = attrs_constraints[key].output_key
+        for (key, attr_constraints, is_constant) in template.attrs:
+            test, value = template.find_value("attrs", key, attr_constraints, is_constant, kwargs)
             if test:
-                attrib[output_key] = value
+                attrib[attr_constraints.output_key] = value
         super(DR2XMLElement, self).__init__(tag=tag, text=text, attrib=attrib)
-        comments_list = tag_settings.comments_list
-        comments_constraints = tag_settings.comments_constraints
-        for comment in comments_list:
-            test, value = comments_constraints[comment].find_value(is_value=comment in kwargs,
-                                                                   value=kwargs.get(comment),
-                                                                   common_dict=common_dict, internal_dict=internal_dict,
-                                                                   additional_dict=kwargs)
+        for (comment, comment_constraints, is_constant) in template.comments:
+            test, value = template.find_value("comments", comment, comment_constraints, is_constant, kwargs)
             if test:
                 self.append(DR2XMLComment(text=value))
-        vars_list = tag_settings.vars_list
-        vars_constraints = tag_settings.vars_constraints
-        for var in vars_list:
-            test, value = vars_constraints[var].find_value(is_value=var in kwargs, value=kwargs.get(var),
-                                                           common_dict=common_dict, internal_dict=internal_dict,
-                                                           additional_dict=kwargs)
-            output_key = vars_constraints[var].output_key
-            num_type = vars_constraints[var].num_type
+        for (var, var_constraints, is_constant) in template.vars:
+            test, value = template.find_value("vars", var, var_constraints, is_constant, kwargs)
             if test:
-                self.append(wrv(output_key, value, num_type))
+                self.append(wrv(var_constraints.output_key, value, var_constraints.num_type))
 
     def __copy__(self):
         """
 
         :return:
         """
-        element = type(self).__call__(tag=self.tag, text=self.text, **copy.deepcopy(self.attrib))
+        element = type(self).__call__(tag=self.tag, text=self.text, **self.attrib)
         element.update_level(self.level)
         for child in self.children:
             element.children.append(copy.copy(child))
@@ -94,6 +144,15 @@ def parse_xml_file(xml_file, follow_src=False, path_parse="./", dont_read=list()
     return xml_writer.xml_file_parser(xml_file, follow_src=follow_src, path_parse=path_parse, dont_read=dont_read)
 
 
+def get_xml_files_read(xml_file, follow_src=False, path_parse="./", dont_read=list()):
+    """
+
+    :param xml_file:
+    :return: the list of the files read when parsing xml_file
+    """
+    return xml_writer.get_xml_files_read(xml_file, follow_src=follow_src, path_parse=path_parse, dont_read=dont_read)
+
+
 def get_root_of_xml_file(xml_file, follow_src=False, path_parse="./", dont_read=list()):
     """
 
@@ -118,16 +177,18 @@ def create_header():
 
 def create_pretty_xml_doc(xml_element, filename):
     """
+    Write an xml element into a file, preceded by the xml header.
+    The element is written while walking through it, so that the text of the whole document is never built in memory.
 
     :param xml_element:
     :param filename:
     :return:
     """
-    with open(filename, "w", encoding="utf-8") as out:
+    with open(filename, "w", encoding="utf-8", buffering=xml_write_buffer_size) as out:
         xml_header = create_header()
-        out.write(decode_if_needed(xml_header.dump()))
+        xml_header.write(out)
         out.write("\n")
-        out.write(decode_if_needed(xml_element.dump()))
+        xml_element.write(out)
 
 
 def find_rank_xml_subelement(xml_element, tag=list(), not_tag=list(), **keyval):
@@ -0,0 +1,99 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Micro-benchmark of the evaluation of the conditions and of the checks of the parameters of a project settings.
+All the ConditionSettings and ParameterSettings of the project are evaluated several times against dictionaries which
+contain any key, and the number of evaluations per second is printed.
+"""
+
+from __future__ import print_function, division, absolute_import, unicode_literals
+
+import os
+import sys
+import time
+from argparse import ArgumentParser
+
+sys.path.append(os.path.abspath(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from logger import initialize_logger
+from dr2xml.projects.projects_interface_definitions import Settings, ParameterSettings, ConditionSettings, \
+	FunctionSettings
+from dr2xml.settings_interface.py_project_interface import merge_project_settings
+
+
+class AnyKeyDict(dict):
+	"""
+	Dictionary which contains any key, associated with the same value.
+	"""
+
+	def __init__(self, value):
+		super(AnyKeyDict, self).__init__()
+		self.value = value
+
+	def __contains__(self, item):
+		return True
+
+	def __getitem__(self, item):
+		return self.value
+
+	def get(self, item, default=None):
+		return self.value
+
+
+def find_settings(value, conditions, parameters):
+	if isinstance(value, ConditionSettings):
+		conditions.append(value)
+	elif isinstance(value, ParameterSettings):
+		parameters.append(value)
+	if isinstance(value, FunctionSettings):
+		find_settings(value.options, conditions, parameters)
+	elif isinstance(value, Settings):
+		for (key, val) in value.__dict__.items():
+			if key not in ["updated", "dict_default"] and not key.startswith("_"):
+				find_settings(val, conditions, parameters)
+	elif isinstance(value, (list, tuple, set)):
+		for val in value:
+			find_settings(val, conditions, parameters)
+	elif isinstance(value, dict):
+		for val in value.values():
+			find_settings(val, conditions, parameters)
+
+
+def run_benchmark(project, nb_loops, value):
+	_, internal_values, common_values, project_settings = merge_project_settings(project)
+	conditions = list()
+	parameters = list()
+	for settings in [internal_values, common_values, project_settings]:
+		find_settings(settings, conditions, parameters)
+	dict_values = AnyKeyDict(value)
+	kwargs = dict(internal_dict=dict_values, common_dict=dict_values, additional_dict=dict_values,
+	              allow_additional_keytypes=False)
+	time_init = time.time()
+	for _ in range(nb_loops):
+		for condition in conditions:
+			condition.check(**kwargs)
+	time_conditions = time.time() - time_init
+	time_init = time.time()
+	for _ in range(nb_loops):
+		for parameter in parameters:
+			parameter.check_value(value, **kwargs)
+	time_parameters = time.time() - time_init
+	print("%d conditions: %.3fs, %.0f evaluations/s" % (len(conditions), time_conditions,
+	                                                     nb_loops * len(conditions) / time_conditions))
+	print("%d parameters: %.3fs, %.0f evaluations/s" % (len(parameters), time_parameters,
+	                                                     nb_loops * len(parameters) / time_parameters))
+
+
+def parse_args():
+	parser = ArgumentParser()
+	parser.add_argument("--project", default="CMIP6", help="Project whose settings must be evaluated")
+	parser.add_argument("--loops", type=int, default=1000, help="Number of evaluations of each settings")
+	parser.add_argument("--value", default="CMIP6_tas", help="Value used for all the keys of the dictionaries")
+	return parser.parse_args()
+
+
+if __name__ == "__main__":
+	args = parse_args()
+	initialize_logger(default=True, level="critical")
+	run_benchmark(args.project, args.loops, args.value)
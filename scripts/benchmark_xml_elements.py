@@ -0,0 +1,143 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark of the xml_writer elements against their historical implementation (no slots, deep copies of the
+attributes, recursive update of the levels and lookup of the attributes in the parents).
+For each size, synthetic file_def-like trees are built from the leaves to the root, as dr2xml does, and the memory
+used by the tree, the time spent to build it, to copy it, to dump the attributes of all its elements and to look
+for an attribute of the root from all its leaves are printed for both implementations.
+"""
+
+from __future__ import print_function, division, absolute_import, unicode_literals
+
+import os
+import sys
+import time
+import tracemalloc
+from argparse import ArgumentParser
+from collections import OrderedDict
+from copy import copy, deepcopy
+
+sys.path.append(os.path.abspath(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from xml_writer.beacon import Beacon
+from xml_writer.element import Element
+
+
+class HistoricalElement(object):
+	"""
+	Historical implementation of xml_writer.element.Element, restricted to what is benchmarked.
+	"""
+
+	def __init__(self, tag, text=None, attrib=OrderedDict()):
+		self.tag = tag.strip()
+		self.level = 0
+		self.parent = None
+		self.text = text
+		self.attrib = deepcopy(attrib)
+		self.children = list()
+
+	def __len__(self):
+		return len(self.children)
+
+	def __copy__(self):
+		element = type(self).__call__(tag=self.tag, text=self.text, attrib=deepcopy(self.attrib))
+		element.update_level(self.level)
+		for child in self.children:
+			element.children.append(copy(child))
+		return element
+
+	def append(self, element):
+		element.update_level(self.level + 1)
+		element.parent = self
+		self.children.append(element)
+
+	def update_level(self, new_level):
+		if self.level != new_level:
+			self.level = new_level
+		for child in self.children:
+			child.update_level(new_level + 1)
+
+	def _dump_attrib(self, sort=False):
+		return Beacon.dump_dict(deepcopy(self.attrib), sort=sort)
+
+	def get_attrib(self, key, parent=True, use_default=False, default=None):
+		if key in self.attrib:
+			return self.attrib[key]
+		elif parent is True and self.parent is not None:
+			return self.parent.get_attrib(key, parent=parent, use_default=use_default, default=default)
+		elif use_default:
+			return default
+		else:
+			raise KeyError("Could not find a value for attribute %s" % key)
+
+
+def build_tree(element_class, nb_files, nb_fields):
+	root = element_class("context", attrib=OrderedDict([("id", "benchmark"), ("calendar", "gregorian")]))
+	file_definition = element_class("file_definition", attrib=OrderedDict([("type", "one_file")]))
+	for i in range(nb_files):
+		xml_file = element_class("file", attrib=OrderedDict([("id", "file_%d" % i), ("name", "name_%d" % i),
+		                                                     ("output_freq", "1mo"), ("split_freq", "10y")]))
+		for j in range(nb_fields):
+			field = element_class("field", attrib=OrderedDict([("id", "field_%d_%d" % (i, j)),
+			                                                   ("field_ref", "field_%d" % j), ("name", "tas"),
+			                                                   ("grid_ref", "grid_%d" % j), ("operation", "average")]))
+			field.append(element_class("variable", text="tas", attrib=OrderedDict([("name", "variable_id"),
+			                                                                         ("type", "string")])))
+			xml_file.append(field)
+		file_definition.append(xml_file)
+	root.append(file_definition)
+	return root
+
+
+def iterate_on_tree(element):
+	elements = [element, ]
+	while len(elements) > 0:
+		element = elements.pop()
+		yield element
+		elements.extend(element.children)
+
+
+def benchmark_one_class(element_class, nb_files, nb_fields):
+	tracemalloc.start()
+	time_init = time.time()
+	root = build_tree(element_class, nb_files, nb_fields)
+	time_build = time.time()
+	memory = tracemalloc.get_traced_memory()[0]
+	tracemalloc.stop()
+	time_copy_init = time.time()
+	copy(root)
+	time_copy = time.time()
+	elements = list(iterate_on_tree(root))
+	time_dump_init = time.time()
+	for element in elements:
+		element._dump_attrib()
+	time_dump = time.time()
+	for element in elements:
+		if len(element) == 0:
+			element.get_attrib("calendar")
+	time_lookup = time.time()
+	return len(elements), memory, time_build - time_init, time_copy - time_copy_init, time_dump - time_dump_init, \
+		time_lookup - time_dump
+
+
+def parse_args():
+	parser = ArgumentParser()
+	parser.add_argument("--sizes", nargs="+", type=int, default=[100, 1000, 5000],
+	                    help="Number of file elements of the synthetic trees")
+	parser.add_argument("--fields", type=int, default=20, help="Number of field elements per file element")
+	return parser.parse_args()
+
+
+if __name__ == "__main__":
+	args = parse_args()
+	print("%10s %18s %10s %12s %10s %10s %10s %10s" % ("elements", "class", "memory (MB)", "bytes/elt", "build (s)",
+	                                                   "copy (s)", "dump (s)", "lookup (s)"))
+	for nb_files in args.sizes:
+		for element_class in [HistoricalElement, Element]:
+			nb_elements, memory, time_build, time_copy, time_dump, time_lookup = \
+				benchmark_one_class(element_class, nb_files, args.fields)
+			print("%10d %18s %10.1f %12.0f %10.3f %10.3f %10.3f %10.3f" %
+			      (nb_elements, element_class.__name__, memory / 1.e6, memory / nb_elements, time_build, time_copy,
+			       time_dump, time_lookup))
@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark of the xml_writer parser on synthetic xml files of increasing size.
+For each size, the time spent in the pre-treatment, the tokenization and the tree building is printed together with
+the time per element, which should remain roughly constant if the parsing is linear.
+"""
+
+from __future__ import print_function, division, absolute_import, unicode_literals
+
+import os
+import sys
+import tempfile
+import time
+from argparse import ArgumentParser
+from io import open
+
+sys.path.append(os.path.abspath(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from xml_writer.parser import generate_list_from_xml_string, generate_xml_tree_from_list
+from xml_writer.pre_treatment import _pre_xml_string_format
+
+
+def build_synthetic_xml(nb_elements):
+	lines = ['<?xml version="1.0" ?>', '<context id="benchmark">', '<field_definition>']
+	for i in range(nb_elements):
+		if i % 4 == 0:
+			lines.append('\t<!-- field number %d -->' % i)
+		if i % 2 == 0:
+			lines.append('\t<field id="field_%d" name=\'name_%d\' grid_ref="grid" unit="K"/>' % (i, i))
+		else:
+			lines.append('\t<field id="field_%d" field_ref="field_%d" expr="@this > 0"> field_%d * 2 </field>'
+			             % (i, i - 1, i))
+	lines.extend(['</field_definition>', '</context>'])
+	return "\n".join(lines)
+
+
+def benchmark_one_size(nb_elements, tmp_dir):
+	xml_filename = os.path.sep.join([tmp_dir, "benchmark_%d.xml" % nb_elements])
+	with open(xml_filename, "w", encoding="utf-8") as xml_file:
+		xml_file.write(build_synthetic_xml(nb_elements))
+	time_init = time.time()
+	with open(xml_filename, "rb") as opened_file:
+		xml_string = "\n".join([line.decode("utf-8") for line in opened_file.readlines()])
+	xml_string = _pre_xml_string_format(xml_string)
+	time_pre = time.time()
+	list_of_elements = generate_list_from_xml_string(xml_string)
+	time_tokens = time.time()
+	_, root_element, _, _, _ = generate_xml_tree_from_list(list_of_elements)
+	time_tree = time.time()
+	if len(root_element) != 1 or len(root_element[0][0]) != nb_elements + (nb_elements + 3) // 4:
+		raise ValueError("The xml tree built does not contain the expected number of elements.")
+	return time_pre - time_init, time_tokens - time_pre, time_tree - time_tokens
+
+
+def parse_args():
+	parser = ArgumentParser()
+	parser.add_argument("--sizes", nargs="+", type=int, default=[1000, 10000, 100000, 1000000],
+	                    help="Number of field elements of the synthetic xml files")
+	return parser.parse_args()
+
+
+if __name__ == "__main__":
+	args = parse_args()
+	tmp_dir = tempfile.mkdtemp()
+	print("%10s %10s %10s %10s %10s %15s" % ("elements", "pre (s)", "tokens (s)", "tree (s)", "total (s)",
+	                                         "per elt (us)"))
+	for nb_elements in args.sizes:
+		time_pre, time_tokens, time_tree = benchmark_one_size(nb_elements, tmp_dir)
+		time_total = time_pre + time_tokens + time_tree
+		print("%10d %10.3f %10.3f %10.3f %10.3f %15.2f" % (nb_elements, time_pre, time_tokens, time_tree, time_total,
+		                                                   1.e6 * time_total / nb_elements))
+		os.remove(os.path.sep.join([tmp_dir, "benchmark_%d.xml" % nb_elements]))
+	os.rmdir(tmp_dir)
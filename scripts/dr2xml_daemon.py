@@ -0,0 +1,33 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Start a dr2xml daemon, which keeps the Data Request and the settings in memory and runs the generate_file_defs and
+create_ping_files jobs submitted with dr2xml.daemon.submit_job, or stop a running one.
+"""
+
+from __future__ import print_function, division, absolute_import, unicode_literals
+
+import os
+import sys
+from argparse import ArgumentParser
+
+sys.path.append(os.path.abspath(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from dr2xml.daemon import serve, submit_job
+
+
+def parse_args():
+	parser = ArgumentParser()
+	parser.add_argument("--socket", required=True, help="Path of the Unix socket on which the daemon listens")
+	parser.add_argument("--stop", action="store_true", help="Stop the daemon listening on the socket")
+	return parser.parse_args()
+
+
+if __name__ == "__main__":
+	args = parse_args()
+	address = os.path.abspath(args.socket)
+	if args.stop:
+		print(submit_job(address, "shutdown")["status"])
+	else:
+		serve(address)
@@ -0,0 +1,17 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Tests of dr2xml.
+The persistent caches of dr2xml are kept in a temporary directory during the tests, unless DR2XML_CACHE_DIR is set.
+"""
+from __future__ import division, print_function, unicode_literals, absolute_import
+
+import atexit
+import os
+import shutil
+import tempfile
+
+if "DR2XML_CACHE_DIR" not in os.environ:
+	os.environ["DR2XML_CACHE_DIR"] = tempfile.mkdtemp(prefix="dr2xml_tests_cache_")
+	atexit.register(shutil.rmtree, os.environ["DR2XML_CACHE_DIR"], ignore_errors=True)
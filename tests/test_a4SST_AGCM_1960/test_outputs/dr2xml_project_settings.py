@@ -0,0 +1,4 @@
+from dr2xml.projects.projects_interface_definitions import *
+internal_values = {'xios_version': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'laboratory', 'keys': ['xios_version'], 'fmt': None, 'src': None, 'func': None}), 2], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'xios_version', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'xios_version', 'help': 'Version of XIOS used.'}), 'synchronisation_frequency': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'synchronisation_frequency', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'synchronisation_frequency', 'help': 'Frequency at which the synchornisation between buffer and filesystem is done.'}), 'grouped_vars_per_file': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'simulation', 'keys': ['grouped_vars_per_file'], 'fmt': None, 'src': None, 'func': None}), ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'laboratory', 'keys': ['grouped_vars_per_file'], 'fmt': None, 'src': None, 'func': None}), []], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'grouped_vars_per_file', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'grouped_vars_per_file', 'help': 'Variables to be grouped in the same output file (provided additional conditions are filled).'}), 'debug_parsing': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'laboratory', 'keys': ['debug_parsing'], 'fmt': None, 'src': None, 'func': None}), False], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'debug_parsing', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'debug_parsing', 'help': 'In order to identify which xml files generates a problem, you can use this flag.'}), 'project': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'laboratory', 'keys': ['project'], 'fmt': None, 'src': None, 'func': None}), 'CMIP6'], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'project', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'project', 'help': 'Project associated with the simulation.'}), 'project_settings': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'laboratory', 'keys': ['project_settings'], 'fmt': None, 'src': None, 'func': None}), ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'internal', 'keys': ['project'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'project_settings', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'project_settings', 'help': 'Project settings definition file to be used.'}), 'institution_id': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'laboratory', 'keys': ['institution_id'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'institution_id', 'num_type': 'string', 'is_default': True, 'fatal': True, 'key': 'institution_id', 'help': 'Institution identifier.'}), 'context': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'dict', 'keys': ['context'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'context', 'num_type': 'string', 'is_default': True, 'fatal': True, 'key': 'context', 'help': 'Context associated with the xml file produced.'}), 'path_to_parse': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'laboratory', 'keys': ['path_to_parse'], 'fmt': None, 'src': None, 'func': None}), './'], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'path_to_parse', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'path_to_parse', 'help': 'The path of the directory which, at run time, contains the root XML file (iodef.xml).'}), 'use_union_zoom': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'laboratory', 'keys': ['use_union_zoom'], 'fmt': None, 'src': None, 'func': None}), False], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'use_union_zoom', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'use_union_zoom', 'help': 'Say if you want to use XIOS union/zoom axis to optimize vertical interpolation requested by the DR.'}), 'print_stats_per_var_label': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'laboratory', 'keys': ['print_stats_per_var_label'], 'fmt': None, 'src': None, 'func': None}), False], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'print_stats_per_var_label', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'print_stats_per_var_label', 'help': 'For an extended printout of selected CMOR variables, grouped by variable label.'}), 'ping_variables_prefix': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'laboratory', 'keys': ['ping_variables_prefix'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'ping_variables_prefix', 'num_type': 'string', 'is_default': True, 'fatal': True, 'key': 'ping_variables_prefix', 'help': 'The tag used to prefix the variables in the ‘field id’ namespaces of the ping file; may be an empty string.'}), 'grid_prefix': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'laboratory', 'keys': ['grid_prefix'], 'fmt': None, 'src': None, 'func': None}), ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'internal', 'keys': ['ping_variables_prefix'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'grid_prefix', 'num_type': 'string', 'is_default': True, 'fatal': True, 'key': 'grid_prefix', 'help': 'Prefix of the dr2xml generated grid named to be used.'}), 'split_frequencies': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'simulation', 'keys': ['split_frequencies'], 'fmt': None, 'src': None, 'func': None}), ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'laboratory', 'keys': ['split_frequencies'], 'fmt': None, 'src': None, 'func': None}), 'splitfreqs.dat'], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'split_frequencies', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'split_frequencies', 'help': 'Path to the split frequencies file to be used.'}), 'max_file_size_in_floats': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'laboratory', 'keys': ['max_file_size_in_floats'], 'fmt': None, 'src': None, 'func': None}), 500000000.0], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'max_file_size_in_floats', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'max_file_size_in_floats', 'help': 'The maximum size of generated files in number of floating values.'}), 'bytes_per_float': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'laboratory', 'keys': ['bytes_per_float'], 'fmt': None, 'src': None, 'func': None}), 2], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'bytes_per_float', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'bytes_per_float', 'help': 'Estimate of number of bytes per floating value, given the chosen :term:`compression_level`.'}), 'sampling_timestep': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'laboratory', 'keys': ['sampling_timestep'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'sampling_timestep', 'num_type': 'string', 'is_default': True, 'fatal': True, 'key': 'sampling_timestep', 'help': "Basic sampling timestep set in your field definition (used to feed metadata 'interval_operation'). Should be a dictionary which keys are resolutions and values a context/timestep dictionary."}), 'tierMax_lset': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'laboratory', 'keys': ['tierMax'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'tierMax_lset', 'num_type': 'string', 'is_default': True, 'fatal': True, 'key': 'tierMax_lset', 'help': 'Number indicating the maximum tier to consider for experiments from lab settings.'}), 'tierMax': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'simulation', 'keys': ['tierMax'], 'fmt': None, 'src': None, 'func': None}), ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'internal', 'keys': ['tierMax_lset'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'tierMax', 'num_type': 'string', 'is_default': True, 'fatal': True, 'key': 'tierMax', 'help': 'Number indicating the maximum tier to consider for experiments.'}), 'max_priority_lset': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'laboratory', 'keys': ['max_priority'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'max_priority_lset', 'num_type': 'string', 'is_default': True, 'fatal': True, 'key': 'max_priority_lset', 'help': 'Max variable priority level to be output (you may set 3 when creating ping_files while being more restrictive at run time) from lab settings.'}), 'max_priority': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'simulation', 'keys': ['max_priority'], 'fmt': None, 'src': None, 'func': None}), ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'internal', 'keys': ['max_priority_lset'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'max_priority', 'num_type': 'string', 'is_default': True, 'fatal': True, 'key': 'max_priority', 'help': 'Max variable priority level to be output (you may set 3 when creating ping_files while being more restrictive at run time).'}), 'grid_choice': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'laboratory', 'keys': ['grid_choice', ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'internal', 'keys': ['source_id'], 'fmt': None, 'src': None, 'func': None})], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'grid_choice', 'num_type': 'string', 'is_default': True, 'fatal': True, 'key': 'grid_choice', 'help': 'A dictionary which keys are models name and values the corresponding resolution.'}), 'configuration': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'simulation', 'keys': ['configuration'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'configuration', 'num_type': 'string', 'is_default': True, 'fatal': True, 'key': 'configuration', 'help': 'Configuration used for this experiment. If there is no configuration in lab_settings which matches you case, please rather use next or next two entries: :term:`source_id` and, if needed, :term:`source_type`.'}), 'source_id': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'laboratory', 'keys': ['configurations', ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'internal', 'keys': ['configuration'], 'fmt': None, 'src': None, 'func': None}), 0], 'fmt': None, 'src': None, 'func': None}), ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'simulation', 'keys': ['source_id'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'source_id', 'num_type': 'string', 'is_default': True, 'fatal': True, 'key': 'source_id', 'help': 'Name of the model used.'}), 'sizes': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'laboratory', 'keys': ['sizes', ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'internal', 'keys': ['grid_choice'], 'fmt': None, 'src': None, 'func': None})], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'sizes', 'num_type': 'string', 'is_default': True, 'fatal': True, 'key': 'sizes', 'help': "A dictionary which keys are resolution and values the associated grid size for atmosphere and ocean grids. The grid size looks like : ['nho', 'nlo', 'nha', 'nla', 'nlas', 'nls', 'nh1']. Used to compute file split frequency."}), 'mips': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'laboratory', 'keys': ['mips'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'mips', 'num_type': 'string', 'is_default': True, 'fatal': True, 'key': 'mips', 'help': 'A dictionary in which keys are grid and values a set of strings corresponding to MIPs names.'}), 'excluded_request_links': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'laboratory', 'keys': ['excluded_request_links'], 'fmt': None, 'src': None, 'func': None}), []], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'excluded_request_links', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'excluded_request_links', 'help': 'List of links un data request that should not been followed (those request are not taken into account).'}), 'included_request_links': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'laboratory', 'keys': ['included_request_links'], 'fmt': None, 'src': None, 'func': None}), []], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'included_request_links', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'included_request_links', 'help': 'List of the request links that will be processed (all others will not).'}), 'excluded_tables_lset': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'laboratory', 'keys': ['excluded_tables'], 'fmt': None, 'src': None, 'func': None}), []], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'excluded_tables_lset', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'excluded_tables_lset', 'help': 'List of the tables that will be excluded from outputs from laboratory settings.'}), 'excluded_tables_sset': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'simulation', 'keys': ['excluded_tables'], 'fmt': None, 'src': None, 'func': None}), []], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'excluded_tables_sset', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'excluded_tables_sset', 'help': 'List of the tables that will be excluded from outputs from simulation settings.'}), 'excluded_spshapes_lset': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'laboratory', 'keys': ['excluded_spshapes'], 'fmt': None, 'src': None, 'func': None}), []], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'excluded_spshapes_lset', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'excluded_spshapes_lset', 'help': 'The list of shapes that should be excluded (all variables in those shapes will be excluded from outputs).'}), 'excluded_vars_lset': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'laboratory', 'keys': ['excluded_vars'], 'fmt': None, 'src': None, 'func': None}), []], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'excluded_vars_lset', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'excluded_vars_lset', 'help': 'List of CMOR variables to exclude from the result based on previous Data Request extraction from laboratory settings.'}), 'excluded_vars_sset': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'simulation', 'keys': ['excluded_vars'], 'fmt': None, 'src': None, 'func': None}), []], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'excluded_vars_sset', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'excluded_vars_sset', 'help': 'List of CMOR variables to exclude from the result based on previous Data Request extraction from simulation settings.'}), 'excluded_pairs_lset': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'laboratory', 'keys': ['excluded_pairs'], 'fmt': None, 'src': None, 'func': None}), []], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'excluded_pairs_lset', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'excluded_pairs_lset', 'help': 'You can exclude some (variable, table) pairs from outputs. A list of tuple (variable, table) to be excluded from laboratory settings.'}), 'excluded_pairs_sset': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'simulation', 'keys': ['excluded_pairs'], 'fmt': None, 'src': None, 'func': None}), []], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'excluded_pairs_sset', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'excluded_pairs_sset', 'help': 'You can exclude some (variable, table) pairs from outputs. A list of tuple (variable, table) to be excluded from simulation settings.'}), 'included_tables_lset': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'laboratory', 'keys': ['included_tables'], 'fmt': None, 'src': None, 'func': None}), []], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'included_tables_lset', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'included_tables_lset', 'help': 'List of tables that will be processed (all others will not) from laboratory settings.'}), 'included_tables': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'simulation', 'keys': ['included_tables'], 'fmt': None, 'src': None, 'func': None}), ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'internal', 'keys': ['included_tables_lset'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'included_tables', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'included_tables', 'help': 'List of tables that will be processed (all others will not).'}), 'included_vars_lset': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'laboratory', 'keys': ['included_vars'], 'fmt': None, 'src': None, 'func': None}), []], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'included_vars_lset', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'included_vars_lset', 'help': 'Variables to be considered from the Data Request (all others will not) from laboratory settings.'}), 'included_vars': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'simulation', 'keys': ['included_vars'], 'fmt': None, 'src': None, 'func': None}), ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'internal', 'keys': ['included_vars_lset'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'included_vars', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'included_vars', 'help': 'Variables to be considered from the Data Request (all others will not)'}), 'excluded_vars_per_config': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'laboratory', 'keys': ['excluded_vars_per_config', ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'internal', 'keys': ['configuration'], 'fmt': None, 'src': None, 'func': None})], 'fmt': None, 'src': None, 'func': None}), []], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'excluded_vars_per_config', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'excluded_vars_per_config', 'help': 'A dictionary which keys are configurations and values the list of variables that must be excluded for each configuration.'}), 'experiment_id': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'simulation', 'keys': ['experiment_id'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'experiment_id', 'num_type': 'string', 'is_default': True, 'fatal': True, 'key': 'experiment_id', 'help': 'Root experiment identifier.'}), 'experiment_for_requests': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'simulation', 'keys': ['experiment_for_requests'], 'fmt': None, 'src': None, 'func': None}), ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'internal', 'keys': ['experiment_id'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'experiment_for_requests', 'num_type': 'string', 'is_default': True, 'fatal': True, 'key': 'experiment_for_requests', 'help': 'Experiment id to use for driving the use of the Data Request.'}), 'branching': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'laboratory', 'keys': ['branching', ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'internal', 'keys': ['source_id'], 'fmt': None, 'src': None, 'func': None})], 'fmt': None, 'src': None, 'func': None}), {}], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'branching', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'branching', 'help': " Describe the branching scheme for experiments involved in some 'branchedYears type' tslice (for details, see: http://clipc-services.ceda.ac.uk/dreq/index/Slice.html ). Just put the as key the common start year in child and as value the list of start years in parent for all members.A dictionary with models name as key and dictionary containing experiment,(branch year in child, list of branch year in parent) key values."}), 'branch_year_in_child': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'simulation', 'keys': ['branch_year_in_child'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'branch_year_in_child', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'branch_year_in_child', 'help': 'In some instances, the experiment start year is not explicit or is doubtful in DR. See file doc/some_experiments_starty_in_DR01.00.21. You should then specify it, using next setting in order that requestItems analysis work in all cases. In some other cases, DR requestItems which apply to the experiment form its start does not cover its whole duration and have a wrong duration (computed based on a wrong start year); They necessitate to fix the start year.'}), 'end_year': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'simulation', 'keys': ['end_year'], 'fmt': None, 'src': None, 'func': None}), False], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'end_year', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'end_year', 'help': "If you want to carry on the experiment beyond the duration set in DR, and that all requestItems that apply to DR end year also apply later on, set 'end_year' You can also set it if you don't know if DR has a wrong value"}), 'allow_pseudo_standard_names': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'laboratory', 'keys': ['allow_pseudo_standard_names'], 'fmt': None, 'src': None, 'func': None}), False], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'allow_pseudo_standard_names', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'allow_pseudo_standard_names', 'help': 'DR has sn attributes for MIP variables. They can be real,CF-compliant, standard_names or pseudo_standard_names, i.e. not yet approved labels. Default is to use only CF ones.'}), 'realization_index': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'simulation', 'keys': ['realization_index'], 'fmt': None, 'src': None, 'func': None}), '1'], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'realization_index', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'realization_index', 'help': 'Realization number.'}), 'filter_on_realization': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'simulation', 'keys': ['filter_on_realization'], 'fmt': None, 'src': None, 'func': None}), ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'laboratory', 'keys': ['filter_on_realization'], 'fmt': None, 'src': None, 'func': None}), True], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'filter_on_realization', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'filter_on_realization', 'help': 'If you want to produce the same variables set for all members, set this parameter to False.'}), 'listof_home_vars': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'simulation', 'keys': ['listof_home_vars'], 'fmt': None, 'src': None, 'func': None}), ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'laboratory', 'keys': ['listof_home_vars'], 'fmt': None, 'src': None, 'func': None}), None], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'listof_home_vars', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'listof_home_vars', 'help': 'Full path to the file which contains the list of home variables to be taken into account, in addition to the Data Request.'}), 'path_extra_tables': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'simulation', 'keys': ['path_extra_tables'], 'fmt': None, 'src': None, 'func': None}), ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'laboratory', 'keys': ['path_extra_tables'], 'fmt': None, 'src': None, 'func': None}), None], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'path_extra_tables', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'path_extra_tables', 'help': 'Full path of the directory which contains extra tables.'}), 'allow_duplicates': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'laboratory', 'keys': ['allow_duplicates'], 'fmt': None, 'src': None, 'func': None}), True], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'allow_duplicates', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'allow_duplicates', 'help': 'Should we allow for duplicate vars: two vars with same frequency, shape and realm, which differ only by the table. In DR01.00.21, this actually applies to very few fields (ps-Aermon, tas-ImonAnt, areacellg-IfxAnt).'}), 'orphan_variables': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'laboratory', 'keys': ['orphan_variables'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'orphan_variables', 'num_type': 'string', 'is_default': True, 'fatal': True, 'key': 'orphan_variables', 'help': 'A dictionary with (context name, list of variables) as (key,value) pairs, where the list indicates the variables to be re-affected to the key-context (initially affected to a realm falling in another context)'}), 'too_long_periods': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'laboratory', 'keys': ['too_long_periods'], 'fmt': None, 'src': None, 'func': None}), []], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'too_long_periods', 'num_type': 'string', 'is_default': True, 'fatal': True, 'key': 'too_long_periods', 'help': "The CMIP6 frequencies that are unreachable for a single model run. Datafiles will be labelled with dates consistent with content (but not with CMIP6 requirements). Allowed values are only 'dec' and 'yr'."}), 'CFsubhr_frequency': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'laboratory', 'keys': ['CFsubhr_frequency'], 'fmt': None, 'src': None, 'func': None}), '1ts'], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'CFsubhr_frequency', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'CFsubhr_frequency', 'help': 'CFMIP has an elaborated requirement for defining subhr frequency; by default, dr2xml uses 1 time step.'}), 'simple_domain_grid_regexp': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'laboratory', 'keys': ['simple_domain_grid_regexp'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'simple_domain_grid_regexp', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'simple_domain_grid_regexp', 'help': "If some grid is not defined in xml but by API, and is referenced by a field which is considered by the DR as having a singleton dimension, then: 1) it must be a grid which has only a domain 2) the domain name must be extractable from the grid_id using a regexp and a group number Example: using a pattern that returns full id except for a '_grid' suffix"}), 'vertical_interpolation_operation': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'laboratory', 'keys': ['vertical_interpolation_operation'], 'fmt': None, 'src': None, 'func': None}), 'instant'], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'vertical_interpolation_operation', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'vertical_interpolation_operation', 'help': 'Operation done for vertical interpolation.'}), 'vertical_interpolation_sample_freq': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'laboratory', 'keys': ['vertical_interpolation_sample_freq'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'vertical_interpolation_sample_freq', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'vertical_interpolation_sample_freq', 'help': 'Time frequency of vertical interpolation.'}), 'sectors': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'laboratory', 'keys': ['sectors'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'sectors', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'sectors', 'help': 'List of the sectors to be considered.'}), 'non_standard_axes': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'laboratory', 'keys': ['non_standard_axes'], 'fmt': None, 'src': None, 'func': None}), {}], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'non_standard_axes', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'non_standard_axes', 'help': 'If your model has some axis which does not have all its attributes as in DR, and you want dr2xml to fix that it, give here the correspondence from model axis id to DR dim/grid id. For label dimensions you should provide the  list of labels, ordered as in your model, as second element of a pair. Label-type axes will be processed even if not quoted. Scalar dimensions are not concerned by this feature. A dictionary with (axis_id, axis_correct_id) or (axis_id, tuple of labels) as key, values.'}), 'add_Gibraltar': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'laboratory', 'keys': ['add_Gibraltar'], 'fmt': None, 'src': None, 'func': None}), False], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'add_Gibraltar', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'add_Gibraltar', 'help': 'DR01.00.21 does not include Gibraltar strait, which is requested by OMIP. Can include it, if model provides it as last value of array.'}), 'grid_policy': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'laboratory', 'keys': ['grid_policy'], 'fmt': None, 'src': None, 'func': None}), False], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'grid_policy', 'num_type': 'string', 'is_default': True, 'fatal': True, 'key': 'grid_policy', 'help': 'The grid choice policy for output files.'}), 'allow_tos_3hr_1deg': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'laboratory', 'keys': ['allow_tos_3hr_1deg'], 'fmt': None, 'src': None, 'func': None}), True], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'allow_tos_3hr_1deg', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'allow_tos_3hr_1deg', 'help': "When using select='no', Xios may enter an endless loop, which is solved if next setting is False."}), 'adhoc_policy_do_add_1deg_grid_for_tos': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'laboratory', 'keys': ['adhoc_policy_do_add_1deg_grid_for_tos'], 'fmt': None, 'src': None, 'func': None}), False], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'adhoc_policy_do_add_1deg_grid_for_tos', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'adhoc_policy_do_add_1deg_grid_for_tos', 'help': 'Some scenario experiment in DR 01.00.21 do not request tos on 1 degree grid, while other do. If you use grid_policy=adhoc and had not changed the mapping of function. grids.lab_adhoc_grid_policy to grids.CNRM_grid_policy, next setting can force any tos request to also produce tos on a 1 degree grid.'}), 'fx_from_file': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'laboratory', 'keys': ['fx_from_file'], 'fmt': None, 'src': None, 'func': None}), []], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'fx_from_file', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'fx_from_file', 'help': 'You may provide some variables already horizontally remapped to some grid (i.e. Xios domain) in external files. The varname in file must match the referenced id in pingfile. Tested only for fixed fields. A dictionary with variable id as key and a dictionary as value: the key must be the grid id, the value a dictionary with the file for each resolution.'}), 'prefixed_orography_field_name': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'combine', 'keys': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'internal', 'keys': ['ping_variables_prefix'], 'fmt': None, 'src': None, 'func': None}), ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'internal', 'keys': ['orography_field_name'], 'fmt': None, 'src': None, 'func': None})], 'fmt': '{}{}', 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'prefixed_orography_field_name', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'prefixed_orography_field_name', 'help': 'Name of the orography field name to be used to compute height over orog fields prefixed with :term:`ping_variable_prefix`.'}), 'orography_field_name': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'laboratory', 'keys': ['orography_field_name'], 'fmt': None, 'src': None, 'func': None}), 'orog'], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'orography_field_name', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'orography_field_name', 'help': 'Name of the orography field name to be used to compute height over orog fields.'}), 'zg_field_name': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'laboratory', 'keys': ['zg_field_name'], 'fmt': None, 'src': None, 'func': None}), 'zg'], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'zg_field_name', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'zg_field_name', 'help': 'Name of the geopotential height field name to be used to compute height over orog fields.'}), 'print_variables': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'laboratory', 'keys': ['print_variables'], 'fmt': None, 'src': None, 'func': None}), True], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'print_variables', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'print_variables', 'help': 'If the value is a list, only the file/field variables listed here will be put in output files. If boolean, tell if the file/field variables should be put in output files.'}), 'grids_dev': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'laboratory', 'keys': ['grids_dev'], 'fmt': None, 'src': None, 'func': None}), {}], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'grids_dev', 'num_type': 'string', 'is_default': True, 'fatal': True, 'key': 'grids_dev', 'help': 'Grids definition for dev variables.'}), 'grids': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'laboratory', 'keys': ['grids'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'grids', 'num_type': 'string', 'is_default': True, 'fatal': True, 'key': 'grids', 'help': "Grids : per model resolution and per context :- CMIP6 qualifier (i.e. 'gn' or 'gr') for the main grid chosen (because you  may choose has main production grid a regular one, when the native grid is e.g. unstructured)- Xios id for the production grid (if it is not the native grid),- Xios id for the latitude axis used for zonal means (mist match latitudes for grid above)- resolution of the production grid (using CMIP6 conventions),- grid description"}), 'required_model_components': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'internal', 'keys': ['CV_experiment', 'required_model_components'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'required_model_components', 'num_type': 'string', 'is_default': True, 'fatal': True, 'key': 'required_model_components', 'help': 'Dictionary which gives, for each model name, the components that must be present.'}), 'additional_allowed_model_components': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'internal', 'keys': ['CV_experiment', 'additional_allowed_model_components'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'additional_allowed_model_components', 'num_type': 'string', 'is_default': True, 'fatal': True, 'key': 'additional_allowed_model_components', 'help': 'Dictionary which contains, for each model, the list of components whih can be used in addition to the declared ones.'}), 'max_split_freq': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'simulation', 'keys': ['max_split_freq'], 'fmt': None, 'src': None, 'func': None}), ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'laboratory', 'keys': ['max_split_freq'], 'fmt': None, 'src': None, 'func': None}), None], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'max_split_freq', 'num_type': 'string', 'is_default': True, 'fatal': True, 'key': 'max_split_freq', 'help': 'The maximum number of years that should be putted in a single file.'}), 'dr2xml_manages_enddate': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'laboratory', 'keys': ['dr2xml_manages_enddate'], 'fmt': None, 'src': None, 'func': None}), True], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'dr2xml_manages_enddate', 'num_type': 'string', 'is_default': True, 'fatal': True, 'key': 'dr2xml_manages_enddate', 'help': "A smart workflow will allow you to extend a simulation during it course and to complement the output files accordingly, by managing the 'end date' part in filenames. You can then set next setting to False."}), 'non_standard_attributes': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'laboratory', 'keys': ['non_standard_attributes'], 'fmt': None, 'src': None, 'func': None}), {}], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'non_standard_attributes', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'non_standard_attributes', 'help': 'You may add a series of NetCDF attributes in all files for this simulation'}), 'allow_duplicates_in_same_table': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'laboratory', 'keys': ['allow_duplicates_in_same_table'], 'fmt': None, 'src': None, 'func': None}), False], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'allow_duplicates_in_same_table', 'num_type': 'string', 'is_default': True, 'fatal': True, 'key': 'allow_duplicates_in_same_table', 'help': "Should we allow for another type of duplicate vars : two vars with same name in same table (usually with different shapes). This applies to e.g. CMOR vars 'ua' and 'ua7h' in 6hPlevPt. Default to False, because CMIP6 rules does not allow to name output files differently in that case. If set to True, you should also set 'use_cmorvar_label_in_filename' to True to overcome the said rule."}), 'use_cmorvar_label_in_filename': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'laboratory', 'keys': ['use_cmorvar_label_in_filename'], 'fmt': None, 'src': None, 'func': None}), False], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'use_cmorvar_label_in_filename', 'num_type': 'string', 'is_default': True, 'fatal': True, 'key': 'use_cmorvar_label_in_filename', 'help': "CMIP6 rule is that filenames includes the variable label, and that this variable label is not the CMORvar label, but 'MIPvar' label. This may lead to conflicts, e.g. for 'ua' and 'ua7h' in table 6hPlevPt; allows to avoid that, if set to True."}), 'nemo_sources_management_policy_master_of_the_world': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'laboratory', 'keys': ['nemo_sources_management_policy_master_of_the_world'], 'fmt': None, 'src': None, 'func': None}), False], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'nemo_sources_management_policy_master_of_the_world', 'num_type': 'string', 'is_default': True, 'fatal': True, 'key': 'nemo_sources_management_policy_master_of_the_world', 'help': "Set that to True if you use a context named 'nemo' and the corresponding model unduly sets a general freq_op AT THE FIELD_DEFINITION GROUP LEVEL. Due to Xios rules for inheritance, that behavior prevents inheriting specific freq_ops by reference from dr2xml generated field_definitions."}), 'special_timestep_vars': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'laboratory', 'keys': ['special_timestep_vars'], 'fmt': None, 'src': None, 'func': None}), []], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'special_timestep_vars', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'special_timestep_vars', 'help': 'This variable is used when some variables are computed with a period which is not the basic timestep. A dictionary which keys are non standard timestep and values the list of variables which are computed at this timestep.'}), 'useAtForInstant': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'laboratory', 'keys': ['useAtForInstant'], 'fmt': None, 'src': None, 'func': None}), False], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'useAtForInstant', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'useAtForInstant', 'help': 'Should xml output files use the `@` symbol for definitions for instant variables?'}), 'bypass_CV_components': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'laboratory', 'keys': ['bypass_CV_components'], 'fmt': None, 'src': None, 'func': None}), False], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'bypass_CV_components', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'bypass_CV_components', 'help': "If the CMIP6 Controlled Vocabulary doesn't allow all the components you activate, you can set next toggle to True"}), 'data_request_used': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'laboratory', 'keys': ['data_request_used'], 'fmt': None, 'src': None, 'func': None}), 'CMIP6'], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'data_request_used', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'data_request_used', 'help': 'Version of the data request used.'}), 'data_request_path': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'laboratory', 'keys': ['data_request_path'], 'fmt': None, 'src': None, 'func': None}), None], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'data_request_path', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'data_request_path', 'help': 'Path where the data request used is placed.'}), 'laboratory_used': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'laboratory', 'keys': ['laboratory_used'], 'fmt': None, 'src': None, 'func': None}), None], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'laboratory_used', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'laboratory_used', 'help': 'File which contains the settings to be used for a specific laboratory which is not present by default in dr2xml. Must contains at least the `lab_grid_policy` function.'}), 'save_project_settings': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'laboratory', 'keys': ['save_project_settings'], 'fmt': None, 'src': None, 'func': None}), None], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'save_project_settings', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'save_project_settings', 'help': 'The path of the file where the complete project settings will be written, if needed.'}), 'perso_sdims_description': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'simulation', 'keys': ['perso_sdims_description'], 'fmt': None, 'src': None, 'func': None}), {}], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'perso_sdims_description', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'perso_sdims_description', 'help': 'A dictionary containing, for each perso or dev variables with a XY-perso shape, and for each vertical coordinate associated, the main attributes of the dimension.'}), 'realms_per_context': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'laboratory', 'keys': ['realms_per_context', ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'internal', 'keys': ['context'], 'fmt': None, 'src': None, 'func': None})], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'realms_per_context', 'num_type': 'string', 'is_default': True, 'fatal': True, 'key': 'realms_per_context', 'help': 'A dictionary which keys are context names and values the lists of realms associated with each context'}), 'source_type': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'laboratory', 'keys': ['configurations', ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'internal', 'keys': ['configuration'], 'fmt': None, 'src': None, 'func': None}), 1], 'fmt': None, 'src': None, 'func': None}), ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'simulation', 'keys': ['source_type'], 'fmt': None, 'src': None, 'func': None}), ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'laboratory', 'keys': ['source_types', ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'internal', 'keys': ['source_id'], 'fmt': None, 'src': None, 'func': None})], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'source_type', 'num_type': 'string', 'is_default': True, 'fatal': True, 'key': 'source_type', 'help': 'If the default source-type value for your source (:term:`source_types` from :term:`lab_and_model_settings`) does not fit, you may change it here. This should describe the model most directly responsible for the output. Sometimes it is appropriate to list two (or more) model types here, among AER, AGCM, AOGCM, BGC, CHEM, ISM, LAND, OGCM, RAD, SLAB e.g. amip , run with CNRM-CM6-1, should quote "AGCM AER". Also see note 14 of https://docs.google.com/document/d/1h0r8RZr_f3-8egBMMh7aqLwy3snpD6_MrDz1q8n5XUk/edit'}), 'CV_experiment': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'json', 'keys': ['experiment_id', ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'internal', 'keys': ['experiment_id'], 'fmt': None, 'src': None, 'func': None})], 'fmt': None, 'src': ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'combine', 'keys': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'dict', 'keys': ['cvspath'], 'fmt': None, 'src': None, 'func': None}), ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'internal', 'keys': ['project'], 'fmt': None, 'src': None, 'func': None})], 'fmt': '{}{}_experiment_id.json', 'src': None, 'func': None}), 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'CV_experiment', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'CV_experiment', 'help': 'Controlled vocabulary file containing experiment characteristics.'})}
+common_values = {'prefix': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'dict', 'keys': ['prefix'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'prefix', 'num_type': 'string', 'is_default': True, 'fatal': True, 'key': 'prefix', 'help': 'Prefix to be used for each file definition.'}), 'year': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'dict', 'keys': ['year'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'year', 'num_type': 'string', 'is_default': True, 'fatal': True, 'key': 'year', 'help': 'Year associated with the launch of dr2xml.'}), 'branch_year_in_parent': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [None, 'None', '', 'N/A'], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [CaseSettings({'conditions': [ConditionSettings({'check_value': ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'internal', 'keys': ['experiment_id'], 'fmt': None, 'src': None, 'func': None}), 'check_to_do': 'eq', 'reference_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'internal', 'keys': ['branching'], 'fmt': None, 'src': None, 'func': None})]}), ConditionSettings({'check_value': ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'simulation', 'keys': ['branch_year_in_parent'], 'fmt': None, 'src': None, 'func': None}), 'check_to_do': 'eq', 'reference_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'internal', 'keys': ['branching', ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'internal', 'keys': ['experiment_id'], 'fmt': None, 'src': None, 'func': None}), 1], 'fmt': None, 'src': None, 'func': None})]})], 'value': ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'simulation', 'keys': ['branch_year_in_parent'], 'fmt': None, 'src': None, 'func': None})}), CaseSettings({'conditions': [ConditionSettings({'check_value': ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'internal', 'keys': ['experiment_id'], 'fmt': None, 'src': None, 'func': None}), 'check_to_do': 'neq', 'reference_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'internal', 'keys': ['branching'], 'fmt': None, 'src': None, 'func': None})]})], 'value': ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'simulation', 'keys': ['branch_year_in_parent'], 'fmt': None, 'src': None, 'func': None})})], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'branch_year_in_parent', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'branch_year_in_parent', 'help': 'Branch year in parent simulation with respect to its time axis.'}), 'description': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'simulation', 'keys': ['description'], 'fmt': None, 'src': None, 'func': None}), ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'laboratory', 'keys': ['description'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'description', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'description', 'help': 'Description of the simulation.'}), 'date_range': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': ['%start_date%-%end_date%'], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'date_range', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'date_range', 'help': 'Date range format to be used in file definition names.'}), 'list_perso_dev_file': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': ['dr2xml_list_perso_and_dev_file_names'], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'list_perso_dev_file', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'list_perso_dev_file', 'help': 'Name of the file which will contain the list of the patterns of perso and dev output file definition.'}), 'info_url': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'laboratory', 'keys': ['info_url'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'info_url', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'info_url', 'help': 'Location of documentation.'}), 'expid_in_filename': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': ['.*_.*'], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'simulation', 'keys': ['expid_in_filename'], 'fmt': None, 'src': None, 'func': None}), ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'internal', 'keys': ['experiment_id'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'expid_in_filename', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'expid_in_filename', 'help': 'Experiment label to use in file names and attribute.'}), 'experiment': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'simulation', 'keys': ['experiment'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'experiment', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'experiment', 'help': 'Name of the experiment.'}), 'forcing_index': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'simulation', 'keys': ['forcing_index'], 'fmt': None, 'src': None, 'func': None}), '1'], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'forcing_index', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'forcing_index', 'help': 'Index for variant of forcing.'}), 'history': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'simulation', 'keys': ['history'], 'fmt': None, 'src': None, 'func': None}), 'none'], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'history', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'history', 'help': 'In case of replacement of previously produced data, description of any changes in the production chain.'}), 'initialization_index': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'simulation', 'keys': ['initialization_index'], 'fmt': None, 'src': None, 'func': None}), '1'], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'initialization_index', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'initialization_index', 'help': 'Index for variant of initialization method.'}), 'branch_method': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'simulation', 'keys': ['branch_method'], 'fmt': None, 'src': None, 'func': None}), 'standard'], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'branch_method', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'branch_method', 'help': 'Branching procedure.'}), 'parent_mip_era': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'simulation', 'keys': ['parent_mip_era'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'parent_mip_era', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'parent_mip_era', 'help': 'Parent’s associated MIP cycle.'}), 'parent_source_id': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'simulation', 'keys': ['parent_source_id'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'parent_source_id', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'parent_source_id', 'help': 'Parent model identifier.'}), 'parent_time_units': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'simulation', 'keys': ['parent_time_units'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'parent_time_units', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'parent_time_units', 'help': 'Time units used in parent.'}), 'parent_time_ref_year': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'simulation', 'keys': ['parent_time_ref_year'], 'fmt': None, 'src': None, 'func': None}), '1850'], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'parent_time_ref_year', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'parent_time_ref_year', 'help': 'Reference year in parent simulation.'}), 'branch_month_in_parent': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'simulation', 'keys': ['branch_month_in_parent'], 'fmt': None, 'src': None, 'func': None}), '1'], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'branch_month_in_parent', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'branch_month_in_parent', 'help': 'Branch month in parent simulation with respect to its time axis.'}), 'parent_variant_label': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'simulation', 'keys': ['parent_variant_label'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'parent_variant_label', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'parent_variant_label', 'help': 'Parent variant label.'}), 'physics_index': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'simulation', 'keys': ['physics_index'], 'fmt': None, 'src': None, 'func': None}), '1'], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'physics_index', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'physics_index', 'help': 'Index for model physics variant.'}), 'sub_experiment_id': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'simulation', 'keys': ['sub_experiment_id'], 'fmt': None, 'src': None, 'func': None}), 'none'], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'sub_experiment_id', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'sub_experiment_id', 'help': 'Sub-experiment identifier.'}), 'sub_experiment': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'simulation', 'keys': ['sub_experiment'], 'fmt': None, 'src': None, 'func': None}), 'none'], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'sub_experiment', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'sub_experiment', 'help': 'Sub-experiment name.'}), 'variant_info': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [''], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'simulation', 'keys': ['variant_info'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'variant_info', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'variant_info', 'help': "It is recommended that some description be included to help identify major differences among variants, but care should be taken to record correct information.  dr2xml will add in all cases: 'Information provided by this attribute may in some cases be flawed. Users can find more comprehensive and up-to-date documentation via the further_info_url global attribute.'"}), 'comment_sim': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'simulation', 'keys': ['comment'], 'fmt': None, 'src': None, 'func': None}), ''], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'comment_sim', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'comment_sim', 'help': "A character string containing additional information about the models from simulation settings. Will be complemented with the experiment's specific comment string."}), 'comment_lab': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'laboratory', 'keys': ['comment'], 'fmt': None, 'src': None, 'func': None}), ''], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'comment_lab', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'comment_lab', 'help': "A character string containing additional information about the models from laboratory settings. Will be complemented with the experiment's specific comment string."}), 'references': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'laboratory', 'keys': ['references'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'references', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'references', 'help': 'References associated with the simulation.'}), 'compression_level': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'laboratory', 'keys': ['compression_level'], 'fmt': None, 'src': None, 'func': None}), '0'], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'compression_level', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'compression_level', 'help': 'The compression level to be applied to NetCDF output files.'}), 'output_level': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'laboratory', 'keys': ['output_level'], 'fmt': None, 'src': None, 'func': None}), '10'], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'output_level', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'output_level', 'help': 'We can control the max output level set for all output files.'}), 'source': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'json', 'keys': ['source_id', ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'internal', 'keys': ['source_id'], 'fmt': None, 'src': None, 'func': None})], 'fmt': None, 'src': ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'combine', 'keys': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'dict', 'keys': ['cvspath'], 'fmt': None, 'src': None, 'func': None}), ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'internal', 'keys': ['project'], 'fmt': None, 'src': None, 'func': None})], 'fmt': '{}{}_source_id.json', 'src': None, 'func': None}), 'func': FunctionSettings({'func': <function make_source_string at 0x7f02208e0f70>, 'options': {'source_id': ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'internal', 'keys': ['source_id'], 'fmt': None, 'src': None, 'func': None})}})}), ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'laboratory', 'keys': ['source'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'source', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'source', 'help': 'Name of the model.'}), 'institution': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'laboratory', 'keys': ['institution'], 'fmt': None, 'src': None, 'func': None}), ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'json', 'keys': ['institution_id', ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'internal', 'keys': ['institution_id'], 'fmt': None, 'src': None, 'func': None})], 'fmt': None, 'src': ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'combine', 'keys': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'dict', 'keys': ['cvspath'], 'fmt': None, 'src': None, 'func': None}), ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'internal', 'keys': ['project'], 'fmt': None, 'src': None, 'func': None})], 'fmt': '{}{}_institution_id.json', 'src': None, 'func': None}), 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'institution', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'institution', 'help': 'Full name of the institution of the data producer.'}), 'contact': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'simulation', 'keys': ['contact'], 'fmt': None, 'src': None, 'func': None}), ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'laboratory', 'keys': ['contact'], 'fmt': None, 'src': None, 'func': None}), 'None'], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'contact', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'contact', 'help': 'Email address of the data producer.'}), 'HDL': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'simulation', 'keys': ['HDL'], 'fmt': None, 'src': None, 'func': None}), ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'laboratory', 'keys': ['HDL'], 'fmt': None, 'src': None, 'func': None}), '21.14100'], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'HDL', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'HDL', 'help': 'HDL associated with the project.'}), 'mip_era': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'simulation', 'keys': ['mip_era'], 'fmt': None, 'src': None, 'func': None}), ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'laboratory', 'keys': ['mip_era'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'mip_era', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'mip_era', 'help': 'MIP associated with the simulation.'}), 'activity_id': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'simulation', 'keys': ['activity_id'], 'fmt': None, 'src': None, 'func': None}), ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'laboratory', 'keys': ['activity_id'], 'fmt': None, 'src': None, 'func': None}), ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'internal', 'keys': ['CV_experiment', 'activity_id'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'activity_id', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'activity_id', 'help': 'MIP(s) name(s).'}), 'parent_activity_id': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'simulation', 'keys': ['parent_activity_id'], 'fmt': None, 'src': None, 'func': None}), ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'simulation', 'keys': ['activity_id'], 'fmt': None, 'src': None, 'func': None}), ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'laboratory', 'keys': ['parent_activity_id'], 'fmt': None, 'src': None, 'func': None}), ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'laboratory', 'keys': ['activity_id'], 'fmt': None, 'src': None, 'func': None}), ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'internal', 'keys': ['CV_experiment', 'parent_activity_id'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'parent_activity_id', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'parent_activity_id', 'help': 'Description of sub-experiment.'}), 'parent_experiment_id': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'simulation', 'keys': ['parent_experiment_id'], 'fmt': None, 'src': None, 'func': None}), ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'laboratory', 'keys': ['parent_experiment_id'], 'fmt': None, 'src': None, 'func': None}), ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'internal', 'keys': ['CV_experiment', 'parent_experiment_id'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'parent_experiment_id', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'parent_experiment_id', 'help': 'Parent experiment identifier.'}), 'convention_str': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'config', 'keys': ['conventions'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'convention_str', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'convention_str', 'help': 'Version of the conventions used.'}), 'dr2xml_version': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'config', 'keys': ['version'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'dr2xml_version', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'dr2xml_version', 'help': 'Version of dr2xml used.'}), 'data_specs_version': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'data_request', 'keys': ['get_version', '__call__'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'data_specs_version', 'num_type': 'string', 'is_default': True, 'fatal': True, 'key': 'data_specs_version', 'help': 'Version of the data request used.'}), 'conventions_version': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'config', 'keys': ['CMIP6_conventions_version'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'conventions_version', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'conventions_version', 'help': 'Version of the conventions used.'}), 'license': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'json', 'keys': ['license', 0], 'fmt': None, 'src': ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'combine', 'keys': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'dict', 'keys': ['cvspath'], 'fmt': None, 'src': None, 'func': None}), ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'internal', 'keys': ['project'], 'fmt': None, 'src': None, 'func': None})], 'fmt': '{}{}_license.json', 'src': None, 'func': None}), 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'license', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'license', 'help': 'File where the license associated with the produced output files can be found.'}), 'variant_label': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'combine', 'keys': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'internal', 'keys': ['realization_index'], 'fmt': None, 'src': None, 'func': None}), ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['initialization_index'], 'fmt': None, 'src': None, 'func': None}), ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['physics_index'], 'fmt': None, 'src': None, 'func': None}), ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['forcing_index'], 'fmt': None, 'src': None, 'func': None})], 'fmt': 'r{}i{}p{}f{}', 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'variant_label', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'variant_label', 'help': 'Label of the variant done.'}), 'member_id': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': ['none-.*'], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'combine', 'keys': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['sub_experiment_id'], 'fmt': None, 'src': None, 'func': None}), ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['variant_label'], 'fmt': None, 'src': None, 'func': None})], 'fmt': '{}-{}', 'src': None, 'func': None}), ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['variant_label'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'member_id', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'member_id', 'help': 'Id of the member done.'})}
+project_settings = {'context': TagSettings({'dict_default': {'attrs_list': [], 'attrs_constraints': {'id': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'internal', 'keys': ['context'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'id', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'id', 'help': 'Id of the context'})}, 'vars_list': [], 'vars_constraints': {}, 'comments_list': [], 'comments_constraints': {'DR_version': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['data_specs_version'], 'fmt': 'CMIP6 Data Request version {}', 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'DR_version', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'DR_version', 'help': 'Version of the Data Request used'}), 'dr2xml_version': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['dr2xml_version'], 'fmt': 'dr2xml version {}', 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'dr2xml_version', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'dr2xml_version', 'help': 'Version of dr2xml used'}), 'lab_settings': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'laboratory', 'keys': [], 'fmt': 'Lab_and_model settings\n{}', 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'lab_settings', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'lab_settings', 'help': 'Laboratory settings used'}), 'simulation_settings': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'simulation', 'keys': [], 'fmt': 'Simulation settings\n{}', 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'simulation_settings', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'simulation_settings', 'help': 'Simulation_settings used'}), 'year': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['year'], 'fmt': 'Year processed {}', 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'year', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'year', 'help': "Year used for the dr2xml's launch"}), 'CV_version': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': ['CMIP6-CV version ??'], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'CV_version', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'CV_version', 'help': 'Controled vocabulary version used.'}), 'conventions_version': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['conventions_version'], 'fmt': 'CMIP6_conventions_version {}', 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'conventions_version', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'conventions_version', 'help': 'Conventions version used.'})}, 'help': 'TODO', 'key': 'TODO'}, 'attrs_list': ['id'], 'attrs_constraints': {'id': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'internal', 'keys': ['context'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'id', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'id', 'help': 'Id of the context'})}, 'vars_list': [], 'vars_constraints': {}, 'comments_list': ['DR_version', 'CV_version', 'conventions_version', 'dr2xml_version', 'lab_settings', 'simulation_settings', 'year'], 'comments_constraints': {'DR_version': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['data_specs_version'], 'fmt': 'CMIP6 Data Request version {}', 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'DR_version', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'DR_version', 'help': 'Version of the Data Request used'}), 'dr2xml_version': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['dr2xml_version'], 'fmt': 'dr2xml version {}', 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'dr2xml_version', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'dr2xml_version', 'help': 'Version of dr2xml used'}), 'lab_settings': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'laboratory', 'keys': [], 'fmt': 'Lab_and_model settings\n{}', 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'lab_settings', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'lab_settings', 'help': 'Laboratory settings used'}), 'simulation_settings': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'simulation', 'keys': [], 'fmt': 'Simulation settings\n{}', 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'simulation_settings', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'simulation_settings', 'help': 'Simulation_settings used'}), 'year': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['year'], 'fmt': 'Year processed {}', 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'year', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'year', 'help': "Year used for the dr2xml's launch"}), 'CV_version': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': ['CMIP6-CV version ??'], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'CV_version', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'CV_version', 'help': 'Controled vocabulary version used.'}), 'conventions_version': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['conventions_version'], 'fmt': 'CMIP6_conventions_version {}', 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'conventions_version', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'conventions_version', 'help': 'Conventions version used.'})}, 'help': 'XIOS context beacon', 'key': 'context'}), 'file_definition': TagSettings({'dict_default': {'attrs_list': [], 'attrs_constraints': {'type': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': ['one_file'], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'type', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'type', 'help': 'Type of file to be produced'}), 'enabled': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': ['true'], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'enabled', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'enabled', 'help': 'Should the file_definition be considered by XIOS'})}, 'vars_list': [], 'vars_constraints': {}, 'comments_list': [], 'comments_constraints': {}, 'help': 'TODO', 'key': 'TODO'}, 'attrs_list': ['type', 'enabled'], 'attrs_constraints': {'type': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': ['one_file'], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'type', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'type', 'help': 'Type of file to be produced'}), 'enabled': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': ['true'], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'enabled', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'enabled', 'help': 'Should the file_definition be considered by XIOS'})}, 'vars_list': [], 'vars_constraints': {}, 'comments_list': [], 'comments_constraints': {}, 'help': 'XIOS file_definition beacon', 'key': 'file_definition'}), 'file': TagSettings({'dict_default': {'attrs_list': [], 'attrs_constraints': {'id': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'id', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'id', 'help': 'Id of the file.'}), 'name': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'name', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'name', 'help': 'File name.'}), 'mode': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'mode', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'mode', 'help': 'Mode in which the file will be open.'}), 'output_freq': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'output_freq', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'output_freq', 'help': 'Frequency of the outputs contained in the file.'}), 'enabled': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'enabled', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'enabled', 'help': 'Should the file be considered by XIOS.'})}, 'vars_list': [], 'vars_constraints': {}, 'comments_list': [], 'comments_constraints': {}, 'help': 'TODO', 'key': 'TODO'}, 'attrs_list': ['id', 'name', 'mode', 'output_freq', 'enabled'], 'attrs_constraints': {'id': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'id', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'id', 'help': 'Id of the file.'}), 'name': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'name', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'name', 'help': 'File name.'}), 'mode': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'mode', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'mode', 'help': 'Mode in which the file will be open.'}), 'output_freq': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'output_freq', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'output_freq', 'help': 'Frequency of the outputs contained in the file.'}), 'enabled': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'enabled', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'enabled', 'help': 'Should the file be considered by XIOS.'})}, 'vars_list': [], 'vars_constraints': {}, 'comments_list': [], 'comments_constraints': {}, 'help': 'XIOS file beacon (except for output files)', 'key': 'file'}), 'file_output': TagSettings({'dict_default': {'attrs_list': [], 'attrs_constraints': {'id': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'combine', 'keys': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'variable', 'keys': ['label'], 'fmt': None, 'src': None, 'func': None}), ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'dict', 'keys': ['table_id'], 'fmt': None, 'src': None, 'func': None}), ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'dict', 'keys': ['grid_label'], 'fmt': None, 'src': None, 'func': None})], 'fmt': '{}_{}_{}', 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'id', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'id', 'help': 'Id of the output file'}), 'name': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': FunctionSettings({'func': <function build_filename at 0x7f02208da040>, 'options': {'frequency': ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'variable', 'keys': ['frequency'], 'fmt': None, 'src': None, 'func': None}), 'prefix': ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['prefix'], 'fmt': None, 'src': None, 'func': None}), 'table': ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'dict', 'keys': ['table_id'], 'fmt': None, 'src': None, 'func': None}), 'source_id': ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'internal', 'keys': ['source_id'], 'fmt': None, 'src': None, 'func': None}), 'expid_in_filename': ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['expid_in_filename'], 'fmt': None, 'src': None, 'func': None}), 'member_id': ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['member_id'], 'fmt': None, 'src': None, 'func': None}), 'grid_label': ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'dict', 'keys': ['grid_label'], 'fmt': None, 'src': None, 'func': None}), 'date_range': ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['date_range'], 'fmt': None, 'src': None, 'func': None}), 'var_type': ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'variable', 'keys': ['type'], 'fmt': None, 'src': None, 'func': None}), 'list_perso_dev_file': ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['list_perso_dev_file'], 'fmt': None, 'src': None, 'func': None}), 'label': ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'variable', 'keys': ['label'], 'fmt': None, 'src': None, 'func': None}), 'mipVarLabel': ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'variable', 'keys': ['mipVarLabel'], 'fmt': None, 'src': None, 'func': None}), 'use_cmorvar': ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'internal', 'keys': ['use_cmorvar_label_in_filename'], 'fmt': None, 'src': None, 'func': None})}})})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'name', 'num_type': 'string', 'is_default': True, 'fatal': True, 'key': 'name', 'help': 'File name.'}), 'output_freq': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'output_freq', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'output_freq', 'help': 'Frequency of the outputs contained in the file.'}), 'split_freq': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': ['', 'None', None], 'forbidden_patterns': [], 'conditions': [ConditionSettings({'check_value': ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'variable', 'keys': ['frequency'], 'fmt': None, 'src': None, 'func': None}), 'check_to_do': 'nmatch', 'reference_values': ['.*fx.*']})], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'split_freq', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'split_freq', 'help': 'Splitting frequency of the file.'}), 'split_freq_format': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': ['', 'None', None], 'forbidden_patterns': [], 'conditions': [ConditionSettings({'check_value': ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'variable', 'keys': ['frequency'], 'fmt': None, 'src': None, 'func': None}), 'check_to_do': 'nmatch', 'reference_values': ['.*fx.*']})], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'split_freq_format', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'split_freq_format', 'help': 'Splitting frequency format of the file.'}), 'split_start_offset': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': ['', 'None', 'False', None, False], 'forbidden_patterns': [], 'conditions': [ConditionSettings({'check_value': ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'variable', 'keys': ['frequency'], 'fmt': None, 'src': None, 'func': None}), 'check_to_do': 'nmatch', 'reference_values': ['.*fx.*']})], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'split_start_offset', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'split_start_offset', 'help': 'Splitting start offset of the file'}), 'split_end_offset': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': ['', 'None', 'False', None, False], 'forbidden_patterns': [], 'conditions': [ConditionSettings({'check_value': ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'variable', 'keys': ['frequency'], 'fmt': None, 'src': None, 'func': None}), 'check_to_do': 'nmatch', 'reference_values': ['.*fx.*']})], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'split_end_offset', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'split_end_offset', 'help': 'Splitting end offset of the file'}), 'split_last_date': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': ['', 'None', None], 'forbidden_patterns': [], 'conditions': [ConditionSettings({'check_value': ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'variable', 'keys': ['frequency'], 'fmt': None, 'src': None, 'func': None}), 'check_to_do': 'nmatch', 'reference_values': ['.*fx.*']})], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'split_last_date', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'split_last_date', 'help': 'Splitting last date of the file'}), 'append': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': ['true'], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'append', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'append', 'help': 'Should the data be append to the file?'}), 'time_units': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': ['days'], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'time_units', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'time_units', 'help': 'Time units of the file.'}), 'time_counter_name': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': ['time'], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'time_counter_name', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'time_counter_name', 'help': 'Time counter name.'}), 'time_counter': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': ['exclusive'], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'time_counter', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'time_counter', 'help': 'Time counter type.'}), 'time_stamp_name': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': ['creation_date'], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'time_stamp_name', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'time_stamp_name', 'help': 'Time stamp name.'}), 'time_stamp_format': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': ['%Y-%m-%dT%H:%M:%SZ'], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'time_stamp_format', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'time_stamp_format', 'help': 'Time stamp format.'}), 'uuid_name': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': ['tracking_id'], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'uuid_name', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'uuid_name', 'help': 'Unique identifier of the file name.'}), 'uuid_format': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': ['None', '', None], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['HDL'], 'fmt': 'hdl:{}/%uuid%', 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'uuid_format', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'uuid_format', 'help': 'Unique identifier of the file format.'}), 'synchronisation_frequency': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': ['None', '', None], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'internal', 'keys': ['synchronisation_frequency'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'synchronisation_frequency', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'synchronisation_frequency', 'help': 'Frequency at which the synchornisation between buffer and filesystem is done.'}), 'convention_str': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['convention_str'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'convention_str', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'convention_str', 'help': 'Convention used for the file.'}), 'output_level': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': ['None', '', None], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['output_level'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'output_level', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'output_level', 'help': 'Output level of the file.'}), 'compression_level': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': ['None', '', None], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['compression_level'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'compression_level', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'compression_level', 'help': 'Compression level of the file.'})}, 'vars_list': [], 'vars_constraints': {'grid': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'grid', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'grid', 'help': 'Id of the grid used in the file.'}), 'grid_label': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'grid_label', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'grid_label', 'help': 'Label of the grid used in the file.'}), 'nominal_resolution': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'nominal_resolution', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'nominal_resolution', 'help': 'Nominal resolution of the grid used in the file.'}), 'license': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['license'], 'fmt': None, 'src': None, 'func': FunctionSettings({'func': <function fill_license at 0x7f02208da0d0>, 'options': {'institution_id': ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'internal', 'keys': ['institution_id'], 'fmt': None, 'src': None, 'func': None}), 'info_url': ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['info_url'], 'fmt': None, 'src': None, 'func': None})}})})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'license', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'license', 'help': 'License associated with the file.'}), 'table_id': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'table_id', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'table_id', 'help': 'Id of the table associated with the file.'}), 'variable_id': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'variable', 'keys': ['mipVarLabel'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'variable_id', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'variable_id', 'help': 'Id of the variable contained in the file.'}), 'contact': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': ['None', '', None], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['contact'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'contact', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'contact', 'help': 'Contact email.'}), 'data_specs_version': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['data_specs_version'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'data_specs_version', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'data_specs_version', 'help': 'Version of the Data Request used.'}), 'dr2xml_version': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['dr2xml_version'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'dr2xml_version', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'dr2xml_version', 'help': 'Version of dr2xml used.'}), 'expid_in_filename': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['expid_in_filename'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'experiment_id', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'expid_in_filename', 'help': 'Experiment id to be used in file name.'}), 'description': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': ['', 'None', None], 'forbidden_patterns': [], 'conditions': [ConditionSettings({'check_value': ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'internal', 'keys': ['experiment_id'], 'fmt': None, 'src': None, 'func': None}), 'check_to_do': 'eq', 'reference_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['expid_in_filename'], 'fmt': None, 'src': None, 'func': None})]})], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['description'], 'fmt': None, 'src': None, 'func': None}), ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'internal', 'keys': ['CV_experiment', 'description'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'description', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'description', 'help': 'Description of the file.'}), 'title_desc': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': ['', 'None', None], 'forbidden_patterns': [], 'conditions': [ConditionSettings({'check_value': ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'internal', 'keys': ['experiment_id'], 'fmt': None, 'src': None, 'func': None}), 'check_to_do': 'eq', 'reference_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['expid_in_filename'], 'fmt': None, 'src': None, 'func': None})]})], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['description'], 'fmt': None, 'src': None, 'func': None}), ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'internal', 'keys': ['CV_experiment', 'description'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'title', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'title_desc', 'help': 'Title of the file.'}), 'experiment': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': ['', 'None', None], 'forbidden_patterns': [], 'conditions': [ConditionSettings({'check_value': ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'internal', 'keys': ['experiment_id'], 'fmt': None, 'src': None, 'func': None}), 'check_to_do': 'eq', 'reference_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['expid_in_filename'], 'fmt': None, 'src': None, 'func': None})]})], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['experiment'], 'fmt': None, 'src': None, 'func': None}), ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'internal', 'keys': ['CV_experiment', 'experiment'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'experiment', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'experiment', 'help': 'Experiment associated with the simulation.'}), 'external_variables': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [''], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'variable', 'keys': ['cell_measures'], 'fmt': None, 'src': None, 'func': FunctionSettings({'func': <function build_external_variables at 0x7f022053c550>, 'options': {}})})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'external_variables', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'external_variables', 'help': 'External variables associated with the file.'}), 'forcing_index': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['forcing_index'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'forcing_index', 'num_type': 'int', 'is_default': True, 'fatal': False, 'key': 'forcing_index', 'help': 'Forcing index associated with the simulation.'}), 'further_info_url': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': ['', 'None', None], 'forbidden_patterns': [], 'conditions': [ConditionSettings({'check_value': ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'laboratory', 'keys': ['mip_era'], 'fmt': None, 'src': None, 'func': None}), 'check_to_do': 'eq', 'reference_values': []}), ConditionSettings({'check_value': ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'simulation', 'keys': ['mip_era'], 'fmt': None, 'src': None, 'func': None}), 'check_to_do': 'eq', 'reference_values': []})], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'combine', 'keys': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'variable', 'keys': ['mip_era'], 'fmt': None, 'src': None, 'func': None}), ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'internal', 'keys': ['institution_id'], 'fmt': None, 'src': None, 'func': None}), ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'internal', 'keys': ['source_id'], 'fmt': None, 'src': None, 'func': None}), ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['expid_in_filename'], 'fmt': None, 'src': None, 'func': None}), ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['sub_experiment_id'], 'fmt': None, 'src': None, 'func': None}), ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['variant_label'], 'fmt': None, 'src': None, 'func': None})], 'fmt': 'https://furtherinfo.es-doc.org/{}.{}.{}.{}.{}.{}', 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'further_info_url', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'further_info_url', 'help': 'Url to obtain further information associated with the simulation.'}), 'history': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['history'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'history', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'history', 'help': 'History associated with the file.'}), 'initialization_index': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['initialization_index'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'initialization_index', 'num_type': 'int', 'is_default': True, 'fatal': False, 'key': 'initialization_index', 'help': 'Initialization index associated with the simulation.'}), 'institution': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['institution'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'institution', 'num_type': 'string', 'is_default': True, 'fatal': True, 'key': 'institution', 'help': 'Institution associated with the simulation.'}), 'institution_id': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'internal', 'keys': ['institution_id'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'institution_id', 'num_type': 'string', 'is_default': True, 'fatal': True, 'key': 'institution_id', 'help': 'Institution id associated with the simulation.'}), 'mip_era': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['mip_era'], 'fmt': None, 'src': None, 'func': None}), ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'variable', 'keys': ['mip_era'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'mip_era', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'mip_era', 'help': 'MIP associated with the simulation.'}), 'parent_experiment_id': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [ConditionSettings({'check_value': ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['parent_experiment_id'], 'fmt': None, 'src': None, 'func': None}), 'check_to_do': 'neq', 'reference_values': ['no parent', '', 'None']})], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['parent_experiment_id'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'parent_experiment_id', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'parent_experiment_id', 'help': 'Parent experiment id associated with the simulation.'}), 'parent_mip_era': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [ConditionSettings({'check_value': ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['parent_experiment_id'], 'fmt': None, 'src': None, 'func': None}), 'check_to_do': 'neq', 'reference_values': ['no parent', '', 'None']})], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['parent_mip_era'], 'fmt': None, 'src': None, 'func': None}), ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['mip_era'], 'fmt': None, 'src': None, 'func': None}), ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'variable', 'keys': ['mip_era'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'parent_mip_era', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'parent_mip_era', 'help': 'MIP associated with the parent experiment.'}), 'parent_activity_id': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [ConditionSettings({'check_value': ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['parent_experiment_id'], 'fmt': None, 'src': None, 'func': None}), 'check_to_do': 'neq', 'reference_values': ['no parent', '', 'None']})], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['parent_activity_id'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'parent_activity_id', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'parent_activity_id', 'help': 'Activity id associated with the parent experiment.'}), 'parent_source_id': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [ConditionSettings({'check_value': ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['parent_experiment_id'], 'fmt': None, 'src': None, 'func': None}), 'check_to_do': 'neq', 'reference_values': ['no parent', '', 'None']})], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['parent_source_id'], 'fmt': None, 'src': None, 'func': None}), ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'internal', 'keys': ['source_id'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'parent_source_id', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'parent_source_id', 'help': 'Model id of the parent experiment.'}), 'parent_time_units': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [ConditionSettings({'check_value': ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['parent_experiment_id'], 'fmt': None, 'src': None, 'func': None}), 'check_to_do': 'neq', 'reference_values': ['no parent', '', 'None']})], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['parent_time_units'], 'fmt': None, 'src': None, 'func': None}), ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['parent_time_ref_year'], 'fmt': 'days since {}-01-01 00:00:00', 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'parent_time_units', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'parent_time_units', 'help': 'Time units of the parent experiment.'}), 'parent_variant_label': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [ConditionSettings({'check_value': ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['parent_experiment_id'], 'fmt': None, 'src': None, 'func': None}), 'check_to_do': 'neq', 'reference_values': ['no parent', '', 'None']})], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['parent_variant_label'], 'fmt': None, 'src': None, 'func': None}), ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['variant_label'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'parent_variant_label', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'parent_variant_label', 'help': 'Variant label of the parent experiment.'}), 'branch_time_in_parent': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': ['', 'None', None], 'forbidden_patterns': [], 'conditions': [ConditionSettings({'check_value': ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['parent_experiment_id'], 'fmt': None, 'src': None, 'func': None}), 'check_to_do': 'neq', 'reference_values': ['no parent', '', 'None']})], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': FunctionSettings({'func': <function compute_nb_days at 0x7f022053c5e0>, 'options': {'year_ref': ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['parent_time_ref_year'], 'fmt': None, 'src': None, 'func': None}), 'year_branch': ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['branch_year_in_parent'], 'fmt': None, 'src': None, 'func': None}), 'month_branch': ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['branch_month_in_parent'], 'fmt': None, 'src': None, 'func': None})}})}), ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'simulation', 'keys': ['branch_time_in_parent'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'branch_time_in_parent', 'num_type': 'double', 'is_default': True, 'fatal': False, 'key': 'branch_time_in_parent', 'help': "Branch time of the simulation in the parent's one."}), 'branch_time_in_child': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': ['', 'None', None], 'forbidden_patterns': [], 'conditions': [ConditionSettings({'check_value': ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['parent_experiment_id'], 'fmt': None, 'src': None, 'func': None}), 'check_to_do': 'neq', 'reference_values': ['no parent', '', 'None']})], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': FunctionSettings({'func': <function compute_nb_days at 0x7f022053c5e0>, 'options': {'year_ref': ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'simulation', 'keys': ['child_time_ref_year'], 'fmt': None, 'src': None, 'func': None}), 'year_branch': ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'simulation', 'keys': ['branch_year_in_child'], 'fmt': None, 'src': None, 'func': None})}})}), ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'simulation', 'keys': ['branch_time_in_child'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'branch_time_in_child', 'num_type': 'double', 'is_default': True, 'fatal': False, 'key': 'branch_time_in_child', 'help': "Branch time of the simulation in the child's one."}), 'branch_method': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [CaseSettings({'conditions': [ConditionSettings({'check_value': ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['parent_experiment_id'], 'fmt': None, 'src': None, 'func': None}), 'check_to_do': 'neq', 'reference_values': ['no parent', '', 'None']})], 'value': ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['branch_method'], 'fmt': None, 'src': None, 'func': None})}), CaseSettings({'conditions': [True], 'value': 'no parent'})], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'branch_method', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'branch_method', 'help': 'Branch method of the simulation.'}), 'physics_index': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['physics_index'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'physics_index', 'num_type': 'int', 'is_default': True, 'fatal': False, 'key': 'physics_index', 'help': 'Physics index associated with the simulation.'}), 'product': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': ['model-output'], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'product', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'product', 'help': 'Type of content of the file.'}), 'realization_index': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'internal', 'keys': ['realization_index'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'realization_index', 'num_type': 'int', 'is_default': True, 'fatal': False, 'key': 'realization_index', 'help': 'Realization index associated with the simulation.'}), 'references': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['references'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'references', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'references', 'help': 'References associated with the simulation.'}), 'sub_experiment_id': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['sub_experiment_id'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'sub_experiment_id', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'sub_experiment_id', 'help': 'Id of the sub experiment associated with the simulation.'}), 'sub_experiment': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['sub_experiment'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'sub_experiment', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'sub_experiment', 'help': 'Name of the sub experiment associated with the simulation.'}), 'variant_info': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['variant_info'], 'fmt': '. Information provided by this attribute may in some cases be flawed. Users can find more comprehensive and up-to-date documentation via the further_info_url global attribute.', 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'variant_info', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'variant_info', 'help': 'Variant information associated with the simulation.'}), 'realm': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {'ocnBgChem': 'ocnBgchem'}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'variable', 'keys': ['modeling_realm'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {'ocnBgChem': 'ocnBgchem'}, 'output_key': 'realm', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'realm', 'help': 'Realm associated with the file.'}), 'frequency': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'variable', 'keys': ['frequency'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'frequency', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'frequency', 'help': 'Frequency associated with the file.'}), 'comment': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [''], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [CaseSettings({'conditions': [ConditionSettings({'check_value': ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'variable', 'keys': ['comments'], 'fmt': None, 'src': None, 'func': None}), 'check_to_do': 'neq', 'reference_values': ['', 'None', None]})], 'value': ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'combine', 'keys': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['comment_lab'], 'fmt': None, 'src': None, 'func': None}), ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['comment_sim'], 'fmt': None, 'src': None, 'func': None}), ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'variable', 'keys': ['comments'], 'fmt': None, 'src': None, 'func': None})], 'fmt': '{}{}{}', 'src': None, 'func': None})}), CaseSettings({'conditions': [ConditionSettings({'check_value': ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['comment_sim'], 'fmt': None, 'src': None, 'func': None}), 'check_to_do': 'neq', 'reference_values': ['', 'None', None]}), ConditionSettings({'check_value': ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['comment_lab'], 'fmt': None, 'src': None, 'func': None}), 'check_to_do': 'neq', 'reference_values': ['', 'None', None]})], 'value': ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'combine', 'keys': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['comment_lab'], 'fmt': None, 'src': None, 'func': None}), ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['comment_sim'], 'fmt': None, 'src': None, 'func': None})], 'fmt': '{}{}', 'src': None, 'func': None})}), CaseSettings({'conditions': [ConditionSettings({'check_value': ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['comment_sim'], 'fmt': None, 'src': None, 'func': None}), 'check_to_do': 'neq', 'reference_values': ['', 'None', None]})], 'value': ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['comment_sim'], 'fmt': None, 'src': None, 'func': None})}), CaseSettings({'conditions': [ConditionSettings({'check_value': ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['comment_lab'], 'fmt': None, 'src': None, 'func': None}), 'check_to_do': 'neq', 'reference_values': ['', 'None', None]})], 'value': ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['comment_lab'], 'fmt': None, 'src': None, 'func': None})})], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'comment', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'comment', 'help': 'Comment associated with the file.'}), 'variant_label': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['variant_label'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'variant_label', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'variant_label', 'help': 'Variant label associated with the simulation.'}), 'activity_id': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['activity_id'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'activity_id', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'activity_id', 'help': 'Activity id associated with the simulation.'}), 'source': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['source'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'source', 'num_type': 'string', 'is_default': True, 'fatal': True, 'key': 'source', 'help': 'Model associated with the simulation.'}), 'source_id': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'internal', 'keys': ['source_id'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'source_id', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'source_id', 'help': 'Model id associated with the simulation.'}), 'source_type': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'internal', 'keys': ['source_type'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'source_type', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'source_type', 'help': 'Model type associated with the simulation.'}), 'title': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'combine', 'keys': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'internal', 'keys': ['source_id'], 'fmt': None, 'src': None, 'func': None}), ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'internal', 'keys': ['project'], 'fmt': None, 'src': None, 'func': None}), ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['activity_id'], 'fmt': None, 'src': None, 'func': None}), ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'simulation', 'keys': ['expid_in_filename'], 'fmt': None, 'src': None, 'func': None})], 'fmt': '{} model output prepared for {} and {} / {} simulation', 'src': None, 'func': None}), ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'combine', 'keys': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'internal', 'keys': ['source_id'], 'fmt': None, 'src': None, 'func': None}), ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'internal', 'keys': ['project'], 'fmt': None, 'src': None, 'func': None}), ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['activity_id'], 'fmt': None, 'src': None, 'func': None}), ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'internal', 'keys': ['experiment_id'], 'fmt': None, 'src': None, 'func': None})], 'fmt': '{} model output prepared for {} / {} {}', 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'title', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'title', 'help': 'Title of the file.'})}, 'comments_list': [], 'comments_constraints': {}, 'help': 'TODO', 'key': 'TODO'}, 'attrs_list': ['id', 'name', 'output_freq', 'append', 'output_level', 'compression_level', 'split_freq', 'split_freq_format', 'split_start_offset', 'split_end_offset', 'split_last_date', 'time_units', 'time_counter_name', 'time_counter', 'time_stamp_name', 'time_stamp_format', 'uuid_name', 'uuid_format', 'convention_str', 'synchronisation_frequency'], 'attrs_constraints': {'id': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'combine', 'keys': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'variable', 'keys': ['label'], 'fmt': None, 'src': None, 'func': None}), ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'dict', 'keys': ['table_id'], 'fmt': None, 'src': None, 'func': None}), ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'dict', 'keys': ['grid_label'], 'fmt': None, 'src': None, 'func': None})], 'fmt': '{}_{}_{}', 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'id', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'id', 'help': 'Id of the output file'}), 'name': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': FunctionSettings({'func': <function build_filename at 0x7f02208da040>, 'options': {'frequency': ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'variable', 'keys': ['frequency'], 'fmt': None, 'src': None, 'func': None}), 'prefix': ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['prefix'], 'fmt': None, 'src': None, 'func': None}), 'table': ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'dict', 'keys': ['table_id'], 'fmt': None, 'src': None, 'func': None}), 'source_id': ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'internal', 'keys': ['source_id'], 'fmt': None, 'src': None, 'func': None}), 'expid_in_filename': ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['expid_in_filename'], 'fmt': None, 'src': None, 'func': None}), 'member_id': ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['member_id'], 'fmt': None, 'src': None, 'func': None}), 'grid_label': ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'dict', 'keys': ['grid_label'], 'fmt': None, 'src': None, 'func': None}), 'date_range': ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['date_range'], 'fmt': None, 'src': None, 'func': None}), 'var_type': ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'variable', 'keys': ['type'], 'fmt': None, 'src': None, 'func': None}), 'list_perso_dev_file': ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['list_perso_dev_file'], 'fmt': None, 'src': None, 'func': None}), 'label': ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'variable', 'keys': ['label'], 'fmt': None, 'src': None, 'func': None}), 'mipVarLabel': ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'variable', 'keys': ['mipVarLabel'], 'fmt': None, 'src': None, 'func': None}), 'use_cmorvar': ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'internal', 'keys': ['use_cmorvar_label_in_filename'], 'fmt': None, 'src': None, 'func': None})}})})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'name', 'num_type': 'string', 'is_default': True, 'fatal': True, 'key': 'name', 'help': 'File name.'}), 'output_freq': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'output_freq', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'output_freq', 'help': 'Frequency of the outputs contained in the file.'}), 'split_freq': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': ['', 'None', None], 'forbidden_patterns': [], 'conditions': [ConditionSettings({'check_value': ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'variable', 'keys': ['frequency'], 'fmt': None, 'src': None, 'func': None}), 'check_to_do': 'nmatch', 'reference_values': ['.*fx.*']})], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'split_freq', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'split_freq', 'help': 'Splitting frequency of the file.'}), 'split_freq_format': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': ['', 'None', None], 'forbidden_patterns': [], 'conditions': [ConditionSettings({'check_value': ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'variable', 'keys': ['frequency'], 'fmt': None, 'src': None, 'func': None}), 'check_to_do': 'nmatch', 'reference_values': ['.*fx.*']})], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'split_freq_format', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'split_freq_format', 'help': 'Splitting frequency format of the file.'}), 'split_start_offset': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': ['', 'None', 'False', None, False], 'forbidden_patterns': [], 'conditions': [ConditionSettings({'check_value': ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'variable', 'keys': ['frequency'], 'fmt': None, 'src': None, 'func': None}), 'check_to_do': 'nmatch', 'reference_values': ['.*fx.*']})], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'split_start_offset', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'split_start_offset', 'help': 'Splitting start offset of the file'}), 'split_end_offset': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': ['', 'None', 'False', None, False], 'forbidden_patterns': [], 'conditions': [ConditionSettings({'check_value': ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'variable', 'keys': ['frequency'], 'fmt': None, 'src': None, 'func': None}), 'check_to_do': 'nmatch', 'reference_values': ['.*fx.*']})], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'split_end_offset', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'split_end_offset', 'help': 'Splitting end offset of the file'}), 'split_last_date': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': ['', 'None', None], 'forbidden_patterns': [], 'conditions': [ConditionSettings({'check_value': ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'variable', 'keys': ['frequency'], 'fmt': None, 'src': None, 'func': None}), 'check_to_do': 'nmatch', 'reference_values': ['.*fx.*']})], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'split_last_date', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'split_last_date', 'help': 'Splitting last date of the file'}), 'append': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': ['true'], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'append', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'append', 'help': 'Should the data be append to the file?'}), 'time_units': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': ['days'], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'time_units', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'time_units', 'help': 'Time units of the file.'}), 'time_counter_name': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': ['time'], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'time_counter_name', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'time_counter_name', 'help': 'Time counter name.'}), 'time_counter': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': ['exclusive'], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'time_counter', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'time_counter', 'help': 'Time counter type.'}), 'time_stamp_name': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': ['creation_date'], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'time_stamp_name', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'time_stamp_name', 'help': 'Time stamp name.'}), 'time_stamp_format': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': ['%Y-%m-%dT%H:%M:%SZ'], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'time_stamp_format', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'time_stamp_format', 'help': 'Time stamp format.'}), 'uuid_name': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': ['tracking_id'], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'uuid_name', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'uuid_name', 'help': 'Unique identifier of the file name.'}), 'uuid_format': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': ['None', '', None], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['HDL'], 'fmt': 'hdl:{}/%uuid%', 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'uuid_format', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'uuid_format', 'help': 'Unique identifier of the file format.'}), 'synchronisation_frequency': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': ['None', '', None], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'internal', 'keys': ['synchronisation_frequency'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'synchronisation_frequency', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'synchronisation_frequency', 'help': 'Frequency at which the synchornisation between buffer and filesystem is done.'}), 'convention_str': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['convention_str'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'convention_str', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'convention_str', 'help': 'Convention used for the file.'}), 'output_level': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': ['None', '', None], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['output_level'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'output_level', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'output_level', 'help': 'Output level of the file.'}), 'compression_level': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': ['None', '', None], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['compression_level'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'compression_level', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'compression_level', 'help': 'Compression level of the file.'})}, 'vars_list': ['activity_id', 'contact', 'data_specs_version', 'dr2xml_version', 'expid_in_filename', 'description', 'title_desc', 'experiment', 'external_variables', 'forcing_index', 'frequency', 'further_info_url', 'grid', 'grid_label', 'nominal_resolution', 'comment', 'history', 'initialization_index', 'institution_id', 'institution', 'license', 'mip_era', 'parent_experiment_id', 'parent_mip_era', 'parent_activity_id', 'parent_source_id', 'parent_time_units', 'parent_variant_label', 'branch_method', 'branch_time_in_parent', 'branch_time_in_child', 'physics_index', 'product', 'realization_index', 'realm', 'references', 'source', 'source_id', 'source_type', 'sub_experiment_id', 'sub_experiment', 'table_id', 'title', 'variable_id', 'variant_info', 'variant_label'], 'vars_constraints': {'grid': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'grid', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'grid', 'help': 'Id of the grid used in the file.'}), 'grid_label': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'grid_label', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'grid_label', 'help': 'Label of the grid used in the file.'}), 'nominal_resolution': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'nominal_resolution', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'nominal_resolution', 'help': 'Nominal resolution of the grid used in the file.'}), 'license': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['license'], 'fmt': None, 'src': None, 'func': FunctionSettings({'func': <function fill_license at 0x7f02208da0d0>, 'options': {'institution_id': ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'internal', 'keys': ['institution_id'], 'fmt': None, 'src': None, 'func': None}), 'info_url': ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['info_url'], 'fmt': None, 'src': None, 'func': None})}})})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'license', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'license', 'help': 'License associated with the file.'}), 'table_id': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'table_id', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'table_id', 'help': 'Id of the table associated with the file.'}), 'variable_id': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'variable', 'keys': ['mipVarLabel'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'variable_id', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'variable_id', 'help': 'Id of the variable contained in the file.'}), 'contact': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': ['None', '', None], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['contact'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'contact', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'contact', 'help': 'Contact email.'}), 'data_specs_version': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['data_specs_version'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'data_specs_version', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'data_specs_version', 'help': 'Version of the Data Request used.'}), 'dr2xml_version': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['dr2xml_version'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'dr2xml_version', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'dr2xml_version', 'help': 'Version of dr2xml used.'}), 'expid_in_filename': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['expid_in_filename'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'experiment_id', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'expid_in_filename', 'help': 'Experiment id to be used in file name.'}), 'description': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': ['', 'None', None], 'forbidden_patterns': [], 'conditions': [ConditionSettings({'check_value': ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'internal', 'keys': ['experiment_id'], 'fmt': None, 'src': None, 'func': None}), 'check_to_do': 'eq', 'reference_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['expid_in_filename'], 'fmt': None, 'src': None, 'func': None})]})], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['description'], 'fmt': None, 'src': None, 'func': None}), ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'internal', 'keys': ['CV_experiment', 'description'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'description', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'description', 'help': 'Description of the file.'}), 'title_desc': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': ['', 'None', None], 'forbidden_patterns': [], 'conditions': [ConditionSettings({'check_value': ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'internal', 'keys': ['experiment_id'], 'fmt': None, 'src': None, 'func': None}), 'check_to_do': 'eq', 'reference_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['expid_in_filename'], 'fmt': None, 'src': None, 'func': None})]})], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['description'], 'fmt': None, 'src': None, 'func': None}), ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'internal', 'keys': ['CV_experiment', 'description'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'title', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'title_desc', 'help': 'Title of the file.'}), 'experiment': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': ['', 'None', None], 'forbidden_patterns': [], 'conditions': [ConditionSettings({'check_value': ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'internal', 'keys': ['experiment_id'], 'fmt': None, 'src': None, 'func': None}), 'check_to_do': 'eq', 'reference_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['expid_in_filename'], 'fmt': None, 'src': None, 'func': None})]})], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['experiment'], 'fmt': None, 'src': None, 'func': None}), ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'internal', 'keys': ['CV_experiment', 'experiment'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'experiment', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'experiment', 'help': 'Experiment associated with the simulation.'}), 'external_variables': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [''], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'variable', 'keys': ['cell_measures'], 'fmt': None, 'src': None, 'func': FunctionSettings({'func': <function build_external_variables at 0x7f022053c550>, 'options': {}})})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'external_variables', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'external_variables', 'help': 'External variables associated with the file.'}), 'forcing_index': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['forcing_index'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'forcing_index', 'num_type': 'int', 'is_default': True, 'fatal': False, 'key': 'forcing_index', 'help': 'Forcing index associated with the simulation.'}), 'further_info_url': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': ['', 'None', None], 'forbidden_patterns': [], 'conditions': [ConditionSettings({'check_value': ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'laboratory', 'keys': ['mip_era'], 'fmt': None, 'src': None, 'func': None}), 'check_to_do': 'eq', 'reference_values': []}), ConditionSettings({'check_value': ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'simulation', 'keys': ['mip_era'], 'fmt': None, 'src': None, 'func': None}), 'check_to_do': 'eq', 'reference_values': []})], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'combine', 'keys': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'variable', 'keys': ['mip_era'], 'fmt': None, 'src': None, 'func': None}), ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'internal', 'keys': ['institution_id'], 'fmt': None, 'src': None, 'func': None}), ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'internal', 'keys': ['source_id'], 'fmt': None, 'src': None, 'func': None}), ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['expid_in_filename'], 'fmt': None, 'src': None, 'func': None}), ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['sub_experiment_id'], 'fmt': None, 'src': None, 'func': None}), ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['variant_label'], 'fmt': None, 'src': None, 'func': None})], 'fmt': 'https://furtherinfo.es-doc.org/{}.{}.{}.{}.{}.{}', 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'further_info_url', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'further_info_url', 'help': 'Url to obtain further information associated with the simulation.'}), 'history': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['history'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'history', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'history', 'help': 'History associated with the file.'}), 'initialization_index': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['initialization_index'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'initialization_index', 'num_type': 'int', 'is_default': True, 'fatal': False, 'key': 'initialization_index', 'help': 'Initialization index associated with the simulation.'}), 'institution': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['institution'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'institution', 'num_type': 'string', 'is_default': True, 'fatal': True, 'key': 'institution', 'help': 'Institution associated with the simulation.'}), 'institution_id': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'internal', 'keys': ['institution_id'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'institution_id', 'num_type': 'string', 'is_default': True, 'fatal': True, 'key': 'institution_id', 'help': 'Institution id associated with the simulation.'}), 'mip_era': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['mip_era'], 'fmt': None, 'src': None, 'func': None}), ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'variable', 'keys': ['mip_era'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'mip_era', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'mip_era', 'help': 'MIP associated with the simulation.'}), 'parent_experiment_id': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [ConditionSettings({'check_value': ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['parent_experiment_id'], 'fmt': None, 'src': None, 'func': None}), 'check_to_do': 'neq', 'reference_values': ['no parent', '', 'None']})], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['parent_experiment_id'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'parent_experiment_id', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'parent_experiment_id', 'help': 'Parent experiment id associated with the simulation.'}), 'parent_mip_era': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [ConditionSettings({'check_value': ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['parent_experiment_id'], 'fmt': None, 'src': None, 'func': None}), 'check_to_do': 'neq', 'reference_values': ['no parent', '', 'None']})], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['parent_mip_era'], 'fmt': None, 'src': None, 'func': None}), ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['mip_era'], 'fmt': None, 'src': None, 'func': None}), ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'variable', 'keys': ['mip_era'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'parent_mip_era', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'parent_mip_era', 'help': 'MIP associated with the parent experiment.'}), 'parent_activity_id': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [ConditionSettings({'check_value': ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['parent_experiment_id'], 'fmt': None, 'src': None, 'func': None}), 'check_to_do': 'neq', 'reference_values': ['no parent', '', 'None']})], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['parent_activity_id'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'parent_activity_id', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'parent_activity_id', 'help': 'Activity id associated with the parent experiment.'}), 'parent_source_id': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [ConditionSettings({'check_value': ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['parent_experiment_id'], 'fmt': None, 'src': None, 'func': None}), 'check_to_do': 'neq', 'reference_values': ['no parent', '', 'None']})], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['parent_source_id'], 'fmt': None, 'src': None, 'func': None}), ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'internal', 'keys': ['source_id'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'parent_source_id', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'parent_source_id', 'help': 'Model id of the parent experiment.'}), 'parent_time_units': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [ConditionSettings({'check_value': ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['parent_experiment_id'], 'fmt': None, 'src': None, 'func': None}), 'check_to_do': 'neq', 'reference_values': ['no parent', '', 'None']})], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['parent_time_units'], 'fmt': None, 'src': None, 'func': None}), ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['parent_time_ref_year'], 'fmt': 'days since {}-01-01 00:00:00', 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'parent_time_units', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'parent_time_units', 'help': 'Time units of the parent experiment.'}), 'parent_variant_label': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [ConditionSettings({'check_value': ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['parent_experiment_id'], 'fmt': None, 'src': None, 'func': None}), 'check_to_do': 'neq', 'reference_values': ['no parent', '', 'None']})], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['parent_variant_label'], 'fmt': None, 'src': None, 'func': None}), ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['variant_label'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'parent_variant_label', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'parent_variant_label', 'help': 'Variant label of the parent experiment.'}), 'branch_time_in_parent': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': ['', 'None', None], 'forbidden_patterns': [], 'conditions': [ConditionSettings({'check_value': ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['parent_experiment_id'], 'fmt': None, 'src': None, 'func': None}), 'check_to_do': 'neq', 'reference_values': ['no parent', '', 'None']})], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': FunctionSettings({'func': <function compute_nb_days at 0x7f022053c5e0>, 'options': {'year_ref': ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['parent_time_ref_year'], 'fmt': None, 'src': None, 'func': None}), 'year_branch': ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['branch_year_in_parent'], 'fmt': None, 'src': None, 'func': None}), 'month_branch': ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['branch_month_in_parent'], 'fmt': None, 'src': None, 'func': None})}})}), ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'simulation', 'keys': ['branch_time_in_parent'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'branch_time_in_parent', 'num_type': 'double', 'is_default': True, 'fatal': False, 'key': 'branch_time_in_parent', 'help': "Branch time of the simulation in the parent's one."}), 'branch_time_in_child': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': ['', 'None', None], 'forbidden_patterns': [], 'conditions': [ConditionSettings({'check_value': ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['parent_experiment_id'], 'fmt': None, 'src': None, 'func': None}), 'check_to_do': 'neq', 'reference_values': ['no parent', '', 'None']})], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': FunctionSettings({'func': <function compute_nb_days at 0x7f022053c5e0>, 'options': {'year_ref': ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'simulation', 'keys': ['child_time_ref_year'], 'fmt': None, 'src': None, 'func': None}), 'year_branch': ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'simulation', 'keys': ['branch_year_in_child'], 'fmt': None, 'src': None, 'func': None})}})}), ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'simulation', 'keys': ['branch_time_in_child'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'branch_time_in_child', 'num_type': 'double', 'is_default': True, 'fatal': False, 'key': 'branch_time_in_child', 'help': "Branch time of the simulation in the child's one."}), 'branch_method': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [CaseSettings({'conditions': [ConditionSettings({'check_value': ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['parent_experiment_id'], 'fmt': None, 'src': None, 'func': None}), 'check_to_do': 'neq', 'reference_values': ['no parent', '', 'None']})], 'value': ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['branch_method'], 'fmt': None, 'src': None, 'func': None})}), CaseSettings({'conditions': [True], 'value': 'no parent'})], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'branch_method', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'branch_method', 'help': 'Branch method of the simulation.'}), 'physics_index': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['physics_index'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'physics_index', 'num_type': 'int', 'is_default': True, 'fatal': False, 'key': 'physics_index', 'help': 'Physics index associated with the simulation.'}), 'product': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': ['model-output'], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'product', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'product', 'help': 'Type of content of the file.'}), 'realization_index': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'internal', 'keys': ['realization_index'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'realization_index', 'num_type': 'int', 'is_default': True, 'fatal': False, 'key': 'realization_index', 'help': 'Realization index associated with the simulation.'}), 'references': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['references'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'references', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'references', 'help': 'References associated with the simulation.'}), 'sub_experiment_id': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['sub_experiment_id'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'sub_experiment_id', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'sub_experiment_id', 'help': 'Id of the sub experiment associated with the simulation.'}), 'sub_experiment': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['sub_experiment'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'sub_experiment', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'sub_experiment', 'help': 'Name of the sub experiment associated with the simulation.'}), 'variant_info': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['variant_info'], 'fmt': '. Information provided by this attribute may in some cases be flawed. Users can find more comprehensive and up-to-date documentation via the further_info_url global attribute.', 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'variant_info', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'variant_info', 'help': 'Variant information associated with the simulation.'}), 'realm': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {'ocnBgChem': 'ocnBgchem'}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'variable', 'keys': ['modeling_realm'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {'ocnBgChem': 'ocnBgchem'}, 'output_key': 'realm', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'realm', 'help': 'Realm associated with the file.'}), 'frequency': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'variable', 'keys': ['frequency'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'frequency', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'frequency', 'help': 'Frequency associated with the file.'}), 'comment': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [''], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [CaseSettings({'conditions': [ConditionSettings({'check_value': ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'variable', 'keys': ['comments'], 'fmt': None, 'src': None, 'func': None}), 'check_to_do': 'neq', 'reference_values': ['', 'None', None]})], 'value': ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'combine', 'keys': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['comment_lab'], 'fmt': None, 'src': None, 'func': None}), ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['comment_sim'], 'fmt': None, 'src': None, 'func': None}), ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'variable', 'keys': ['comments'], 'fmt': None, 'src': None, 'func': None})], 'fmt': '{}{}{}', 'src': None, 'func': None})}), CaseSettings({'conditions': [ConditionSettings({'check_value': ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['comment_sim'], 'fmt': None, 'src': None, 'func': None}), 'check_to_do': 'neq', 'reference_values': ['', 'None', None]}), ConditionSettings({'check_value': ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['comment_lab'], 'fmt': None, 'src': None, 'func': None}), 'check_to_do': 'neq', 'reference_values': ['', 'None', None]})], 'value': ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'combine', 'keys': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['comment_lab'], 'fmt': None, 'src': None, 'func': None}), ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['comment_sim'], 'fmt': None, 'src': None, 'func': None})], 'fmt': '{}{}', 'src': None, 'func': None})}), CaseSettings({'conditions': [ConditionSettings({'check_value': ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['comment_sim'], 'fmt': None, 'src': None, 'func': None}), 'check_to_do': 'neq', 'reference_values': ['', 'None', None]})], 'value': ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['comment_sim'], 'fmt': None, 'src': None, 'func': None})}), CaseSettings({'conditions': [ConditionSettings({'check_value': ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['comment_lab'], 'fmt': None, 'src': None, 'func': None}), 'check_to_do': 'neq', 'reference_values': ['', 'None', None]})], 'value': ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['comment_lab'], 'fmt': None, 'src': None, 'func': None})})], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'comment', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'comment', 'help': 'Comment associated with the file.'}), 'variant_label': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['variant_label'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'variant_label', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'variant_label', 'help': 'Variant label associated with the simulation.'}), 'activity_id': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['activity_id'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'activity_id', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'activity_id', 'help': 'Activity id associated with the simulation.'}), 'source': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['source'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'source', 'num_type': 'string', 'is_default': True, 'fatal': True, 'key': 'source', 'help': 'Model associated with the simulation.'}), 'source_id': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'internal', 'keys': ['source_id'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'source_id', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'source_id', 'help': 'Model id associated with the simulation.'}), 'source_type': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'internal', 'keys': ['source_type'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'source_type', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'source_type', 'help': 'Model type associated with the simulation.'}), 'title': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'combine', 'keys': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'internal', 'keys': ['source_id'], 'fmt': None, 'src': None, 'func': None}), ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'internal', 'keys': ['project'], 'fmt': None, 'src': None, 'func': None}), ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['activity_id'], 'fmt': None, 'src': None, 'func': None}), ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'simulation', 'keys': ['expid_in_filename'], 'fmt': None, 'src': None, 'func': None})], 'fmt': '{} model output prepared for {} and {} / {} simulation', 'src': None, 'func': None}), ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'combine', 'keys': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'internal', 'keys': ['source_id'], 'fmt': None, 'src': None, 'func': None}), ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'internal', 'keys': ['project'], 'fmt': None, 'src': None, 'func': None}), ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['activity_id'], 'fmt': None, 'src': None, 'func': None}), ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'internal', 'keys': ['experiment_id'], 'fmt': None, 'src': None, 'func': None})], 'fmt': '{} model output prepared for {} / {} {}', 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'title', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'title', 'help': 'Title of the file.'})}, 'comments_list': [], 'comments_constraints': {}, 'help': 'XIOS file beacon (only for output files)', 'key': 'file_output'}), 'field_definition': TagSettings({'dict_default': {'attrs_list': [], 'attrs_constraints': {}, 'vars_list': [], 'vars_constraints': {}, 'comments_list': [], 'comments_constraints': {}, 'help': 'TODO', 'key': 'TODO'}, 'attrs_list': [], 'attrs_constraints': {}, 'vars_list': [], 'vars_constraints': {}, 'comments_list': [], 'comments_constraints': {}, 'help': 'XIOS field_definition beacon', 'key': 'field_definition'}), 'field_group': TagSettings({'dict_default': {'attrs_list': [], 'attrs_constraints': {'freq_op': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'freq_op', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'freq_op', 'help': 'Frequency of the operation done on the field.'}), 'freq_offset': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'freq_offset', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'freq_offset', 'help': 'Offset to be applied on operations on the field.'})}, 'vars_list': [], 'vars_constraints': {}, 'comments_list': [], 'comments_constraints': {}, 'help': 'TODO', 'key': 'TODO'}, 'attrs_list': ['freq_op', 'freq_offset'], 'attrs_constraints': {'freq_op': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'freq_op', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'freq_op', 'help': 'Frequency of the operation done on the field.'}), 'freq_offset': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'freq_offset', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'freq_offset', 'help': 'Offset to be applied on operations on the field.'})}, 'vars_list': [], 'vars_constraints': {}, 'comments_list': [], 'comments_constraints': {}, 'help': 'XIOS field_group beacon', 'key': 'field_group'}), 'field': TagSettings({'dict_default': {'attrs_list': [], 'attrs_constraints': {'id': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'id', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'id', 'help': 'Id of the field.'}), 'field_ref': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'field_ref', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'field_ref', 'help': 'Id of the reference field.'}), 'name': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'name', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'name', 'help': 'Name of the field.'}), 'freq_op': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'freq_op', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'freq_op', 'help': 'Frequency of the operation done on the field.'}), 'freq_offset': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'freq_offset', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'freq_offset', 'help': 'Offset to be applied on operations on the field.'}), 'grid_ref': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'grid_ref', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'grid_ref', 'help': 'Reference grid of the field.'}), 'long_name': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'long_name', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'long_name', 'help': 'Long name of the field.'}), 'standard_name': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'standard_name', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'standard_name', 'help': 'Standard name of the field.'}), 'unit': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'unit', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'unit', 'help': 'Unit of the field.'}), 'operation': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'operation', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'operation', 'help': 'Operation done on the field.'}), 'detect_missing_value': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'detect_missing_value', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'detect_missing_value', 'help': 'Should missing values of the field be detected by XIOS.'}), 'prec': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'prec', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'prec', 'help': 'Precision of the field.'})}, 'vars_list': [], 'vars_constraints': {}, 'comments_list': [], 'comments_constraints': {}, 'help': 'TODO', 'key': 'TODO'}, 'attrs_list': ['id', 'field_ref', 'name', 'freq_op', 'freq_offset', 'grid_ref', 'long_name', 'standard_name', 'unit', 'operation', 'detect_missing_value', 'prec'], 'attrs_constraints': {'id': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'id', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'id', 'help': 'Id of the field.'}), 'field_ref': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'field_ref', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'field_ref', 'help': 'Id of the reference field.'}), 'name': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'name', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'name', 'help': 'Name of the field.'}), 'freq_op': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'freq_op', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'freq_op', 'help': 'Frequency of the operation done on the field.'}), 'freq_offset': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'freq_offset', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'freq_offset', 'help': 'Offset to be applied on operations on the field.'}), 'grid_ref': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'grid_ref', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'grid_ref', 'help': 'Reference grid of the field.'}), 'long_name': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'long_name', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'long_name', 'help': 'Long name of the field.'}), 'standard_name': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'standard_name', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'standard_name', 'help': 'Standard name of the field.'}), 'unit': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'unit', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'unit', 'help': 'Unit of the field.'}), 'operation': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'operation', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'operation', 'help': 'Operation done on the field.'}), 'detect_missing_value': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'detect_missing_value', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'detect_missing_value', 'help': 'Should missing values of the field be detected by XIOS.'}), 'prec': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'prec', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'prec', 'help': 'Precision of the field.'})}, 'vars_list': [], 'vars_constraints': {}, 'comments_list': [], 'comments_constraints': {}, 'help': 'XIOS field beacon (except for output fields)', 'key': 'field'}), 'field_output': TagSettings({'dict_default': {'attrs_list': [], 'attrs_constraints': {'name': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'variable', 'keys': ['mipVarLabel'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'name', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'name', 'help': 'Name of the field.'}), 'field_ref': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'field_ref', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'field_ref', 'help': 'Reference field.'}), 'operation': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'operation', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'operation', 'help': 'Operation performed on the field.'}), 'grid_ref': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': ['', 'None', None], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'grid_ref', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'grid_ref', 'help': 'Reference grid of the field.'}), 'freq_offset': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': ['', 'None', None], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'freq_offset', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'freq_offset', 'help': 'Offset to be applied on operations on the field.'}), 'freq_op': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': ['', 'None', None], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'freq_op', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'freq_op', 'help': 'Frequency of the operation done on the field.'}), 'expr': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': ['', 'None', None], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'expr', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'expr', 'help': 'Expression used to compute the field.'}), 'cell_methods_mode': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': ['overwrite'], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'cell_methods_mode', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'cell_methods_mode', 'help': 'Mode associated with the cell method of the field.'}), 'cell_methods': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'variable', 'keys': ['cell_methods'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'cell_methods', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'cell_methods', 'help': 'Cell method associated with the field.'}), 'prec': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'variable', 'keys': ['prec'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': ['2', '4', '8'], 'authorized_types': [], 'corrections': {'': '4', 'float': '4', 'real': '4', 'double': '8', 'integer': '2', 'int': '2'}, 'output_key': 'prec', 'num_type': 'string', 'is_default': True, 'fatal': True, 'key': 'prec', 'help': 'Precision of the field.'}), 'default_value': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'variable', 'keys': ['prec'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': ['0', '1.e+20'], 'authorized_types': [], 'corrections': {'': '1.e+20', 'float': '1.e+20', 'real': '1.e+20', 'double': '1.e+20', 'integer': '0', 'int': '0'}, 'output_key': 'default_value', 'num_type': 'string', 'is_default': True, 'fatal': True, 'key': 'default_value', 'help': 'Default value associated with the field.'}), 'detect_missing_value': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': ['True'], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'detect_missing_value', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'detect_missing_value', 'help': 'Should missing values of the field be detected by XIOS.'})}, 'vars_list': [], 'vars_constraints': {'standard_name': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': ['', 'None', None], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'variable', 'keys': ['stdname'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'standard_name', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'standard_name', 'help': 'Standard name of the field.'}), 'description': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [''], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'variable', 'keys': ['description'], 'fmt': None, 'src': None, 'func': None}), 'None'], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'description', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'description', 'help': 'Description associated with the field.'}), 'long_name': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'variable', 'keys': ['long_name'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'long_name', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'long_name', 'help': 'Long name of the field.'}), 'history': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['history'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'history', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'history', 'help': 'History associated with the field.'}), 'comment': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': ['', 'None', None], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'simulation', 'keys': ['comments', ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'variable', 'keys': ['label'], 'fmt': None, 'src': None, 'func': None})], 'fmt': None, 'src': None, 'func': None}), ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'laboratory', 'keys': ['comments', ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'variable', 'keys': ['label'], 'fmt': None, 'src': None, 'func': None})], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'comment', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'comment', 'help': 'Comment associated with the field.'}), 'positive': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': ['', 'None', None], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'variable', 'keys': ['positive'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'positive', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'positive', 'help': 'Way the field should be interpreted.'}), 'units': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': ['', 'None', None], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'variable', 'keys': ['units'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'units', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'units', 'help': 'Units associated with the field.'}), 'cell_methods': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': ['', 'None', None], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'variable', 'keys': ['cell_methods'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'cell_methods', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'cell_methods', 'help': 'Cell method associated with the field.'}), 'cell_measures': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': ['', 'None', None], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'variable', 'keys': ['cell_measures'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'cell_measures', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'cell_measures', 'help': 'Cell measures associated with the field.'}), 'flag_meanings': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': ['', 'None', None], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'variable', 'keys': ['flag_meanings'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'flag_meanings', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'flag_meanings', 'help': 'Flag meanings associated with the field.'}), 'flag_values': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': ['', 'None', None], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'variable', 'keys': ['flag_values'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'flag_values', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'flag_values', 'help': 'Flag values associated with the field.'}), 'interval_operation': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [ConditionSettings({'check_value': ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'dict', 'keys': ['operation'], 'fmt': None, 'src': None, 'func': None}), 'check_to_do': 'neq', 'reference_values': ['once']})], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'interval_operation', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'interval_operation', 'help': 'Interval associated with the operation done on the field.'})}, 'comments_list': [], 'comments_constraints': {}, 'help': 'TODO', 'key': 'TODO'}, 'attrs_list': ['field_ref', 'name', 'grid_ref', 'freq_offset', 'detect_missing_value', 'default_value', 'prec', 'cell_methods', 'cell_methods_mode', 'operation', 'freq_op', 'expr'], 'attrs_constraints': {'name': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'variable', 'keys': ['mipVarLabel'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'name', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'name', 'help': 'Name of the field.'}), 'field_ref': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'field_ref', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'field_ref', 'help': 'Reference field.'}), 'operation': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'operation', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'operation', 'help': 'Operation performed on the field.'}), 'grid_ref': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': ['', 'None', None], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'grid_ref', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'grid_ref', 'help': 'Reference grid of the field.'}), 'freq_offset': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': ['', 'None', None], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'freq_offset', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'freq_offset', 'help': 'Offset to be applied on operations on the field.'}), 'freq_op': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': ['', 'None', None], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'freq_op', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'freq_op', 'help': 'Frequency of the operation done on the field.'}), 'expr': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': ['', 'None', None], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'expr', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'expr', 'help': 'Expression used to compute the field.'}), 'cell_methods_mode': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': ['overwrite'], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'cell_methods_mode', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'cell_methods_mode', 'help': 'Mode associated with the cell method of the field.'}), 'cell_methods': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'variable', 'keys': ['cell_methods'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'cell_methods', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'cell_methods', 'help': 'Cell method associated with the field.'}), 'prec': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'variable', 'keys': ['prec'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': ['2', '4', '8'], 'authorized_types': [], 'corrections': {'': '4', 'float': '4', 'real': '4', 'double': '8', 'integer': '2', 'int': '2'}, 'output_key': 'prec', 'num_type': 'string', 'is_default': True, 'fatal': True, 'key': 'prec', 'help': 'Precision of the field.'}), 'default_value': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'variable', 'keys': ['prec'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': ['0', '1.e+20'], 'authorized_types': [], 'corrections': {'': '1.e+20', 'float': '1.e+20', 'real': '1.e+20', 'double': '1.e+20', 'integer': '0', 'int': '0'}, 'output_key': 'default_value', 'num_type': 'string', 'is_default': True, 'fatal': True, 'key': 'default_value', 'help': 'Default value associated with the field.'}), 'detect_missing_value': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': ['True'], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'detect_missing_value', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'detect_missing_value', 'help': 'Should missing values of the field be detected by XIOS.'})}, 'vars_list': ['comment', 'standard_name', 'description', 'long_name', 'positive', 'history', 'units', 'cell_methods', 'cell_measures', 'flag_meanings', 'flag_values', 'interval_operation'], 'vars_constraints': {'standard_name': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': ['', 'None', None], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'variable', 'keys': ['stdname'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'standard_name', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'standard_name', 'help': 'Standard name of the field.'}), 'description': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [''], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'variable', 'keys': ['description'], 'fmt': None, 'src': None, 'func': None}), 'None'], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'description', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'description', 'help': 'Description associated with the field.'}), 'long_name': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'variable', 'keys': ['long_name'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'long_name', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'long_name', 'help': 'Long name of the field.'}), 'history': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'common', 'keys': ['history'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'history', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'history', 'help': 'History associated with the field.'}), 'comment': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': ['', 'None', None], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'simulation', 'keys': ['comments', ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'variable', 'keys': ['label'], 'fmt': None, 'src': None, 'func': None})], 'fmt': None, 'src': None, 'func': None}), ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'laboratory', 'keys': ['comments', ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'variable', 'keys': ['label'], 'fmt': None, 'src': None, 'func': None})], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'comment', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'comment', 'help': 'Comment associated with the field.'}), 'positive': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': ['', 'None', None], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'variable', 'keys': ['positive'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'positive', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'positive', 'help': 'Way the field should be interpreted.'}), 'units': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': ['', 'None', None], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'variable', 'keys': ['units'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'units', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'units', 'help': 'Units associated with the field.'}), 'cell_methods': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': ['', 'None', None], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'variable', 'keys': ['cell_methods'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'cell_methods', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'cell_methods', 'help': 'Cell method associated with the field.'}), 'cell_measures': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': ['', 'None', None], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'variable', 'keys': ['cell_measures'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'cell_measures', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'cell_measures', 'help': 'Cell measures associated with the field.'}), 'flag_meanings': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': ['', 'None', None], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'variable', 'keys': ['flag_meanings'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'flag_meanings', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'flag_meanings', 'help': 'Flag meanings associated with the field.'}), 'flag_values': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': ['', 'None', None], 'forbidden_patterns': [], 'conditions': [], 'default_values': [ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'variable', 'keys': ['flag_values'], 'fmt': None, 'src': None, 'func': None})], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'flag_values', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'flag_values', 'help': 'Flag values associated with the field.'}), 'interval_operation': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [ConditionSettings({'check_value': ValueSettings({'dict_default': {'key_type': None, 'keys': [], 'fmt': None, 'src': None, 'func': None}, 'key_type': 'dict', 'keys': ['operation'], 'fmt': None, 'src': None, 'func': None}), 'check_to_do': 'neq', 'reference_values': ['once']})], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'interval_operation', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'interval_operation', 'help': 'Interval associated with the operation done on the field.'})}, 'comments_list': [], 'comments_constraints': {}, 'help': 'XIOS field beacon (only for output fields)', 'key': 'field_output'}), 'grid': TagSettings({'dict_default': {'attrs_list': [], 'attrs_constraints': {'id': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'id', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'id', 'help': 'Id of the grid.'})}, 'vars_list': [], 'vars_constraints': {}, 'comments_list': [], 'comments_constraints': {}, 'help': 'TODO', 'key': 'TODO'}, 'attrs_list': ['id'], 'attrs_constraints': {'id': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'id', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'id', 'help': 'Id of the grid.'})}, 'vars_list': [], 'vars_constraints': {}, 'comments_list': [], 'comments_constraints': {}, 'help': 'XIOS grid beacon', 'key': 'grid'}), 'grid_definition': TagSettings({'dict_default': {'attrs_list': [], 'attrs_constraints': {}, 'vars_list': [], 'vars_constraints': {}, 'comments_list': [], 'comments_constraints': {}, 'help': 'TODO', 'key': 'TODO'}, 'attrs_list': [], 'attrs_constraints': {}, 'vars_list': [], 'vars_constraints': {}, 'comments_list': [], 'comments_constraints': {}, 'help': 'XIOS grid_definition beacon', 'key': 'grid_definition'}), 'axis': TagSettings({'dict_default': {'attrs_list': [], 'attrs_constraints': {'id': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'id', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'id', 'help': 'Id of the axis.'}), 'positive': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'positive', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'positive', 'help': 'How is the axis oriented?'}), 'n_glo': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'n_glo', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'n_glo', 'help': 'Number of values of this axis.'}), 'axis_ref': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'axis_ref', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'axis_ref', 'help': 'Reference axis.'}), 'name': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'name', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'name', 'help': 'Name of this axis.'}), 'long_name': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'long_name', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'long_name', 'help': 'Long name of this axis.'}), 'axis_type': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': ['', 'None', None], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'axis_type', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'axis_type', 'help': 'Axis type.'}), 'standard_name': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': ['', 'None', None], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': <class 'str'>, 'corrections': {}, 'output_key': 'standard_name', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'standard_name', 'help': 'Standard name of the axis.'}), 'prec': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': ['', 'None', None], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': ['2', '4', '8'], 'authorized_types': [], 'corrections': {'': '4', 'float': '4', 'real': '4', 'double': '8', 'integer': '2', 'int': '2'}, 'output_key': 'prec', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'prec', 'help': 'Precision of the axis.'}), 'unit': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': ['', 'None', None], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'unit', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'unit', 'help': 'Unit of the axis.'}), 'bounds': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': ['', 'None', None], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'bounds', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'bounds', 'help': 'Bounds of the axis.'}), 'dim_name': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': ['', 'None', None], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'dim_name', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'dim_name', 'help': 'Name dimension of the axis.'}), 'label': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': ['', 'None', None], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'label', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'label', 'help': 'Label of the axis.'}), 'value': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': ['', 'None', None], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'value', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'value', 'help': 'Value of the axis.'})}, 'vars_list': [], 'vars_constraints': {}, 'comments_list': [], 'comments_constraints': {}, 'help': 'TODO', 'key': 'TODO'}, 'attrs_list': ['id', 'positive', 'n_glo', 'value', 'axis_ref', 'name', 'standard_name', 'long_name', 'prec', 'unit', 'value', 'bounds', 'dim_name', 'label', 'axis_type'], 'attrs_constraints': {'id': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'id', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'id', 'help': 'Id of the axis.'}), 'positive': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'positive', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'positive', 'help': 'How is the axis oriented?'}), 'n_glo': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'n_glo', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'n_glo', 'help': 'Number of values of this axis.'}), 'axis_ref': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'axis_ref', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'axis_ref', 'help': 'Reference axis.'}), 'name': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'name', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'name', 'help': 'Name of this axis.'}), 'long_name': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'long_name', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'long_name', 'help': 'Long name of this axis.'}), 'axis_type': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': ['', 'None', None], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'axis_type', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'axis_type', 'help': 'Axis type.'}), 'standard_name': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': ['', 'None', None], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': <class 'str'>, 'corrections': {}, 'output_key': 'standard_name', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'standard_name', 'help': 'Standard name of the axis.'}), 'prec': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': ['', 'None', None], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': ['2', '4', '8'], 'authorized_types': [], 'corrections': {'': '4', 'float': '4', 'real': '4', 'double': '8', 'integer': '2', 'int': '2'}, 'output_key': 'prec', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'prec', 'help': 'Precision of the axis.'}), 'unit': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': ['', 'None', None], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'unit', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'unit', 'help': 'Unit of the axis.'}), 'bounds': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': ['', 'None', None], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'bounds', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'bounds', 'help': 'Bounds of the axis.'}), 'dim_name': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': ['', 'None', None], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'dim_name', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'dim_name', 'help': 'Name dimension of the axis.'}), 'label': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': ['', 'None', None], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'label', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'label', 'help': 'Label of the axis.'}), 'value': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': ['', 'None', None], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'value', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'value', 'help': 'Value of the axis.'})}, 'vars_list': [], 'vars_constraints': {}, 'comments_list': [], 'comments_constraints': {}, 'help': 'XIOS axis beacon', 'key': 'axis'}), 'zoom_axis': TagSettings({'dict_default': {'attrs_list': [], 'attrs_constraints': {'index': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'index', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'index', 'help': 'Index of the zoomed axis.'})}, 'vars_list': [], 'vars_constraints': {}, 'comments_list': [], 'comments_constraints': {}, 'help': 'TODO', 'key': 'TODO'}, 'attrs_list': ['index'], 'attrs_constraints': {'index': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'index', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'index', 'help': 'Index of the zoomed axis.'})}, 'vars_list': [], 'vars_constraints': {}, 'comments_list': [], 'comments_constraints': {}, 'help': 'XIOS zoom_axis beacon', 'key': 'zoom_axis'}), 'interpolate_axis': TagSettings({'dict_default': {'attrs_list': [], 'attrs_constraints': {'type': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'type', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'type', 'help': 'Type of the interpolated axis.'}), 'order': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'order', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'order', 'help': 'Order of the interpolated axis.'}), 'coordinate': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'coordinate', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'coordinate', 'help': 'Coordinate of the interpolated axis.'})}, 'vars_list': [], 'vars_constraints': {}, 'comments_list': [], 'comments_constraints': {}, 'help': 'TODO', 'key': 'TODO'}, 'attrs_list': ['type', 'order', 'coordinate'], 'attrs_constraints': {'type': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'type', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'type', 'help': 'Type of the interpolated axis.'}), 'order': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'order', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'order', 'help': 'Order of the interpolated axis.'}), 'coordinate': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'coordinate', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'coordinate', 'help': 'Coordinate of the interpolated axis.'})}, 'vars_list': [], 'vars_constraints': {}, 'comments_list': [], 'comments_constraints': {}, 'help': 'XIOS interpolate_axis beacon', 'key': 'interpolate_axis'}), 'axis_definition': TagSettings({'dict_default': {'attrs_list': [], 'attrs_constraints': {}, 'vars_list': [], 'vars_constraints': {}, 'comments_list': [], 'comments_constraints': {}, 'help': 'TODO', 'key': 'TODO'}, 'attrs_list': [], 'attrs_constraints': {}, 'vars_list': [], 'vars_constraints': {}, 'comments_list': [], 'comments_constraints': {}, 'help': 'XIOS axis_definition beacon', 'key': 'axis_definition'}), 'axis_group': TagSettings({'dict_default': {'attrs_list': [], 'attrs_constraints': {'prec': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': ['8'], 'cases': [], 'authorized_values': ['2', '4', '8'], 'authorized_types': [], 'corrections': {'': '4', 'float': '4', 'real': '4', 'double': '8', 'integer': '2', 'int': '2'}, 'output_key': 'prec', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'prec', 'help': 'Precision associated with the axis group.'})}, 'vars_list': [], 'vars_constraints': {}, 'comments_list': [], 'comments_constraints': {}, 'help': 'TODO', 'key': 'TODO'}, 'attrs_list': ['prec'], 'attrs_constraints': {'prec': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': ['8'], 'cases': [], 'authorized_values': ['2', '4', '8'], 'authorized_types': [], 'corrections': {'': '4', 'float': '4', 'real': '4', 'double': '8', 'integer': '2', 'int': '2'}, 'output_key': 'prec', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'prec', 'help': 'Precision associated with the axis group.'})}, 'vars_list': [], 'vars_constraints': {}, 'comments_list': [], 'comments_constraints': {}, 'help': 'XIOS axis_group beacon', 'key': 'axis_group'}), 'temporal_splitting': TagSettings({'dict_default': {'attrs_list': [], 'attrs_constraints': {}, 'vars_list': [], 'vars_constraints': {}, 'comments_list': [], 'comments_constraints': {}, 'help': 'TODO', 'key': 'TODO'}, 'attrs_list': [], 'attrs_constraints': {}, 'vars_list': [], 'vars_constraints': {}, 'comments_list': [], 'comments_constraints': {}, 'help': 'XIOS temporal_splitting beacon', 'key': 'temporal_splitting'}), 'domain': TagSettings({'dict_default': {'attrs_list': [], 'attrs_constraints': {'id': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'id', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'id', 'help': 'Id of the domain.'}), 'ni_glo': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'ni_glo', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'ni_glo', 'help': 'Number of points on i dimension.'}), 'nj_glo': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'nj_glo', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'nj_glo', 'help': 'Number of points on j dimension.'}), 'type': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'type', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'type', 'help': 'Type of the domain.'}), 'prec': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'prec', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'prec', 'help': 'Precision of the domain.'}), 'lat_name': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'lat_name', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'lat_name', 'help': 'Latitude axis name.'}), 'lon_name': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'lon_name', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'lon_name', 'help': 'Longitude axis name.'}), 'dim_i_name': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'dim_i_name', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'dim_i_name', 'help': 'Name of the i dimension.'}), 'domain_ref': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'domain_ref', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'domain_ref', 'help': 'Reference domain.'})}, 'vars_list': [], 'vars_constraints': {}, 'comments_list': [], 'comments_constraints': {}, 'help': 'TODO', 'key': 'TODO'}, 'attrs_list': ['id', 'ni_glo', 'nj_glo', 'type', 'prec', 'lat_name', 'lon_name', 'dim_i_name', 'domain_ref'], 'attrs_constraints': {'id': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'id', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'id', 'help': 'Id of the domain.'}), 'ni_glo': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'ni_glo', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'ni_glo', 'help': 'Number of points on i dimension.'}), 'nj_glo': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'nj_glo', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'nj_glo', 'help': 'Number of points on j dimension.'}), 'type': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'type', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'type', 'help': 'Type of the domain.'}), 'prec': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'prec', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'prec', 'help': 'Precision of the domain.'}), 'lat_name': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'lat_name', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'lat_name', 'help': 'Latitude axis name.'}), 'lon_name': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'lon_name', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'lon_name', 'help': 'Longitude axis name.'}), 'dim_i_name': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'dim_i_name', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'dim_i_name', 'help': 'Name of the i dimension.'}), 'domain_ref': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'domain_ref', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'domain_ref', 'help': 'Reference domain.'})}, 'vars_list': [], 'vars_constraints': {}, 'comments_list': [], 'comments_constraints': {}, 'help': 'XIOS domain beacon', 'key': 'domain'}), 'generate_rectilinear_domain': TagSettings({'dict_default': {'attrs_list': [], 'attrs_constraints': {}, 'vars_list': [], 'vars_constraints': {}, 'comments_list': [], 'comments_constraints': {}, 'help': 'TODO', 'key': 'TODO'}, 'attrs_list': [], 'attrs_constraints': {}, 'vars_list': [], 'vars_constraints': {}, 'comments_list': [], 'comments_constraints': {}, 'help': 'XIOS generate_rectilinear_domain beacon', 'key': 'generate_rectilinear_domain'}), 'interpolate_domain': TagSettings({'dict_default': {'attrs_list': [], 'attrs_constraints': {'type': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'type', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'type', 'help': 'Type of the interpolated domain.'}), 'order': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'order', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'order', 'help': 'Order of the interpolation.'}), 'renormalize': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'renormalize', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'renormalize', 'help': 'Should the interpolated domain be renormalized?'}), 'mode': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'mode', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'mode', 'help': 'Mode used for the interpolation.'}), 'write_weight': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'write_weight', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'write_weight', 'help': 'Should interpolation weights be written?'}), 'coordinate': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'coordinate', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'coordinate', 'help': 'Coordinate of the interpolated domain.'})}, 'vars_list': [], 'vars_constraints': {}, 'comments_list': [], 'comments_constraints': {}, 'help': 'TODO', 'key': 'TODO'}, 'attrs_list': ['type', 'order', 'renormalize', 'mode', 'write_weight', 'coordinate'], 'attrs_constraints': {'type': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'type', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'type', 'help': 'Type of the interpolated domain.'}), 'order': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'order', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'order', 'help': 'Order of the interpolation.'}), 'renormalize': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'renormalize', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'renormalize', 'help': 'Should the interpolated domain be renormalized?'}), 'mode': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'mode', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'mode', 'help': 'Mode used for the interpolation.'}), 'write_weight': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'write_weight', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'write_weight', 'help': 'Should interpolation weights be written?'}), 'coordinate': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'coordinate', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'coordinate', 'help': 'Coordinate of the interpolated domain.'})}, 'vars_list': [], 'vars_constraints': {}, 'comments_list': [], 'comments_constraints': {}, 'help': 'XIOS interpolate_domain beacon', 'key': 'interpolate_domain'}), 'domain_definition': TagSettings({'dict_default': {'attrs_list': [], 'attrs_constraints': {}, 'vars_list': [], 'vars_constraints': {}, 'comments_list': [], 'comments_constraints': {}, 'help': 'TODO', 'key': 'TODO'}, 'attrs_list': [], 'attrs_constraints': {}, 'vars_list': [], 'vars_constraints': {}, 'comments_list': [], 'comments_constraints': {}, 'help': 'XIOS domain_definition beacon', 'key': 'domain_definition'}), 'domain_group': TagSettings({'dict_default': {'attrs_list': [], 'attrs_constraints': {'prec': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': ['8'], 'cases': [], 'authorized_values': ['2', '4', '8'], 'authorized_types': [], 'corrections': {'': '4', 'float': '4', 'real': '4', 'double': '8', 'integer': '2', 'int': '2'}, 'output_key': 'prec', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'prec', 'help': 'Precision associated with the domain group.'})}, 'vars_list': [], 'vars_constraints': {}, 'comments_list': [], 'comments_constraints': {}, 'help': 'TODO', 'key': 'TODO'}, 'attrs_list': ['prec'], 'attrs_constraints': {'prec': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': ['8'], 'cases': [], 'authorized_values': ['2', '4', '8'], 'authorized_types': [], 'corrections': {'': '4', 'float': '4', 'real': '4', 'double': '8', 'integer': '2', 'int': '2'}, 'output_key': 'prec', 'num_type': 'string', 'is_default': True, 'fatal': False, 'key': 'prec', 'help': 'Precision associated with the domain group.'})}, 'vars_list': [], 'vars_constraints': {}, 'comments_list': [], 'comments_constraints': {}, 'help': 'XIOS domain_group beacon', 'key': 'domain_group'}), 'scalar': TagSettings({'dict_default': {'attrs_list': [], 'attrs_constraints': {'id': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'id', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'id', 'help': 'Id of the scalar.'}), 'scalar_ref': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'scalar_ref', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'scalar_ref', 'help': 'Reference scalar.'}), 'name': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'name', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'name', 'help': 'Name of the scalar.'}), 'long_name': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'long_name', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'long_name', 'help': 'Long name of the scalar.'}), 'standard_name': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': ['', 'None', None], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'standard_name', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'standard_name', 'help': 'Standard name of the scalar.'}), 'axis_type': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': ['', 'None', None], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'axis_type', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'axis_type', 'help': 'Axis type of the scalar.'}), 'unit': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': ['', 'None', None], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'unit', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'unit', 'help': 'Unit of the scalar.'}), 'label': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': ['', 'None', None], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'label', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'label', 'help': 'Label of the scalar.'}), 'bounds': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': ['', 'None', None], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'bounds', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'bounds', 'help': 'Bounds of the scalar.'}), 'bounds_name': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': ['', 'None', None], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'bounds_name', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'bounds_name', 'help': 'Bounds name of the scalar.'}), 'prec': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': ['', 'None', None], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': ['2', '4', '8'], 'authorized_types': [], 'corrections': {'': '4', 'float': '4', 'real': '4', 'double': '8', 'integer': '2', 'int': '2'}, 'output_key': 'prec', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'prec', 'help': 'Precision of the scalar.'}), 'value': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': ['', 'None', None], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'value', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'value', 'help': 'Value of the scalar.'}), 'positive': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': ['', 'None', None], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'positive', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'positive', 'help': 'Orientation of the scalar.'})}, 'vars_list': [], 'vars_constraints': {}, 'comments_list': [], 'comments_constraints': {}, 'help': 'TODO', 'key': 'TODO'}, 'attrs_list': ['id', 'scalar_ref', 'name', 'standard_name', 'long_name', 'label', 'prec', 'value', 'bounds', 'bounds_name', 'axis_type', 'positive', 'unit'], 'attrs_constraints': {'id': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'id', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'id', 'help': 'Id of the scalar.'}), 'scalar_ref': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'scalar_ref', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'scalar_ref', 'help': 'Reference scalar.'}), 'name': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'name', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'name', 'help': 'Name of the scalar.'}), 'long_name': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'long_name', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'long_name', 'help': 'Long name of the scalar.'}), 'standard_name': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': ['', 'None', None], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'standard_name', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'standard_name', 'help': 'Standard name of the scalar.'}), 'axis_type': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': ['', 'None', None], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'axis_type', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'axis_type', 'help': 'Axis type of the scalar.'}), 'unit': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': ['', 'None', None], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'unit', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'unit', 'help': 'Unit of the scalar.'}), 'label': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': ['', 'None', None], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'label', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'label', 'help': 'Label of the scalar.'}), 'bounds': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': ['', 'None', None], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'bounds', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'bounds', 'help': 'Bounds of the scalar.'}), 'bounds_name': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': ['', 'None', None], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'bounds_name', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'bounds_name', 'help': 'Bounds name of the scalar.'}), 'prec': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': ['', 'None', None], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': ['2', '4', '8'], 'authorized_types': [], 'corrections': {'': '4', 'float': '4', 'real': '4', 'double': '8', 'integer': '2', 'int': '2'}, 'output_key': 'prec', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'prec', 'help': 'Precision of the scalar.'}), 'value': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': ['', 'None', None], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'value', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'value', 'help': 'Value of the scalar.'}), 'positive': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': ['', 'None', None], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'positive', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'positive', 'help': 'Orientation of the scalar.'})}, 'vars_list': [], 'vars_constraints': {}, 'comments_list': [], 'comments_constraints': {}, 'help': 'XIOS scalar beacon', 'key': 'scalar'}), 'duplicate_scalar': TagSettings({'dict_default': {'attrs_list': [], 'attrs_constraints': {}, 'vars_list': [], 'vars_constraints': {}, 'comments_list': [], 'comments_constraints': {}, 'help': 'TODO', 'key': 'TODO'}, 'attrs_list': [], 'attrs_constraints': {}, 'vars_list': [], 'vars_constraints': {}, 'comments_list': [], 'comments_constraints': {}, 'help': 'XIOS duplicate_scalar beacon', 'key': 'duplicate_scalar'}), 'scalar_definition': TagSettings({'dict_default': {'attrs_list': [], 'attrs_constraints': {}, 'vars_list': [], 'vars_constraints': {}, 'comments_list': [], 'comments_constraints': {}, 'help': 'TODO', 'key': 'TODO'}, 'attrs_list': [], 'attrs_constraints': {}, 'vars_list': [], 'vars_constraints': {}, 'comments_list': [], 'comments_constraints': {}, 'help': 'XIOS scalar_definition beacon', 'key': 'scalar_definition'}), 'variable': TagSettings({'dict_default': {'attrs_list': [], 'attrs_constraints': {}, 'vars_list': [], 'vars_constraints': {}, 'comments_list': [], 'comments_constraints': {}, 'help': 'TODO', 'key': 'TODO'}, 'attrs_list': ['name', 'type'], 'attrs_constraints': {'name': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'name', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'name', 'help': 'Content of the variable'}), 'type': ParameterSettings({'dict_default': {'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': None, 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': None, 'help': 'TODO'}, 'skip_values': [], 'forbidden_patterns': [], 'conditions': [], 'default_values': [], 'cases': [], 'authorized_values': [], 'authorized_types': [], 'corrections': {}, 'output_key': 'type', 'num_type': 'string', 'is_default': False, 'fatal': False, 'key': 'type', 'help': "Encoding type of the variable's content."})}, 'vars_list': [], 'vars_constraints': {}, 'comments_list': [], 'comments_constraints': {}, 'help': 'XIOS variable beacon', 'key': 'variable'})}
\ No newline at end of file
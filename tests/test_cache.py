@@ -0,0 +1,72 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Tests the persistent caches tools.
+"""
+from __future__ import division, print_function, unicode_literals, absolute_import
+
+import logging
+import unittest
+import sys
+import os
+import shutil
+import tempfile
+
+import six
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dr2xml.utils import read_pickle_content, write_pickle_content, prune_cache_directory
+from dr2xml.vars_interface.home_data_request import HomeVarsMessagesRecorder, replay_home_vars_messages
+from logger import get_logger
+
+
+class TestCache(unittest.TestCase):
+
+	def setUp(self):
+		self.tmp_dir = tempfile.mkdtemp()
+
+	def tearDown(self):
+		shutil.rmtree(self.tmp_dir)
+
+	def test_prune(self):
+		filenames = [os.sep.join([self.tmp_dir, "cache_%d.pkl" % i]) for i in range(5)]
+		for (i, filename) in enumerate(filenames):
+			self.assertTrue(write_pickle_content(filename, i))
+			os.utime(filename, (1000 + i, 1000 + i))
+		with open(os.sep.join([self.tmp_dir, "other_file"]), "w") as other_file:
+			other_file.write("not a cache file")
+		# Reading a file marks it as recently used
+		self.assertEqual(read_pickle_content(filenames[0]), 0)
+		self.assertListEqual(sorted(prune_cache_directory(self.tmp_dir, max_files=3)), filenames[1:3])
+		self.assertListEqual(sorted(os.listdir(self.tmp_dir)), ["cache_0.pkl", "cache_3.pkl", "cache_4.pkl",
+		                                                       "other_file"])
+
+	def test_home_vars_messages(self):
+		logger = get_logger()
+		default_level = logger.level
+		log_stream = six.StringIO()
+		handler = logging.StreamHandler(log_stream)
+		logger.setLevel(logging.INFO)
+		logger.addHandler(handler)
+		stdout = sys.stdout
+		sys.stdout = six.StringIO()
+		try:
+			with HomeVarsMessagesRecorder() as recorder:
+				logger.info("For extra table CNRM_test")
+				print("Warning: 'extra' variable test not found")
+				logger.debug("Not emitted")
+			replay_home_vars_messages(recorder.messages)
+			printed = sys.stdout.getvalue()
+		finally:
+			sys.stdout = stdout
+			logger.removeHandler(handler)
+			logger.setLevel(default_level)
+		self.assertEqual(log_stream.getvalue(), 2 * "For extra table CNRM_test\n")
+		self.assertEqual(printed, 2 * "Warning: 'extra' variable test not found\n")
+		self.assertNotIn(recorder, logger.handlers)
+
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Tests the daemon mode.
+"""
+from __future__ import division, print_function, unicode_literals, absolute_import
+
+import unittest
+import json
+import sys
+import os
+import socket
+import stat
+import tempfile
+import threading
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dr2xml.daemon import encode_value, decode_value, create_server, submit_job
+from dr2xml.utils import Dr2xmlError
+
+
+class TestDaemon(unittest.TestCase):
+
+	def test_encoding(self):
+		value = dict(mips={"grid_1": {"CMIP", "CORDEX"}}, grids=dict(LR=dict(nemo=("gn", "", "", "1 deg", ""))),
+		             levels={1: [0, 1.5], 2: None}, __key__="value", prefix="CMIP6_")
+		self.assertEqual(decode_value(json.loads(json.dumps(encode_value(value)))), value)
+
+	def test_server(self):
+		address = os.path.join(tempfile.mkdtemp(), "dr2xml.sock")
+		server = create_server(address)
+		# Only the owner of the daemon can connect to it
+		self.assertEqual(stat.S_IMODE(os.stat(address).st_mode) & 0o077, 0)
+		thread = threading.Thread(target=server.handle_request)
+		thread.start()
+		response = submit_job(address, "status", timeout=10)
+		thread.join()
+		self.assertEqual(response["status"], "ok")
+		self.assertEqual(response["pid"], os.getpid())
+		thread = threading.Thread(target=server.handle_request)
+		thread.start()
+		response = submit_job(address, "unknown_job", lset=dict(), sset=dict(), timeout=10)
+		thread.join()
+		self.assertEqual(response["status"], "error")
+		server.server_close()
+		self.assertFalse(os.path.exists(address))
+
+	def test_existing_address(self):
+		address = os.path.join(tempfile.mkdtemp(), "dr2xml.sock")
+		# A file which is not a socket is kept
+		with open(address, "w") as fic:
+			fic.write("not a socket")
+		with self.assertRaises(Dr2xmlError):
+			create_server(address)
+		with open(address, "r") as fic:
+			self.assertEqual(fic.read(), "not a socket")
+		os.remove(address)
+		# The socket of a daemon which is not running anymore is replaced
+		stale_socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+		stale_socket.bind(address)
+		stale_socket.close()
+		server = create_server(address)
+		# The socket of a running daemon is kept
+		with self.assertRaises(Dr2xmlError):
+			create_server(address)
+		self.assertTrue(stat.S_ISSOCK(os.lstat(address).st_mode))
+		# The running daemon first handles the connection used to check that it is running, then the job
+		thread = threading.Thread(target=lambda: [server.handle_request() for _ in range(2)])
+		thread.start()
+		response = submit_job(address, "status", timeout=10)
+		thread.join()
+		self.assertEqual(response["status"], "ok")
+		server.server_close()
+		self.assertFalse(os.path.exists(address))
+
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Tests the fingerprints used to report the changes of the file_defs.
+"""
+from __future__ import division, print_function, unicode_literals, absolute_import
+
+import unittest
+from collections import OrderedDict
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from xml_writer import Element, Comment
+from dr2xml.file_def_changes import compute_files_fingerprints, compare_fingerprints, get_files_keys
+
+
+def create_element(tag, text=None, children=list(), **attrib):
+	rep = Element(tag=tag, text=text, attrib=OrderedDict(sorted(attrib.items())))
+	for child in children:
+		rep.append(child)
+	return rep
+
+
+def create_context(grid_2_axis="axis_2"):
+	file_definition = create_element("file_definition", children=[
+		create_element("file", id="file_1", children=[create_element("field", field_ref="field_1_average")]),
+		create_element("file", id="file_2", children=[create_element("field", field_ref="field_2")])
+	])
+	field_definition = create_element("field_definition", children=[
+		create_element("field", id="field_1", grid_ref="grid_1"),
+		create_element("field", id="field_1_average", field_ref="field_1", operation="average"),
+		create_element("field", id="field_2", text="@field_3", grid_ref="grid_1"),
+		create_element("field", id="field_3", grid_ref="grid_2")
+	])
+	grid_definition = create_element("grid_definition", children=[
+		create_element("grid", id="grid_1", children=[create_element("axis", axis_ref="axis_1")]),
+		create_element("grid", id="grid_2", children=[create_element("axis", axis_ref=grid_2_axis)])
+	])
+	return create_element("context", children=[file_definition, field_definition, grid_definition])
+
+
+class TestFileDefChangesReport(unittest.TestCase):
+
+	def test_files_keys(self):
+		# The files without id nor name are identified by their rank among the file elements
+		file_definition = create_element("file_definition", children=[
+			Comment("A comment"), create_element("file", children=[create_element("field", field_ref="field_1")]),
+			create_element("file", name="file_name"), create_element("file")
+		])
+		self.assertEqual([key for (key, _) in get_files_keys(file_definition)], ["file_0", "file_name", "file_2"])
+		self.assertEqual([xml_file for (_, xml_file) in get_files_keys(file_definition)], file_definition.children[1:])
+		context = create_element("context", children=[file_definition, ])
+		self.assertEqual(list(compute_files_fingerprints(context)), ["file_0", "file_name", "file_2"])
+
+	def test_files_fingerprints(self):
+		fingerprints = compute_files_fingerprints(create_context(), dict(file_1="inputs_1"))
+		self.assertEqual(list(fingerprints), ["file_1", "file_2"])
+		self.assertEqual(fingerprints["file_1"]["inputs"], "inputs_1")
+		self.assertIsNone(fingerprints["file_2"]["inputs"])
+		self.assertEqual(fingerprints, compute_files_fingerprints(create_context(), dict(file_1="inputs_1")))
+		# Only file_2 depends on grid_2, through the expression of field_2
+		new_fingerprints = compute_files_fingerprints(create_context(grid_2_axis="axis_3"), dict(file_1="inputs_1"))
+		self.assertEqual(fingerprints["file_1"], new_fingerprints["file_1"])
+		self.assertNotEqual(fingerprints["file_2"], new_fingerprints["file_2"])
+
+	def test_changes_summary(self):
+		old_files = OrderedDict([("file_1", dict(fingerprint="a", inputs="1")),
+		                         ("file_2", dict(fingerprint="b", inputs="2")),
+		                         ("file_3", dict(fingerprint="c", inputs="3")),
+		                         ("file_4", dict(fingerprint="d", inputs="4"))])
+		new_files = OrderedDict([("file_1", dict(fingerprint="a", inputs="1")),
+		                         ("file_2", dict(fingerprint="e", inputs="2")),
+		                         ("file_3", dict(fingerprint="c", inputs="5")),
+		                         ("file_5", dict(fingerprint="f", inputs="6"))])
+		changes = compare_fingerprints(old_files, new_files)
+		self.assertEqual(changes["unchanged"], ["file_1", ])
+		self.assertEqual(changes["changed"], ["file_2", "file_3"])
+		self.assertEqual(changes["inputs_changed"], ["file_3", ])
+		self.assertEqual(changes["added"], ["file_5", ])
+		self.assertEqual(changes["removed"], ["file_4", ])
+
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,235 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Tests generation contexts.
+"""
+from __future__ import division, print_function, unicode_literals, absolute_import
+
+import ast
+import unittest
+from collections import OrderedDict
+import sys
+import os
+import threading
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dr2xml.config import initialize_config_variables, get_config_variable, set_config_variable, \
+	add_value_in_list_config_variable, GenerationContext, get_active_generation_context, generation_state_variables, \
+	generation_bound_variables, generation_lock
+from dr2xml.settings_interface import set_internal_value, get_settings_values
+
+
+#: Module-level mutable variables which are not part of the state of a generation
+shared_module_variables = [
+	# Constant tables
+	("dr2xml", "example_lab_and_model_settings"),
+	("dr2xml", "example_simulation_settings"),
+	("dr2xml.Xparse", "attributes"),
+	("dr2xml.Xparse", "tags_to_merge"),
+	("dr2xml.analyzer", "cellmethod2area_dict"),
+	("dr2xml.analyzer", "DR_grid_to_grid_atts_dict"),
+	("dr2xml.dr_interface.C3S_DR", "c3s_nc_dims"),
+	("dr2xml.dr_interface.C3S_DR", "c3s_nc_coords"),
+	("dr2xml.dr_interface.C3S_DR", "c3s_nc_comvars"),
+	("dr2xml.dr_interface.C3S_DR", "c3s_nc_vars"),
+	("dr2xml.file_splitting", "split_freq_units_list"),
+	("dr2xml.file_splitting", "units_dict"),
+	("dr2xml.file_def_changes", "references_attributes"),
+	("dr2xml.projects.projects_interface_definitions", "check_functions"),
+	("dr2xml.vars_interface.cmor", "home_attrs"),
+	("dr2xml.vars_interface.dev", "home_attrs"),
+	("dr2xml.vars_interface.extra", "home_attrs"),
+	("dr2xml.vars_interface.perso", "home_attrs"),
+	("dr2xml.vars_interface.generic", "tcmName2tcmValue"),
+	("dr2xml.vars_interface.generic", "multi_plev_suffixes"),
+	("dr2xml.vars_interface.generic", "single_plev_suffixes"),
+	# Set before each use from the arguments of the function which reads it
+	("dr2xml.file_splitting", "freq_type_dict"),
+	# Data Request and caches shared by all generation contexts, checked against their inputs before each use
+	("dr2xml.dr_interface", "data_request"),
+	("dr2xml.dr_interface.no", "data_request"),
+	("dr2xml.dr_interface.CMIP6", "data_request"),
+	("dr2xml.dr_interface.C3S", "data_request"),
+	("dr2xml.projects.projects_interface_definitions", "compiled_regexps"),
+	("dr2xml.utils", "_json_files_cache"),
+	("dr2xml.utils", "_json_values_cache"),
+	("dr2xml.xml_interface", "dr2xml_elements_templates"),
+	# Bookkeeping of the generation contexts themselves
+	("dr2xml.config", "generation_state_variables"),
+	("dr2xml.config", "generation_bound_variables"),
+	("dr2xml.config", "active_generation_contexts"),
+	("dr2xml.daemon", "generation_contexts"),
+	("dr2xml.daemon", "daemon_jobs"),
+	# Jobs of the pool of processes, emptied at the end of generate_file_defs_for_contexts
+	("dr2xml", "generation_jobs"),
+]
+
+#: Constructors of mutable objects
+mutable_constructors = ["dict", "list", "set", "OrderedDict", "defaultdict", "PingVariables"]
+
+
+def is_mutable_value(node):
+	if isinstance(node, (ast.List, ast.Dict, ast.Set, ast.ListComp, ast.DictComp, ast.SetComp)):
+		return True
+	elif isinstance(node, ast.Call):
+		func = node.func
+		if isinstance(func, ast.Attribute):
+			func = func.attr
+		elif isinstance(func, ast.Name):
+			func = func.id
+		return func in mutable_constructors
+	else:
+		return False
+
+
+def iterate_on_module_statements(statements):
+	for statement in statements:
+		yield statement
+		if isinstance(statement, (ast.If, ast.Try)):
+			for body in ["body", "orelse", "finalbody"]:
+				for sub_statement in iterate_on_module_statements(getattr(statement, body, list())):
+					yield sub_statement
+			for handler in getattr(statement, "handlers", list()):
+				for sub_statement in iterate_on_module_statements(handler.body):
+					yield sub_statement
+
+
+def find_module_state_variables():
+	"""
+	Find the module-level variables of dr2xml which are mutable or which are rebound by a function.
+	:return: a dictionary of the (module, variable) found with the line where they are found
+	"""
+	rep = OrderedDict()
+	package_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "dr2xml")
+	for (dirpath, dirnames, filenames) in os.walk(package_dir):
+		dirnames[:] = sorted(dirname for dirname in dirnames if dirname != "__pycache__")
+		for filename in sorted(filename for filename in filenames if filename.endswith(".py")):
+			path = os.path.join(dirpath, filename)
+			module_name = os.path.relpath(path, os.path.dirname(package_dir))[:-len(".py")].replace(os.sep, ".")
+			if module_name.endswith(".__init__"):
+				module_name = module_name[:-len(".__init__")]
+			with open(path) as fp:
+				tree = ast.parse(fp.read(), filename=path)
+			module_rep = OrderedDict()
+			for statement in iterate_on_module_statements(tree.body):
+				if isinstance(statement, ast.Assign) and is_mutable_value(statement.value):
+					for target in statement.targets:
+						if isinstance(target, ast.Name):
+							module_rep[(module_name, target.id)] = "%s:%d" % (path, statement.lineno)
+			# Project settings files are read by read_project_settings, they are not modules of dr2xml
+			if module_name.startswith("dr2xml.projects.") and (module_name, "project_settings") in module_rep:
+				continue
+			for node in ast.walk(tree):
+				if isinstance(node, ast.Global):
+					for variable in node.names:
+						module_rep[(module_name, variable)] = "%s:%d" % (path, node.lineno)
+			rep.update(module_rep)
+	return rep
+
+
+class FailingGenerationContext(GenerationContext):
+	"""
+	Generation context whose state can not be loaded completely.
+	"""
+
+	def _load_state(self, state):
+		GenerationContext._load_state(state)
+		if state is self.state:
+			raise RuntimeError("Could not load the state")
+
+
+def is_generation_lock_free():
+	"""
+	Check that another thread can acquire the generation lock.
+	"""
+	rep = list()
+
+	def acquire_lock():
+		if generation_lock.acquire(timeout=1):
+			generation_lock.release()
+			rep.append(True)
+
+	thread = threading.Thread(target=acquire_lock)
+	thread.start()
+	thread.join()
+	return len(rep) > 0
+
+
+class TestGenerationContext(unittest.TestCase):
+
+	def setUp(self):
+		initialize_config_variables()
+		set_internal_value("axis_count", 0)
+
+	def test_isolation(self):
+		set_config_variable("pingvars", ["process_var", ])
+		context_1 = GenerationContext()
+		context_2 = GenerationContext()
+		with context_1:
+			self.assertIs(get_active_generation_context(), context_1)
+			self.assertEqual(get_config_variable("pingvars"), list())
+			self.assertIsNone(get_config_variable("context_index"))
+			self.assertIsNone(get_settings_values("internal_values"))
+			add_value_in_list_config_variable("pingvars", "var_1")
+			set_internal_value("axis_count", 1)
+		with context_2:
+			self.assertEqual(get_config_variable("pingvars"), list())
+			add_value_in_list_config_variable("pingvars", "var_2")
+		with context_1:
+			self.assertEqual(get_config_variable("pingvars"), ["var_1", ])
+			self.assertEqual(get_settings_values("internal_values", "axis_count"), 1)
+		self.assertIsNone(get_active_generation_context())
+		self.assertEqual(get_config_variable("pingvars"), ["process_var", ])
+		self.assertEqual(get_settings_values("internal_values", "axis_count"), 0)
+
+	def test_nesting(self):
+		context_1 = GenerationContext()
+		context_2 = GenerationContext()
+		with context_1:
+			set_config_variable("ping_refs", OrderedDict(var_1="ref_1"))
+			with context_2:
+				self.assertIs(get_active_generation_context(), context_2)
+				self.assertEqual(get_config_variable("ping_refs"), OrderedDict())
+				with context_1:
+					self.assertEqual(get_config_variable("ping_refs"), OrderedDict(var_1="ref_1"))
+					set_config_variable("ping_refs", OrderedDict(var_1="ref_2"))
+				self.assertEqual(get_config_variable("ping_refs"), OrderedDict())
+			self.assertIs(get_active_generation_context(), context_1)
+			self.assertEqual(get_config_variable("ping_refs"), OrderedDict(var_1="ref_2"))
+		self.assertIsNone(get_active_generation_context())
+
+	def test_failed_activation(self):
+		set_config_variable("pingvars", ["process_var", ])
+		failing_context = FailingGenerationContext()
+		failing_context.state = {("dr2xml.config", "pingvars"): ["context_var", ]}
+		with self.assertRaises(RuntimeError):
+			failing_context.activate()
+		self.assertIsNone(get_active_generation_context())
+		self.assertEqual(get_config_variable("pingvars"), ["process_var", ])
+		self.assertTrue(is_generation_lock_free())
+		context_1 = GenerationContext()
+		with context_1:
+			set_config_variable("pingvars", ["var_1", ])
+			with self.assertRaises(RuntimeError):
+				with failing_context:
+					pass
+			self.assertIs(get_active_generation_context(), context_1)
+			self.assertEqual(get_config_variable("pingvars"), ["var_1", ])
+		self.assertTrue(is_generation_lock_free())
+		self.assertEqual(get_config_variable("pingvars"), ["process_var", ])
+
+	def test_state_variables_are_listed(self):
+		listed = set((module_name, variable) for (module_name, variable, _) in generation_state_variables)
+		listed |= set(generation_bound_variables)
+		listed |= set(shared_module_variables)
+		missing = ["%s.%s (%s)" % (module_name, variable, location)
+		           for ((module_name, variable), location) in find_module_state_variables().items()
+		           if (module_name, variable) not in listed]
+		self.assertListEqual(missing, list(), "Module-level mutable variables must be added to "
+		                                      "dr2xml.config.generation_state_variables: %s" % ", ".join(missing))
+
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,139 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Tests the generation of the file_defs of several years or several contexts.
+"""
+from __future__ import division, print_function, unicode_literals, absolute_import
+
+import contextlib
+import copy
+import io
+import shutil
+import tempfile
+import unittest
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dr2xml import generate_file_defs, generate_file_defs_for_years, generate_file_defs_for_contexts
+from dr2xml.config import GenerationContext
+from dr2xml.settings_interface import get_settings_values
+from tests.tools_for_tests import create_config_elements
+
+
+def read_output(filename, dirname):
+	with open(filename, "r", encoding="utf-8") as fic:
+		return fic.read().replace(dirname, "{dirname}")
+
+
+class TestGenerationJobs(unittest.TestCase):
+
+	def setUp(self):
+		self.config = create_config_elements(
+			simulation="amip_hist_AGCM_1870_r10",
+			contexts=["surfex", "trip"],
+			year="1870",
+			enddate="18710101",
+			pingfiles="{path_xml}/ping_surfex.xml {path_xml}/ping_trip.xml",
+			attributes=[('EXPID', 'CNRM-CM6-1_amip-hist_r10i1p1f2'),
+			            ('CMIP6_CV_version', 'cv=6.2.3.0-7-g2019642'),
+			            ('dr2xml_md5sum', '7040f60f6bf3118dc6c58b9fb8727d87')]
+		)
+		self.kwargs = copy.deepcopy(self.config["config"])
+		for key in ["year", "enddate", "dirname"]:
+			del self.kwargs[key]
+		self.tmp_dir = tempfile.mkdtemp()
+		# generate_file_defs changes the current directory
+		self.current_dir = os.getcwd()
+
+	def tearDown(self):
+		os.chdir(self.current_dir)
+		shutil.rmtree(self.tmp_dir)
+
+	def test_years(self):
+		years = ["1870", "1871"]
+		enddates = ["18710101", "18720101"]
+		context = self.config["contexts"][0]
+		# The selection of the variables depends on the year
+		self.kwargs["select"] = "on_expt_and_year"
+		sweep_dir = os.path.join(self.tmp_dir, "sweep")
+		with contextlib.redirect_stdout(io.StringIO()):
+			rep = generate_file_defs_for_years(self.config["lab_and_model_settings"],
+			                                   self.config["simulation_settings"], years, context,
+			                                   enddates=enddates, dirname=sweep_dir, force_reset=True, **self.kwargs)
+		self.assertListEqual([job["year"] for job in rep], years)
+		for (year, enddate, job) in zip(years, enddates, rep):
+			year_dir = os.path.join(self.tmp_dir, "single", year, "")
+			os.makedirs(year_dir)
+			with contextlib.redirect_stdout(io.StringIO()):
+				generate_file_defs(lset=self.config["lab_and_model_settings"],
+				                   sset=self.config["simulation_settings"], year=year, enddate=enddate,
+				                   context=context, dirname=year_dir, force_reset=True,
+				                   generation_context=GenerationContext(), **self.kwargs)
+			filename = "dr2xml_%s.xml" % context
+			self.assertEqual(job["filename"], os.path.join(job["dirname"], filename))
+			self.assertEqual(read_output(job["filename"], job["dirname"]),
+			                 read_output(os.path.join(year_dir, filename), year_dir))
+
+	def test_contexts(self):
+		contexts = self.config["contexts"]
+		outputs = list()
+		for nb_processes in [1, 2]:
+			dirname = os.path.join(self.tmp_dir, "processes_%d" % nb_processes, "")
+			os.makedirs(dirname)
+			generation_context = GenerationContext()
+			with contextlib.redirect_stdout(io.StringIO()) as printouts:
+				rep = generate_file_defs_for_contexts(self.config["lab_and_model_settings"],
+				                                      self.config["simulation_settings"], contexts,
+				                                      self.config["config"]["year"], self.config["config"]["enddate"],
+				                                      dirname=dirname, nb_processes=nb_processes, force_reset=True,
+				                                      generation_context=generation_context, **self.kwargs)
+			self.assertListEqual([job["context"] for job in rep], contexts)
+			# The printouts of the jobs are printed in their order, after the ones of the initialization
+			self.assertTrue(printouts.getvalue().endswith("".join(job["output"] for job in rep)))
+			for job in rep:
+				self.assertEqual(job["year"], self.config["config"]["year"])
+				self.assertEqual(job["dirname"], dirname)
+				self.assertEqual(job["filename"], os.path.join(dirname, "dr2xml_%s.xml" % job["context"]))
+				self.assertTrue(os.path.isfile(job["filename"]))
+			outputs.append([read_output(job["filename"], dirname) for job in rep])
+			# The settings are loaded in the generation context given, not in the state of the process
+			with generation_context:
+				self.assertIsNotNone(get_settings_values("internal_values"))
+		self.assertListEqual(outputs[0], outputs[1])
+
+	def test_reused_workers(self):
+		# More jobs than processes, in contexts which number their axes
+		config = create_config_elements(
+			simulation="AOESM_1pctCO2_rad_CM6_r1",
+			contexts=["nemo", "surfex"],
+			year="1850",
+			enddate="19891231",
+			pingfiles="{path_xml}/ping_surfex.xml {path_xml}/ping_nemo.xml {path_xml}/ping_nemo_gelato.xml "
+			          "{path_xml}/ping_nemo_ocnBgChem.xml {path_xml}/ping_trip.xml",
+			attributes=[('EXPID', 'CNRM-ESM2-1_1pctCO2-rad_r1i1p1f2'),
+			            ('CMIP6_CV_version', 'cv=6.2.3.0-7-g2019642'),
+			            ('dr2xml_md5sum', '7040f60f6bf3118dc6c58b9fb8727d87')]
+		)
+		kwargs = copy.deepcopy(config["config"])
+		for key in ["year", "enddate", "dirname"]:
+			del kwargs[key]
+		years = ["1850", "1851"]
+		outputs = list()
+		for nb_processes in [1, 2]:
+			dirname = os.path.join(self.tmp_dir, "processes_%d" % nb_processes, "")
+			with contextlib.redirect_stdout(io.StringIO()):
+				rep = generate_file_defs_for_contexts(config["lab_and_model_settings"], config["simulation_settings"],
+				                                      config["contexts"], None, None, years=years,
+				                                      dirname=dirname, nb_processes=nb_processes, force_reset=True,
+				                                      generation_context=GenerationContext(), **kwargs)
+			self.assertEqual(len(rep), 4)
+			outputs.append([read_output(job["filename"], dirname) for job in rep])
+		self.assertIn("ref_to_", outputs[0][0])
+		self.assertListEqual(outputs[0], outputs[1])
+
+
+if __name__ == '__main__':
+	unittest.main()
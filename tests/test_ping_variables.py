@@ -0,0 +1,52 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Tests the registries of the ping variables.
+"""
+from __future__ import division, print_function, unicode_literals, absolute_import
+
+import copy
+import pickle
+import unittest
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dr2xml.config import PingVariables
+
+
+class TestPingVariables(unittest.TestCase):
+
+	def test_list_interface(self):
+		pingvars = PingVariables(["CMIP6_tas", "CMIP6_pr"])
+		pingvars.append("CMIP6_tas")
+		pingvars.extend(["CMIP6_ps", ])
+		pingvars += ["CMIP6_ua", ]
+		pingvars.insert(0, "CMIP6_va")
+		self.assertEqual(pingvars, ["CMIP6_va", "CMIP6_tas", "CMIP6_pr", "CMIP6_tas", "CMIP6_ps", "CMIP6_ua"])
+		self.assertEqual(pingvars.count("CMIP6_tas"), 2)
+		pingvars.remove("CMIP6_tas")
+		self.assertIn("CMIP6_tas", pingvars)
+		pingvars.remove("CMIP6_tas")
+		self.assertNotIn("CMIP6_tas", pingvars)
+		self.assertEqual(pingvars.pop(), "CMIP6_ua")
+		self.assertNotIn("CMIP6_ua", pingvars)
+		pingvars[0] = "CMIP6_zg"
+		self.assertNotIn("CMIP6_va", pingvars)
+		self.assertIn("CMIP6_zg", pingvars)
+		del pingvars[1:]
+		self.assertEqual(pingvars, ["CMIP6_zg", ])
+		self.assertNotIn("CMIP6_ps", pingvars)
+		self.assertNotIn(["unhashable", ], pingvars)
+		for other in [copy.copy(pingvars), copy.deepcopy(pingvars), pickle.loads(pickle.dumps(pingvars))]:
+			self.assertIsInstance(other, PingVariables)
+			self.assertEqual(other, pingvars)
+			self.assertEqual(other.count("CMIP6_zg"), 1)
+		pingvars.clear()
+		self.assertNotIn("CMIP6_zg", pingvars)
+
+
+if __name__ == '__main__':
+	unittest.main()
@@ -16,6 +16,9 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from dr2xml.config import initialize_config_variables
 from dr2xml.settings_interface import initialize_settings, get_settings_values
+from dr2xml.settings_interface.py_project_interface import solve_values
+from dr2xml.projects.projects_interface_definitions import ParameterSettings, ValueSettings, CaseSettings, \
+	ConditionSettings
 
 
 class TestProjectSettings(unittest.TestCase):
@@ -172,3 +175,25 @@ class TestProjectSettings(unittest.TestCase):
 		              'year': 0}
 		self.assertDictEqual(common, ref_common)
 
+	def test_cycle_in_unused_case(self):
+		# Values a and b depend on each other, but only through a case of a which is not used
+		internal_values = dict(
+			mode=ParameterSettings(key="mode", default_values=["simple", ]),
+			a=ParameterSettings(key="a", cases=[
+				CaseSettings(conditions=[ConditionSettings(check_value=ValueSettings(key_type="internal", keys="mode"),
+				                                           check_to_do="eq", reference_values="complex")],
+				             value=ValueSettings(key_type="internal", keys="b")),
+				CaseSettings(conditions=True, value="a value")
+			]),
+			b=ParameterSettings(key="b", default_values=[ValueSettings(key_type="internal", keys="a")]),
+			c=ParameterSettings(key="c", default_values=[ValueSettings(key_type="internal", keys="b")])
+		)
+		self.assertDictEqual(solve_values("internal", internal_dict=internal_values),
+		                     dict(mode="simple", a="a value", b="a value", c="a value"))
+		# Values in a cycle which can not be evaluated
+		internal_values = dict(
+			a=ParameterSettings(key="a", fatal=True, default_values=[ValueSettings(key_type="internal", keys="b")]),
+			b=ParameterSettings(key="b", default_values=[ValueSettings(key_type="internal", keys="a")])
+		)
+		with self.assertRaises(ValueError):
+			solve_values("internal", internal_dict=internal_values)
@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Tests the index of the requestItems applying to an experiment.
+"""
+from __future__ import division, print_function, unicode_literals, absolute_import
+
+import unittest
+import sys
+import os
+from types import SimpleNamespace
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dr2xml import configuration_init
+from dr2xml.config import GenerationContext
+from tests.tools_for_tests import create_config_elements
+
+
+@configuration_init
+def get_data_request_class(context, year, dirname):
+	# The Data Request interface can only be imported once the settings are initialized
+	from dr2xml.dr_interface.CMIP6 import DataRequest
+	return DataRequest
+
+
+def create_data_request():
+	config = create_config_elements(simulation="amip_hist_AGCM_1870_r10", contexts=["surfex", ])
+	data_request_class = get_data_request_class(lset=config["lab_and_model_settings"],
+	                                            sset=config["simulation_settings"],
+	                                            cvs_path=config["config"]["cvs_path"], force_reset=True,
+	                                            generation_context=GenerationContext(), context=config["contexts"][0],
+	                                            year=config["config"]["year"], dirname=config["config"]["dirname"])
+
+	class DataRequestWithIntervals(data_request_class):
+
+		def get_requestitem_years_intervals(self, ri, exp, branching=dict(), branch_year_in_child=None):
+			if ri.uid in ["ri_wrong_years", ]:
+				raise ValueError("Wrong time slice for %s" % ri.uid)
+			return [(1850, 1859, 1859), ]
+
+	experiment = SimpleNamespace(uid="exp", label="historical", _h=SimpleNamespace(label="experiment"))
+	requestitems = [SimpleNamespace(uid=uid, esid=esid, title=uid, nenmax=-1)
+	                for (uid, esid) in [("ri_ok", "exp"), ("ri_wrong_years", "exp"),
+	                                    ("ri_wrong_experiment", "missing_exp")]]
+	uids = dict(exp=experiment)
+	uids.update(dict((ri.uid, ri) for ri in requestitems))
+	data_request = SimpleNamespace(coll=dict(requestItem=SimpleNamespace(items=requestitems)),
+	                               inx=SimpleNamespace(uid=uids))
+	return DataRequestWithIntervals(data_request=data_request)
+
+
+class TestRequestItemsIndex(unittest.TestCase):
+
+	def setUp(self):
+		self.data_request = create_data_request()
+
+	def check(self, ri_id, year):
+		return self.data_request.check_requestitem_for_exp_and_year(self.data_request.get_element_uid(ri_id),
+		                                                            "historical", year)
+
+	def test_applicable(self):
+		self.assertEqual(self.check("ri_ok", None), (True, None))
+		self.assertEqual(self.check("ri_ok", "1855"), (True, 1859))
+		self.assertEqual(self.check("ri_ok", "1860"), (False, None))
+
+	def test_years_error(self):
+		# The years of the requestItem are not needed if no year is given
+		self.assertEqual(self.check("ri_wrong_years", None), (True, None))
+		with self.assertRaises(ValueError):
+			self.check("ri_wrong_years", "1855")
+
+	def test_experiment_error(self):
+		# The experiment of the requestItem is needed whatever the year
+		with self.assertRaises(AttributeError):
+			self.check("ri_wrong_experiment", None)
+		with self.assertRaises(AttributeError):
+			self.check("ri_wrong_experiment", "1855")
+
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Tests variables selection tools.
+"""
+from __future__ import division, print_function, unicode_literals, absolute_import
+
+import copy
+import importlib
+import unittest
+from collections import defaultdict
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dr2xml import configuration_init
+from dr2xml.config import GenerationContext
+from dr2xml.dr_interface.definition import SimpleCMORVar
+from dr2xml.vars_interface import selection
+
+
+def reference_group_variables_per_realm(mip_vars_list, allow_duplicates=False):
+	"""
+	Historical (quadratic) implementation of the grouping of variables per realm.
+	"""
+	svars_per_realm = defaultdict(list)
+	for svar in mip_vars_list:
+		realm = svar.modeling_realm
+		if svar not in svars_per_realm[realm]:
+			add = not any([selection.test_variables_similar(svar, ovar) for ovar in svars_per_realm[realm]])
+			if allow_duplicates or add:
+				svars_per_realm[realm].append(svar)
+	return svars_per_realm
+
+
+@configuration_init
+def gather_variables(context, year, dirname, select="on_expt_and_year"):
+	return selection.gather_AllSimpleVars(year, select)
+
+
+class TestSelection(unittest.TestCase):
+
+	def check_grouping(self, mip_vars_list):
+		for allow_duplicates in [False, True]:
+			svars_per_realm = selection.group_variables_per_realm(mip_vars_list, allow_duplicates)
+			reference_svars_per_realm = reference_group_variables_per_realm(mip_vars_list, allow_duplicates)
+			self.assertEqual(list(svars_per_realm), list(reference_svars_per_realm))
+			for realm in reference_svars_per_realm:
+				self.assertEqual([id(svar) for svar in svars_per_realm[realm]],
+				                 [id(svar) for svar in reference_svars_per_realm[realm]])
+
+	def test_synthetic_variables(self):
+		mip_vars_list = list()
+		for (label, realm, table, frequency, cell_methods) in [
+			("tas", "atmos", "Amon", "mon", "time: mean"), ("tas", "atmos", "Amon", "mon", "time: mean"),
+			("tas", "atmos", "ImonAnt", "mon", "time: mean"), ("tas", "atmos", "day", "day", "time: mean"),
+			("tas", "land", "Lmon", "mon", "time: mean"), ("tas", "atmos", "Amon", "mon", "time: max"),
+			("ps", "atmos", "AERmon", "mon", "time: mean"), ("ps", "atmos", "Amon", "mon", "time: mean")
+		]:
+			mip_vars_list.append(SimpleCMORVar(label=label, modeling_realm=realm, mipTable=table, frequency=frequency,
+			                                   cell_methods=cell_methods, spatial_shp="XY-na", temporal_shp="time-mean"))
+		self.check_grouping(mip_vars_list)
+		svars_per_realm = selection.group_variables_per_realm(mip_vars_list)
+		self.assertEqual([(svar.label, svar.mipTable) for svar in svars_per_realm["atmos"]],
+		                 [("tas", "Amon"), ("tas", "day"), ("ps", "AERmon")])
+
+	def test_simulations_variables(self):
+		for simulation in ["AOESM_1pctCO2_rad_CM6_r1", "RCSM6_HIS_light", "amip_ESM"]:
+			module = importlib.import_module("tests.test_" + simulation)
+			test_class = [cls for cls in vars(module).values() if isinstance(cls, type) and
+			              issubclass(cls, unittest.TestCase) and cls.__module__ == module.__name__][0]
+			test = test_class("test_simulation")
+			test.setUp()
+			mip_vars_list = gather_variables(lset=test.lab_and_model_settings, sset=test.simulation_settings,
+			                                 cvs_path=test.config.get("cvs_path"), force_reset=True,
+			                                 generation_context=GenerationContext(), context=test.contexts[0],
+			                                 year=test.config["year"], dirname=test.config["dirname"])
+			self.assertGreater(len(mip_vars_list), 0)
+			self.check_grouping(mip_vars_list)
+
+
+if __name__ == '__main__':
+	unittest.main()
@@ -7,11 +7,14 @@ Tests for xml_writer module
 
 from __future__ import division, print_function, unicode_literals, absolute_import
 
+import io
 import unittest
 from collections import OrderedDict
 from copy import copy
 import sys
 import os
+import shutil
+import tempfile
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
@@ -23,7 +26,7 @@ from xml_writer.header import _find_xml_header, Header
 from xml_writer.beacon import Beacon
 from xml_writer.utils import _build_dict_attrib, _find_text, iterate_on_string
 from xml_writer.parser import generate_xml_tree_from_list, find_next_element, generate_list_from_xml_string, \
-    parse_xml_string_rewrite, _find_one_part_element
+    parse_xml_string_rewrite, _find_one_part_element, xml_file_parser, clear_xml_files_cache
 
 
 class TestNonSpecificMethods(unittest.TestCase):
@@ -103,7 +106,10 @@ class TestNonSpecificMethods(unittest.TestCase):
 
         :return:
         """
-        an_other_beacon = Beacon()
+        class BeaconWithAttributes(Beacon):
+            pass
+
+        an_other_beacon = BeaconWithAttributes()
         an_other_beacon.update_level(5)
         an_other_beacon.an_attrib = "my_attrib"
         self.assertFalse(an_other_beacon._test_attribute_equality("level", self.my_beacon))
@@ -506,6 +512,22 @@ class TestElement(unittest.TestCase):
                          '<an other tag an_other_key="a value" a_key="5">\tsome text\n\t<!--a comment-->\n\t'
                          '<some tag an_other_key="a value" a_key="5"/>\n</an other tag>')
 
+    def test_write(self):
+        """
+
+        :return:
+        """
+        # Test write
+        a_parent = Element("a parent", attrib=OrderedDict(a_key="a value"))
+        a_parent.append(Element("a child"))
+        a_parent.append(self.my_other_element)
+        a_parent.append(Element("an empty child", text="a text"))
+        for an_element in [Element("a tag"), Element("a tag", text="a text"), self.my_element,
+                           self.my_other_element, a_parent]:
+            stream = io.StringIO()
+            an_element.write(stream)
+            self.assertEqual(stream.getvalue(), an_element.dump())
+
     def test_copy(self):
         """
 
@@ -588,6 +610,37 @@ class TestElement(unittest.TestCase):
         self.assertEqual(self.my_other_element.level, 0)
         for elt in self.my_other_element.children:
             self.assertEqual(elt.level, 1)
+        # Test update_level on a deep tree
+        a_root = Element("a root")
+        an_element = a_root
+        for i in range(2000):
+            an_element.append(Element("a child"))
+            an_element = an_element[0]
+        a_root.update_level(3)
+        self.assertEqual(an_element.level, 2003)
+
+    def test_get_attrib(self):
+        """
+
+        :return:
+        """
+        # Test get_attrib
+        a_root = Element("a root", attrib=OrderedDict(a_key="a value", an_other_key="an other value"))
+        a_parent = Element("a parent", attrib=OrderedDict(a_key="a parent value"))
+        an_element = Element("an element", attrib=OrderedDict(a_key="an element value"))
+        a_root.append(a_parent)
+        a_parent.append(an_element)
+        self.assertEqual(an_element.get_attrib("a_key"), "an element value")
+        self.assertEqual(an_element.get_attrib("an_other_key"), "an other value")
+        self.assertEqual(an_element.get_attrib("a_key", parent=False), "an element value")
+        del an_element.attrib["a_key"]
+        self.assertEqual(an_element.get_attrib("a_key", parent="single"), "a parent value")
+        with self.assertRaises(KeyError):
+            an_element.get_attrib("an_other_key", parent="single")
+        with self.assertRaises(KeyError):
+            an_element.get_attrib("a_key", parent=False)
+        self.assertEqual(an_element.get_attrib("a_key", parent=False, use_default=True, default=5), 5)
+        self.assertIsNone(an_element.get_attrib("a third key", use_default=True))
 
     def test_dump_children(self):
         """
@@ -1169,5 +1222,91 @@ class TestParser(unittest.TestCase):
         self.assertListEqual(test_3[4], list())
 
 
+class TestXMLFileParserCache(unittest.TestCase):
+    """
+    Test the cache of the xml files already parsed.
+    """
+
+    def setUp(self):
+        """
+
+        :return:
+        """
+        clear_xml_files_cache()
+        self.tmp_dir = tempfile.mkdtemp()
+        self.main_file = os.sep.join([self.tmp_dir, "main.xml"])
+        self.included_file = os.sep.join([self.tmp_dir, "included.xml"])
+        self.write_file(self.main_file, '<context id="main"> <field_definition src="included.xml"/> </context>')
+        self.write_file(self.included_file, '<field_definition> <field id="a"/> </field_definition>')
+
+    def tearDown(self):
+        """
+
+        :return:
+        """
+        clear_xml_files_cache()
+        shutil.rmtree(self.tmp_dir)
+
+    @staticmethod
+    def write_file(filename, content):
+        """
+
+        :param filename:
+        :param content:
+        :return:
+        """
+        with open(filename, "w") as opened_file:
+            opened_file.write(content)
+
+    def parse_main_file(self):
+        """
+
+        :return:
+        """
+        _, _, _, root = xml_file_parser(self.main_file, follow_src=True, path_parse=self.tmp_dir)
+        return root
+
+    def test_copies(self):
+        """
+
+        :return:
+        """
+        root_1 = self.parse_main_file()
+        self.assertEqual(len(root_1[0]), 1)
+        root_1[0].remove(root_1[0][0])
+        root_1.attrib["id"] = "modified"
+        root_2 = self.parse_main_file()
+        self.assertEqual(len(root_2[0]), 1)
+        self.assertEqual(root_2.attrib["id"], "main")
+
+    def test_included_file_modified(self):
+        """
+
+        :return:
+        """
+        root_1 = self.parse_main_file()
+        self.assertListEqual([child.attrib["id"] for child in root_1[0]], ["a", ])
+        self.write_file(self.included_file, '<field_definition> <field id="a"/> <field id="bb"/> </field_definition>')
+        root_2 = self.parse_main_file()
+        self.assertListEqual([child.attrib["id"] for child in root_2[0]], ["a", "bb"])
+
+    def test_relative_path_parse(self):
+        """
+
+        :return:
+        """
+        current_dir = os.getcwd()
+        try:
+            for (directory, field_id) in [("a_dir", "a"), ("an_other_dir", "bb")]:
+                os.makedirs(os.sep.join([self.tmp_dir, directory, "sub"]))
+                self.write_file(os.sep.join([self.tmp_dir, directory, "sub", "included.xml"]),
+                                '<field_definition> <field id="%s"/> </field_definition>' % field_id)
+                os.chdir(os.sep.join([self.tmp_dir, directory]))
+                _, _, _, root = xml_file_parser(self.main_file, follow_src=True, path_parse="sub")
+                self.assertListEqual([child.attrib["id"] for child in root[0]], [field_id, ])
+        finally:
+            os.chdir(current_dir)
+
+
 if __name__ == '__main__':
     unittest.main()
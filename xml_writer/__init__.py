@@ -13,7 +13,7 @@ from .beacon import Beacon
 from .element import Element
 from .header import Header
 from .comment import Comment
-from .parser import xml_file_parser, parse_xml_string_rewrite
+from .parser import xml_file_parser, parse_xml_string_rewrite, get_xml_files_read
 from .utils import encode_if_needed, decode_if_needed
 
 if __name__ == "__main__":
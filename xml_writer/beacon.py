@@ -9,11 +9,15 @@ from __future__ import print_function, division, absolute_import, unicode_litera
 
 from collections import OrderedDict
 
+from .utils import decode_if_needed
+
 
 class Beacon(object):
     """
     Generic class to deal with XML beacons.
     """
+    __slots__ = ("tag", "level", "parent")
+
     def __init__(self):
         """
 
@@ -102,6 +106,15 @@ class Beacon(object):
         """
         raise NotImplementedError()
 
+    def write(self, stream):
+        """
+        Write the xml representation of the object into a stream, such as an opened file.
+
+        :param stream: stream to write into
+        :return:
+        """
+        stream.write(decode_if_needed(self.dump()))
+
     @staticmethod
     def _test_dict_equality(a_dict, an_other_dict):
         """
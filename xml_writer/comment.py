@@ -17,6 +17,8 @@ class Comment(Beacon):
     """
 
     """
+    __slots__ = ("comment", )
+
     def __init__(self, comment):
         """
 
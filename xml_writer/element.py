@@ -8,7 +8,7 @@ Elements
 from __future__ import print_function, division, absolute_import, unicode_literals
 
 from collections import OrderedDict
-from copy import deepcopy, copy
+from copy import copy
 
 from .beacon import Beacon
 from .utils import encode_if_needed, decode_if_needed
@@ -17,7 +17,12 @@ from .utils import encode_if_needed, decode_if_needed
 class Element(Beacon):
     """
     Class to deal with xml elements.
+    The attributes are stored in a shallow copy, as a dict (which keeps the order of the keys), of the dictionary given:
+    their values are strings (or other immutable objects), which are shared with the dictionary given and with the
+    copies of the element.
     """
+    __slots__ = ("text", "attrib", "children")
+
     def __init__(self, tag, text=None, attrib=OrderedDict()):
         """
 
@@ -28,7 +33,7 @@ class Element(Beacon):
         super(Element, self).__init__()
         self.tag = tag.strip()
         self.text = text
-        self.attrib = deepcopy(attrib)
+        self.attrib = dict(attrib)
         self.children = list()
 
     def __eq__(self, other):
@@ -60,7 +65,7 @@ class Element(Beacon):
 
         :return:
         """
-        element = type(self).__call__(tag=self.tag, text=self.text, attrib=deepcopy(self.attrib))
+        element = type(self).__call__(tag=self.tag, text=self.text, attrib=self.attrib)
         element.update_level(self.level)
         for child in self.children:
             element.children.append(copy(child))
@@ -95,6 +100,34 @@ class Element(Beacon):
             rep = "{}<{}>{}</{}>".format(offset, header, content, self.tag)
         return encode_if_needed(rep)
 
+    def write(self, stream):
+        """
+        Write the xml representation of the element into a stream, such as an opened file, the same way as dump does
+        but without building the representation of the whole element: the children are written one after the other.
+
+        :param stream: stream to write into
+        :return:
+        """
+        if len(self) == 0:
+            stream.write(decode_if_needed(self.dump()))
+        else:
+            offset = "\t" * self.level
+            # Deal with header
+            if len(self.attrib) > 0:
+                header = " ".join([self.tag, self._dump_attrib()])
+            else:
+                header = self.tag
+            if self.text is None:
+                stream.write("{}<{}>\n".format(offset, header))
+            else:
+                stream.write("{}<{}>{}\t{}\n".format(offset, header, offset, self.text))
+            # Deal with children
+            for (rank, child) in enumerate(self.children):
+                if rank > 0:
+                    stream.write("\n")
+                child.write(stream)
+            stream.write("\n{}</{}>".format(offset, self.tag))
+
     def set_text(self, text):
         """
 
@@ -212,10 +245,12 @@ class Element(Beacon):
         :param new_level:
         :return:
         """
-        super(Element, self).update_level(new_level)
-        if len(self.children) > 0:
-            for i in range(len(self.children)):
-                self.children[i].update_level(new_level + 1)
+        elements_to_update = [(self, new_level), ]
+        while len(elements_to_update) > 0:
+            element, level = elements_to_update.pop()
+            element.level = level
+            if isinstance(element, Element):
+                elements_to_update.extend([(child, level + 1) for child in element.children])
 
     def _dump_children(self):
         """
@@ -233,16 +268,34 @@ class Element(Beacon):
         :param sort:
         :return:
         """
-        return self.dump_dict(deepcopy(self.attrib), sort=sort)
+        return self.dump_dict(self.attrib, sort=sort)
 
     def get_attrib(self, key, parent=True, use_default=False, default=None):
-        if key in self.attrib:
-            return self.attrib[key]
-        elif parent is True and self.parent is not None:
-            return self.parent.get_attrib(key, parent=parent, use_default=use_default, default=default)
-        elif parent in ["single", ] and self.parent is not None:
-            return self.parent.get_attrib(key, parent=False, use_default=use_default, default=default)
-        elif use_default:
+        """
+        Look for the value of an attribute in the element and, if needed, in its parents.
+
+        :param key: name of the attribute
+        :param parent: if True, look in all the parents, if "single", look only in the direct parent
+        :param use_default: if True, return default if the attribute is not found
+        :param default: value returned if the attribute is not found and use_default is True
+        :return: the value of the attribute
+        """
+        if parent is True:
+            nb_parents = None
+        elif parent in ["single", ]:
+            nb_parents = 1
+        else:
+            nb_parents = 0
+        element = self
+        while element is not None:
+            if key in element.attrib:
+                return element.attrib[key]
+            elif nb_parents is not None:
+                if nb_parents == 0:
+                    break
+                nb_parents -= 1
+            element = element.parent
+        if use_default:
             return default
         else:
             raise KeyError("Could not find a value for attribute %s" % key)
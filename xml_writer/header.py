@@ -19,6 +19,8 @@ class Header(Beacon):
     """
     Class to deal with xml header.
     """
+    __slots__ = ("attrib", )
+
     def __init__(self, tag, attrib=OrderedDict()):
         """
         
@@ -9,17 +9,132 @@ from __future__ import print_function, division, absolute_import, unicode_litera
 
 import os
 import re
+from collections import OrderedDict
+from copy import copy
 from io import open
 
 from .element import Element
 from .comment import _find_xml_comment
 from .header import _find_xml_header
 from .pre_treatment import _pre_xml_string_format
-from .utils import _find_text, print_if_needed, iterate_on_string, _generic_dict_regexp, _build_dict_attrib
+from .utils import _find_text, print_if_needed, _generic_dict_regexp, _build_dict_attrib
+
+
+#: Cache of the xml files already parsed: for each file and parsing options, the list of the files read (the file
+#: itself and its includes) together with their modification time and size, and the result of the parsing.
+_parsed_xml_files_cache = dict()
+#: Stack of the sets of files read by the parsings in progress, used to find the includes of each file
+_parsed_xml_files_stack = list()
+
+
+def clear_xml_files_cache():
+    """
+    Empty the cache of the xml files already parsed.
+    """
+    _parsed_xml_files_cache.clear()
+
+
+def _get_xml_file_stat(xml_file):
+    """
+    Get the information used to check that a file has not changed since it has been parsed.
+
+    :param xml_file: path of the file
+    :return: a tuple (absolute path, modification time, size)
+    """
+    stat = os.stat(xml_file)
+    return os.path.abspath(xml_file), stat.st_mtime_ns, stat.st_size
+
+
+def _is_xml_file_unchanged(file_stat):
+    """
+    Check that a file parsed before has not been modified since.
+
+    :param file_stat: a tuple as returned by _get_xml_file_stat
+    :return: a boolean
+    """
+    try:
+        return _get_xml_file_stat(file_stat[0]) == file_stat
+    except OSError:
+        return False
+
+
+def _copy_parsed_xml_file(texts, comments, headers, root_element):
+    """
+    Copy the result of an xml file parsing so that the cached value could not be modified by the callers.
+    """
+    comments = [copy(comment) for comment in comments]
+    if headers is not None:
+        headers = copy(headers)
+    if root_element is not None:
+        root_element = copy(root_element)
+    return texts, comments, headers, root_element
 
 
 def xml_file_parser(xml_file, verbose=False, follow_src=False, path_parse="./", dont_read=list()):
     """
+    Parse an xml file.
+    Each file is parsed only once per process as long as it and the files it includes are not modified: the following
+    calls return a copy of the cached result (except in verbose mode).
+
+    :param xml_file:
+    :param verbose:
+    :return:
+    """
+    if verbose:
+        return _xml_file_parser(xml_file, verbose=verbose, follow_src=follow_src, path_parse=path_parse,
+                                dont_read=dont_read)
+    file_stat = _get_xml_file_stat(xml_file)
+    key = _get_xml_file_cache_key(xml_file, follow_src, path_parse, dont_read)
+    cached_value = _parsed_xml_files_cache.get(key)
+    if cached_value is not None and file_stat == cached_value[0][0] and \
+            all(_is_xml_file_unchanged(included_file_stat) for included_file_stat in cached_value[0][1:]):
+        files_read, parsed_xml_file = cached_value
+    else:
+        _parsed_xml_files_stack.append([file_stat, ])
+        try:
+            parsed_xml_file = _xml_file_parser(xml_file, verbose=verbose, follow_src=follow_src,
+                                               path_parse=path_parse, dont_read=dont_read)
+        finally:
+            files_read = tuple(OrderedDict.fromkeys(_parsed_xml_files_stack.pop()))
+        _parsed_xml_files_cache[key] = (files_read, parsed_xml_file)
+    if len(_parsed_xml_files_stack) > 0:
+        _parsed_xml_files_stack[-1].extend(files_read)
+    return _copy_parsed_xml_file(*parsed_xml_file)
+
+
+def get_xml_files_read(xml_file, follow_src=False, path_parse="./", dont_read=list()):
+    """
+    Get the files read by the last parsing of an xml file, i.e. the file itself and all the files it includes.
+
+    :param xml_file: the xml file parsed
+    :param follow_src: the value used for the parsing
+    :param path_parse: the value used for the parsing
+    :param dont_read: the value used for the parsing
+    :return: the list of the absolute paths of the files read or None if the file has not been parsed yet
+    """
+    key = _get_xml_file_cache_key(xml_file, follow_src, path_parse, dont_read)
+    if key in _parsed_xml_files_cache:
+        return [file_stat[0] for file_stat in _parsed_xml_files_cache[key][0]]
+    else:
+        return None
+
+
+def _get_xml_file_cache_key(xml_file, follow_src, path_parse, dont_read):
+    """
+    Get the key of an xml file in the cache of the parsed files.
+    The paths are made absolute, as the files included are looked for relatively to path_parse.
+
+    :param xml_file: the xml file parsed
+    :param follow_src: the value used for the parsing
+    :param path_parse: the value used for the parsing
+    :param dont_read: the value used for the parsing
+    :return: the key of the file in the cache
+    """
+    return os.path.abspath(xml_file), follow_src, os.path.abspath(path_parse), tuple(dont_read)
+
+
+def _xml_file_parser(xml_file, verbose=False, follow_src=False, path_parse="./", dont_read=list()):
+    """
 
     :param xml_file:
     :param verbose:
@@ -74,10 +189,21 @@ def generate_list_from_xml_string(xml_string, verbose=False, follow_src=False, p
     level = 0
     tags = list()
     separator = ">"
-    # Loop on substrings of xml_string
-    for (sub_xml_string, pos_init) in iterate_on_string(xml_string, separator=separator, verbose=verbose):
+    xml_string_len = len(xml_string)
+    pos_init = 0
+    # Loop on substrings of xml_string, each ending with the separator: the position in the string is followed instead
+    # of splitting it so that each element is only sliced once.
+    while pos_init < xml_string_len:
+        pos_end = xml_string.find(separator, pos_init)
+        if pos_end < 0:
+            sub_xml_string = xml_string[pos_init:] + separator
+            pos_init = xml_string_len
+        else:
+            sub_xml_string = xml_string[pos_init:pos_end + 1]
+            pos_init = pos_end + 1
         # Take into account what remains from the previous loop if any
-        sub_xml_string = remained_xml_string + sub_xml_string
+        if len(remained_xml_string) > 0:
+            sub_xml_string = remained_xml_string + sub_xml_string
         # Check if some elements could be found there
         elt_found = True
         while len(sub_xml_string) > 0 and elt_found is not None:
@@ -112,13 +238,31 @@ def generate_xml_tree_from_list(list_of_elements, verbose=False):
     :param verbose:
     :return:
     """
+    rank, current_elts, list_of_texts, list_of_comments, list_of_headers = \
+        _generate_xml_tree_from_list(list_of_elements, rank=0, level=0, verbose=verbose)
+    return list_of_elements[rank:], current_elts, list_of_texts, list_of_comments, list_of_headers
+
+
+def _generate_xml_tree_from_list(list_of_elements, rank=0, level=0, verbose=False):
+    """
+    Build the xml tree from the elements of ``list_of_elements`` starting at ``rank``.
+    The list is read but never modified, the rank of the first element not yet treated is returned instead.
+
+    :param list_of_elements: list of the xml elements as built by generate_list_from_xml_string
+    :param rank: rank of the first element to be considered
+    :param level: nested level of the elements to be considered
+    :param verbose: should verbose mode be active?
+    :return: rank, current_elts, list_of_texts, list_of_comments, list_of_headers
+    """
     current_elts = list()
     list_of_texts = list()
     list_of_comments = list()
     list_of_headers = list()
     is_complete = False
-    while len(list_of_elements) > 0 and not is_complete:
-        (level, elt_type, elt) = list_of_elements.pop(0)
+    nb_elements = len(list_of_elements)
+    while rank < nb_elements and not is_complete:
+        (level, elt_type, elt) = list_of_elements[rank]
+        rank += 1
         print_if_needed("<<<generate_xml_tree>>>", level, elt_type, elt, verbose=verbose)
         if elt_type == "text":
             list_of_texts.append(elt)
@@ -135,8 +279,8 @@ def generate_xml_tree_from_list(list_of_elements, verbose=False):
         elif elt_type == "single_part_element":
             current_elts.append(elt)
         elif elt_type == "start_two_parts_element":
-            list_of_elements, child_elts, child_texts, child_comments, child_headers = \
-                generate_xml_tree_from_list(list_of_elements, verbose=verbose)
+            rank, child_elts, child_texts, child_comments, child_headers = \
+                _generate_xml_tree_from_list(list_of_elements, rank=rank, level=level + 1, verbose=verbose)
             elt.extend(child_elts)
             for text in child_texts:
                 elt.set_text(text)
@@ -147,7 +291,7 @@ def generate_xml_tree_from_list(list_of_elements, verbose=False):
             raise Exception("Unknown element type %s" % elt_type)
     if level != 0 and not is_complete:
         raise Exception("There is a problem with the xml tree.")
-    return list_of_elements, current_elts, list_of_texts, list_of_comments, list_of_headers
+    return rank, current_elts, list_of_texts, list_of_comments, list_of_headers
 
 
 def find_next_element(xml_string, level=0, tag=None, verbose=False, follow_src=False, path_parse="./",
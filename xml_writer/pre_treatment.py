@@ -22,28 +22,28 @@ def iterate_on_characters_to_check(xml_string, verbose=False):
     """
     # Find the special characters' positions
     tmp_characters_to_check = list()
-    list_other_greater = list()
-    list_other_lower = list()
+    list_other_greater = set()
+    list_other_lower = set()
     for m in re.compile(r"<\?").finditer(xml_string):
         print_if_needed("Find begin header at pos", m.start(), verbose=verbose)
         tmp_characters_to_check.append((m.start(), "begin_header"))
-        list_other_lower.append(m.start())
+        list_other_lower.add(m.start())
     if len(tmp_characters_to_check) not in [0, 1]:
         raise Exception("There should be only one header at most...")
     for m in re.compile(r"\?>").finditer(xml_string):
         print_if_needed("Find end header at pos", m.start(), verbose=verbose)
         tmp_characters_to_check.append((m.start(), "end_header"))
-        list_other_greater.append(m.start() + 1)
+        list_other_greater.add(m.start() + 1)
     if len(tmp_characters_to_check) not in [0, 2]:
         raise Exception("There should be only one header at most...")
     for m in re.compile(r"<!--").finditer(xml_string):
         print_if_needed("Find begin comment at pos", m.start(), verbose=verbose)
         tmp_characters_to_check.append((m.start(), "begin_comment"))
-        list_other_lower.append(m.start())
+        list_other_lower.add(m.start())
     for m in re.compile(r"-->").finditer(xml_string):
         print_if_needed("Find end comment at pos", m.start(), verbose=verbose)
         tmp_characters_to_check.append((m.start(), "end_comment"))
-        list_other_greater.append(m.start() + 2)
+        list_other_greater.add(m.start() + 2)
     for m in re.compile(r"<").finditer(xml_string):
         if m.start() not in list_other_lower:
             tmp_characters_to_check.append((m.start(), "lower_than"))
@@ -194,18 +194,46 @@ def _pre_xml_string_format(xml_string, verbose=False):
     if is_comment_open or is_header_open or is_double_quote_open or is_single_quote_open or is_beacon_open or \
             is_beacon_ending or nb_beacons_nested > 0:
         raise Exception("There is issues with beacons or quotes opening and ending...")
-    # Replace all that needs to be replaced
-    new_xml_string = xml_string
-    for i in sorted(list(to_replace), reverse=True):
-        new_xml_string = replace_char_at_pos_by_string(new_xml_string, to_replace[i][0],
-                                                       to_replace[i][1], i, i + len(to_replace[i][0]) - 1,
-                                                       verbose=verbose)
+    # Replace all that needs to be replaced in a single pass
+    new_xml_string = replace_chars_at_pos_by_strings(xml_string, to_replace, verbose=verbose)
     # Last statistics and return result
     new_xml_string = new_xml_string.replace("\n", " ")
     new_xml_string = new_xml_string.split(" ")
     return " ".join([m for m in new_xml_string if len(m) > 0])
 
 
+def replace_chars_at_pos_by_strings(complete_string, to_replace, verbose=False):
+    """
+    Replace several substrings of ``complete_string`` at once.
+    Contrary to successive calls to ``replace_char_at_pos_by_string``, the output string is built only once, which
+    keeps the cost linear in the length of the string whatever the number of replacements.
+
+    :param complete_string: the string in which the replacements must be done
+    :param to_replace: dictionary whose keys are the positions of the strings to be replaced and values are couples
+                       (string to be replaced, replacement string)
+    :param verbose: should verbose mode be active?
+    :return: the string with all replacements done
+    """
+    if verbose:
+        print("<<<replace_chars_at_pos_by_strings>>> len of input string", len(complete_string),
+              "number of replacements", len(to_replace))
+    rep = list()
+    pos_current = 0
+    for pos_init in sorted(list(to_replace)):
+        (string_in, replace_out) = to_replace[pos_init]
+        pos_end = pos_init + len(string_in)
+        if pos_init < pos_current or pos_end > len(complete_string):
+            raise Exception("The string to be replaced is not in the complete string")
+        if complete_string[pos_init:pos_end] != string_in:
+            raise Exception("The string to be replaced is not the one present: %s / %s" %
+                            (string_in, complete_string[pos_init:pos_end]))
+        rep.append(complete_string[pos_current:pos_init])
+        rep.append(replace_out)
+        pos_current = pos_end
+    rep.append(complete_string[pos_current:])
+    return "".join(rep)
+
+
 def replace_char_at_pos_by_string(complete_string, string_in, replace_out, pos_init, pos_end, verbose=False):
     """
 